@@ -1,65 +1,180 @@
 from Scopul.MusicalElements import Chord
 from Scopul.scopul_exception import InvalidMusicElementError
-from music21 import roman, analysis
+from Scopul.fast_chordify import sonorities, roman_figure
+from Scopul.RomanCache import ROMAN_CACHE
+from Scopul.key_profiles import estimate_key, transpose_key
+
+
+def _semitones(interval) -> int:
+    """Returns the number of semitones of an interval, given as an int or a music21 interval name ("M2")"""
+    if isinstance(interval, int):
+        return interval
+
+    from music21 import interval as m21_interval
+
+    return m21_interval.Interval(interval).semitones
+
+
 class ChordProgression:
-    """ChordProgression, a class to work with chord progressions for the Scopul class"""
-    def __init__(self, part) -> None:
-        self.music21 = part._part.chordify().recurse().getElementsByClass('Chord')
-        self.roman_chords = []
-        self.key = None
-
-        for chord in self.music21:
-            self.roman_chords.append(roman.romanNumeralFromChord(chord).figure)
-        
-        key = analysis.discrete.analyzeStream(self.music21, 'key')
-        self.key = f"{key.tonic.name, key.mode}"
-        self.chords = [Chord(chord) for chord in self.music21]
+    """ChordProgression, a class to work with chord progressions for the Scopul class
+
+    Roman numerals and Chord objects are kept per chord: an edit only computes them for the chord
+    it adds. The key is analyzed the first time it is read
+    """
+    def __init__(self, part, engine: str = "music21") -> None:
+        if engine == "music21":
+            chords = list(part._part.chordify().recurse().getElementsByClass('Chord'))
+            segments = [None] * len(chords)
+            figures = [self._figure(chord) for chord in chords]
+        elif engine == "fast":
+            segments = sonorities(part.event_table)
+            chords = [None] * len(segments)
+            figures = [roman_figure(pitches) for _, _, pitches in segments]
+        else:
+            raise ValueError(f"engine must be 'music21' or 'fast', instead got {engine}")
+
+        # music21 chords (None until needed for chords found by the fast engine), the (onset,
+        # length, pitches) of the chords found by the fast engine, their roman numeral figures
+        # and their (lazily created) Chord objects
+        self._chords = chords
+        self._segments = segments
+        self.roman_chords = figures
+        self._wrappers = [None] * len(chords)
+        self._stream = None
+        # A music21 Key, or the key str estimated by the fast engine
+        self._key = None
+        self._engine = engine
+
+    @staticmethod
+    def _figure(chord) -> str:
+        """Returns the roman numeral figure of a music21 chord, through the process-wide RomanCache"""
+        return ROMAN_CACHE.figure_of_chord(chord)
+
+    def _chord(self, index: int):
+        """Returns the music21 chord at index, created from its pitches for the fast engine"""
+        if self._chords[index] is None:
+            from music21 import chord
+
+            _, length, pitches = self._segments[index]
+            self._chords[index] = chord.Chord(list(pitches), quarterLength=length)
+        return self._chords[index]
+
+    @property
+    def music21(self):
+        """Returns the chords as a music21 stream, built on first access after an edit"""
+        if self._stream is None:
+            from music21 import stream
+
+            self._stream = stream.Stream()
+            for idx in range(len(self._chords)):
+                self._stream.append(self._chord(idx))
+        return self._stream
+
+    @property
+    def chords(self) -> list:
+        """Returns the chords as a list of Chord objects"""
+        for idx, wrapper in enumerate(self._wrappers):
+            if wrapper is None:
+                if self._chords[idx] is None:
+                    _, length, pitches = self._segments[idx]
+                    self._wrappers[idx] = Chord(pitches=pitches, length=length)
+                else:
+                    self._wrappers[idx] = Chord(self._chords[idx])
+        return list(self._wrappers)
+
+    @property
+    def key(self) -> str:
+        """Returns the key of the progression ("E- major"), analyzed on first access after an edit
+
+        The fast engine estimates it from the pitch classes of the chords, weighted by duration
+        (see Scopul.get_key()), music21 analyzes the chord stream
+        """
+        if not self._chords:
+            return None
+
+        if self._key is None:
+            if self._engine == "fast":
+                import numpy as np
+
+                weights = np.zeros(12)
+                for idx, chord in enumerate(self._chords):
+                    if chord is None:
+                        _, length, pitches = self._segments[idx]
+                        pitch_classes = {pitch % 12 for pitch in pitches}
+                    else:
+                        length = chord.duration.quarterLength
+                        pitch_classes = {pitch.pitchClass for pitch in chord.pitches}
+                    for pitch_class in pitch_classes:
+                        weights[pitch_class] += length
+                self._key = estimate_key(weights)[0]
+            else:
+                from music21 import analysis
+
+                self._key = analysis.discrete.analyzeStream(self.music21, 'key')
+
+        if isinstance(self._key, str):
+            return self._key
+        return f"{self._key.tonic.name} {self._key.mode}"
 
     @property
     def length(self):
         return len(self.roman_chords)
-    
+
     def transpose(self, key: str):
         """Changes the chords to the specified interval/key
+
+            The chords are transposed in place. Roman numerals do not change, and an analyzed key is
+            transposed with them instead of being analyzed again
             - Args:
                 - interval: an int or a str, depending on your needs
             - Returns:
                 - None
         """
-        self.music21 = self.music21.transpose(key)
-        self._update()
-    
-    def append(self, chord: Chord):
-        if not isinstance(chord, Chord):
-            return InvalidMusicElementError(f"type {type(chord)} is not a Scopul musical element")
-        self.music21.append(chord.music21)
-        self._update()
-
-    def insert(self, index: int, chord: Chord):
-        self.music21.insert(index, chord.music21)
-        self._update()
-
-    def delete(self, index:int):
-        self.music21.remove(index)
-        self._update()
-    
-    def _update(self):
-        self.roman_chords = []
-        self.key = None
-
-        for chord in self.music21:
-            self.roman_chords.append(roman.romanNumeralFromChord(chord).figure)
-        
-        key = analysis.discrete.analyzeStream(self.music21, 'key')
-        self.key = f"{key.tonic.name, key.mode}"
-        self.chords = [Chord(chord) for chord in self.music21]
-    
+        semitones = None
+        for idx, chord in enumerate(self._chords):
+            if chord is not None:
+                chord.transpose(key, inPlace=True)
+            else:
+                # Chords of the fast engine that were never built only have their pitches shifted
+                if semitones is None:
+                    semitones = _semitones(key)
+                onset, length, pitches = self._segments[idx]
+                self._segments[idx] = (onset, length, tuple(pitch + semitones for pitch in pitches))
 
+        # The Chord objects cache their notes
+        self._wrappers = [None] * len(self._chords)
+        if isinstance(self._key, str):
+            self._key = transpose_key(self._key, _semitones(key))
+        elif self._key is not None:
+            self._key = self._key.transpose(key)
 
+    def append(self, chord: Chord):
+        if not isinstance(chord, Chord):
+            raise InvalidMusicElementError(f"type {type(chord)} is not a Scopul musical element")
 
-    
-    
-    
+        self._chords.append(chord.music21)
+        self._segments.append(None)
+        self.roman_chords.append(self._figure(chord.music21))
+        self._wrappers.append(chord)
+        if self._stream is not None:
+            self._stream.append(chord.music21)
+        self._key = None
 
+    def insert(self, index: int, chord: Chord):
+        if not isinstance(chord, Chord):
+            raise InvalidMusicElementError(f"type {type(chord)} is not a Scopul musical element")
 
+        self._chords.insert(index, chord.music21)
+        self._segments.insert(index, None)
+        self.roman_chords.insert(index, self._figure(chord.music21))
+        self._wrappers.insert(index, chord)
+        self._stream = None
+        self._key = None
 
+    def delete(self, index:int):
+        self._chords.pop(index)
+        self._segments.pop(index)
+        self.roman_chords.pop(index)
+        self._wrappers.pop(index)
+        self._stream = None
+        self._key = None
@@ -0,0 +1,365 @@
+import json
+import mmap
+import struct
+from itertools import repeat
+from Scopul.corpus import process_pool
+from Scopul.EventTable import REST
+from Scopul.RhythmSearch import RhythmSearch, parse_rhythm
+
+MAGIC = b"SCOPIDX\0"
+FORMAT_VERSION = 1
+
+# Columns of the postings: gram, file id, part id, position in the stream (events or melody), index in Part.sequence
+POSTING_DTYPES = ("<u8", "<u4", "<u4", "<u4", "<u4")
+
+# magic, format version, rhythm n, interval n, metadata length, rhythm posting count, interval posting count
+HEADER = struct.Struct("<8sHHHxxQQQ")
+
+# Rhythm grams hold 4 quarter lengths of 16 bits, interval grams up to 8 intervals of 8 bits.
+# Codes start at 1, 0 pads the grams at the end of a part so short queries still find them
+QL_BITS = 16
+QL_RESOLUTION = 48
+INTERVAL_BITS = 8
+MAX_RHYTHM_N = 64 // QL_BITS
+MAX_INTERVAL_N = 64 // INTERVAL_BITS
+
+
+def _align(offset: int) -> int:
+    """Rounds an offset up to a multiple of 8"""
+    return (offset + 7) & ~7
+
+
+def rhythm_codes(lengths):
+    """Returns the 16 bit codes of quarter lengths, as a numpy array"""
+    import numpy as np
+
+    codes = np.rint(np.asarray(lengths, dtype=np.float64) * QL_RESOLUTION) + 1
+    return np.clip(codes, 1, 2**QL_BITS - 1).astype(np.uint64)
+
+
+def interval_codes(intervals):
+    """Returns the 8 bit codes of intervals (in semitones), as a numpy array"""
+    import numpy as np
+
+    codes = np.clip(np.asarray(intervals, dtype=np.int64), -127, 127) + 128
+    return codes.astype(np.uint64)
+
+
+def pack_grams(codes, n: int, bits: int):
+    """Packs the n-gram starting at every position of codes into one integer, first code in the high bits
+
+    Grams running past the end are padded with 0
+    """
+    import numpy as np
+
+    padded = np.concatenate([codes, np.zeros(n - 1, dtype=np.uint64)])
+    grams = np.zeros(len(codes), dtype=np.uint64)
+    for pos in range(n):
+        grams |= padded[pos : pos + len(codes)] << np.uint64(bits * (n - 1 - pos))
+    return grams
+
+
+def melody(table) -> tuple:
+    """Returns the melody of a part: the highest pitch of every note or chord, and its index in Part.sequence"""
+    import numpy as np
+
+    if len(table) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    starts = np.asarray(table.starts, dtype=np.intp)
+    pitch = np.asarray(table.pitch, dtype=np.int64)
+    kind = np.asarray(table.kind, dtype=np.int8)
+
+    highest = np.maximum.reduceat(pitch, starts)
+    pitched = np.flatnonzero(kind[starts] != REST)
+    return highest[pitched], pitched
+
+
+def part_grams(table, rhythm_n: int, interval_n: int) -> tuple:
+    """Computes the rhythm and interval grams of a part
+
+    Returns:
+        A tuple (rhythm grams, interval grams, interval events), rhythm grams start at every event,
+        interval grams at every note of the melody, whose indices in Part.sequence are interval events
+    """
+    rhythm = pack_grams(rhythm_codes(table.event_lengths()), rhythm_n, QL_BITS)
+
+    pitches, indices = melody(table)
+    intervals = pack_grams(interval_codes(pitches[1:] - pitches[:-1]), interval_n, INTERVAL_BITS)
+    return rhythm, intervals, indices[: len(intervals)]
+
+
+def _source_grams(source, engine: str, rhythm_n: int, interval_n: int) -> tuple:
+    """Loads a source (a Scopul object or a path) and computes the grams of its parts"""
+    from Scopul.scopul import Scopul
+
+    scop = source if isinstance(source, Scopul) else Scopul(source, engine=engine)
+    return scop.path, [part_grams(part.event_table, rhythm_n, interval_n) for part in scop.parts]
+
+
+class CorpusIndex:
+    """An inverted n-gram index of the rhythms and melodic intervals of many MIDI files
+
+    The index is built once with CorpusIndex.build() and saved to disk. Opening it memory-maps the file,
+    so queries only read the postings they need
+
+    Args:
+        path: path to an index written by CorpusIndex.build()
+    """
+
+    def __init__(self, path) -> None:
+        import numpy as np
+
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.rhythm_n, self.interval_n, meta_length, rhythm_count, interval_count = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a Scopul corpus index, or was written by an incompatible version")
+
+        offset = HEADER.size
+        meta = json.loads(bytes(self._mmap[offset : offset + meta_length]).decode("utf-8"))
+        self.files = meta["files"]
+        self.engine = meta["engine"]
+        offset = _align(offset + meta_length)
+
+        def view(dtype, count):
+            nonlocal offset
+            array = np.frombuffer(self._mmap, dtype=dtype, count=count, offset=offset)
+            offset = _align(offset + array.nbytes)
+            return array
+
+        self._postings = {}
+        for name, count in (("rhythm", rhythm_count), ("interval", interval_count)):
+            self._postings[name] = tuple(view(dtype, count) for dtype in POSTING_DTYPES)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the memory-mapped file"""
+        self._postings = {}
+        self._mmap.close()
+        self._file.close()
+
+    # ================================================================ BUILD ================================================================
+    @classmethod
+    def build(
+        cls,
+        sources,
+        path,
+        rhythm_n: int = 4,
+        interval_n: int = 4,
+        engine: str = "music21",
+        workers: int = 1,
+        warm_start=None,
+    ) -> "CorpusIndex":
+        """Builds an index over Scopul objects or MIDI files and saves it to path
+
+        Args:
+            sources: an iterable of Scopul objects or paths to MIDI files
+            path: where to save the index
+            rhythm_n: the number of quarter lengths per rhythm gram (1 to 4)
+            interval_n: the number of intervals per melodic gram (1 to 8)
+            engine: the engine used to load paths, see Scopul.construct()
+            workers: the number of processes loading paths, default is 1
+            warm_start: the path of a roman numeral warm-start file loaded by every worker, see
+                Scopul.corpus.process_pool()
+
+        Returns:
+            The opened CorpusIndex
+        """
+        import numpy as np
+
+        if not 1 <= rhythm_n <= MAX_RHYTHM_N:
+            raise ValueError(f"rhythm_n must be between 1 and {MAX_RHYTHM_N}")
+        if not 1 <= interval_n <= MAX_INTERVAL_N:
+            raise ValueError(f"interval_n must be between 1 and {MAX_INTERVAL_N}")
+
+        from Scopul.scopul import Scopul
+
+        # Scopul objects are indexed here, paths are loaded by the workers
+        sources = list(sources)
+        results = [
+            _source_grams(source, engine, rhythm_n, interval_n) if isinstance(source, Scopul) else None
+            for source in sources
+        ]
+        paths = [idx for idx, source in enumerate(sources) if results[idx] is None]
+
+        if workers == 1 or len(paths) < 2:
+            if warm_start is not None:
+                from Scopul.RomanCache import warm_start as load_warm_start
+
+                load_warm_start(warm_start)
+            for idx in paths:
+                results[idx] = _source_grams(sources[idx], engine, rhythm_n, interval_n)
+        else:
+            with process_pool(workers, warm_start) as executor:
+                loaded = executor.map(
+                    _source_grams,
+                    [sources[idx] for idx in paths],
+                    repeat(engine),
+                    repeat(rhythm_n),
+                    repeat(interval_n),
+                    chunksize=16,
+                )
+                for idx, result in zip(paths, loaded):
+                    results[idx] = result
+
+        files = []
+        columns = {"rhythm": [], "interval": []}
+        for file_id, (file_path, parts) in enumerate(results):
+            files.append(str(file_path))
+            for part_id, (rhythm, intervals, interval_events) in enumerate(parts):
+                events = np.arange(len(rhythm))
+                columns["rhythm"].append((rhythm, file_id, part_id, events, events))
+                columns["interval"].append(
+                    (intervals, file_id, part_id, np.arange(len(intervals)), interval_events)
+                )
+
+        # Postings sorted by gram, so a gram is found with a binary search
+        arrays = {}
+        for name, postings in columns.items():
+            merged = [
+                np.concatenate([grams for grams, *_ in postings] + [np.zeros(0, np.uint64)]),
+                np.concatenate(
+                    [np.full(len(grams), file_id, np.uint32) for grams, file_id, *_ in postings]
+                    + [np.zeros(0, np.uint32)]
+                ),
+                np.concatenate(
+                    [np.full(len(grams), part_id, np.uint32) for grams, _, part_id, *_ in postings]
+                    + [np.zeros(0, np.uint32)]
+                ),
+                np.concatenate([positions for *_, positions, _ in postings] + [np.zeros(0, np.int64)]),
+                np.concatenate([events for *_, events in postings] + [np.zeros(0, np.int64)]),
+            ]
+            order = np.argsort(merged[0], kind="stable")
+            arrays[name] = [
+                column[order].astype(dtype) for column, dtype in zip(merged, POSTING_DTYPES)
+            ]
+
+        meta = json.dumps({"engine": engine, "files": files}).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    rhythm_n,
+                    interval_n,
+                    len(meta),
+                    len(arrays["rhythm"][0]),
+                    len(arrays["interval"][0]),
+                )
+            )
+            file.write(meta)
+            for name in ("rhythm", "interval"):
+                for array in arrays[name]:
+                    file.write(b"\0" * (_align(file.tell()) - file.tell()))
+                    file.write(array.tobytes())
+
+        return cls(path)
+
+    # ================================================================ QUERIES ==============================================================
+    def _lookup(self, name: str, codes, n: int, bits: int) -> set:
+        """Returns the (file id, part id, index in Part.sequence) of every position matching a sequence of codes"""
+        import numpy as np
+
+        keys, file_ids, part_ids, positions, events = self._postings[name]
+
+        def postings(gram_codes, shift: int) -> dict:
+            # A gram shorter than n is a prefix: every key in [prefix << free bits, (prefix + 1) << free bits)
+            free = bits * (n - len(gram_codes))
+            prefix = 0
+            for code in gram_codes:
+                prefix = (prefix << bits) | int(code)
+            low = np.searchsorted(keys, np.uint64(prefix << free), side="left")
+            high = np.searchsorted(keys, np.uint64(((prefix + 1) << free) - 1), side="right")
+
+            # (file id, part id, position of the start of the query) -> index in Part.sequence
+            starts = zip(
+                file_ids[low:high].tolist(),
+                part_ids[low:high].tolist(),
+                (positions[low:high].astype(np.int64) - shift).tolist(),
+            )
+            return dict(zip(starts, events[low:high].tolist()))
+
+        if len(codes) <= n:
+            hits = postings(codes, 0)
+        else:
+            # Grams at 0, n, 2n... and one ending on the last code, intersected
+            offsets = list(range(0, len(codes) - n + 1, n))
+            if offsets[-1] != len(codes) - n:
+                offsets.append(len(codes) - n)
+
+            hits = postings(codes[:n], 0)
+            for offset in offsets[1:]:
+                if not hits:
+                    break
+                found = postings(codes[offset : offset + n], offset)
+                hits = {start: event for start, event in hits.items() if start in found}
+
+        return {(file_id, part_id, event) for (file_id, part_id, _), event in hits.items()}
+
+    def query_rhythm(self, rhythm, verify: bool = False) -> list:
+        """Finds the files, parts and positions where a rhythm occurs
+
+        Args:
+            rhythm: a rhythm, in the format accepted by Part.search_rhythm()
+            verify: index lookups ignore note types and compare quarter lengths to 1/48th of a quarter.
+                When True, every hit is checked against the files with the semantics of
+                Part.search_rhythm(rhythm, overlap=True)
+
+        Returns:
+            A sorted list of (file path, part index, start index in Part.sequence)
+        """
+        lengths, _ = parse_rhythm(rhythm)
+        hits = self._lookup("rhythm", rhythm_codes(lengths).tolist(), self.rhythm_n, QL_BITS)
+
+        if verify:
+            hits = self._verify(hits, rhythm)
+        return sorted((self.files[file_id], part_id, start) for file_id, part_id, start in hits)
+
+    def query_intervals(self, intervals: list) -> list:
+        """Finds the files, parts and positions where a melodic pattern occurs
+
+        The melody of a part is the highest pitch of every note or chord, rests are skipped
+
+        Args:
+            intervals: a list of intervals in semitones, for example [2, 2, -4] for C D E C
+
+        Returns:
+            A sorted list of (file path, part index, index in Part.sequence of the first note)
+        """
+        if len(intervals) == 0:
+            raise ValueError("intervals must contain at least one interval")
+
+        codes = interval_codes(intervals).tolist()
+        hits = self._lookup("interval", codes, self.interval_n, INTERVAL_BITS)
+        return sorted((self.files[file_id], part_id, start) for file_id, part_id, start in hits)
+
+    def _verify(self, hits: set, rhythm) -> set:
+        """Keeps the hits that Part.search_rhythm(rhythm, overlap=True) also finds"""
+        from Scopul.scopul import Scopul
+
+        verified = set()
+        by_file = {}
+        for file_id, part_id, start in hits:
+            by_file.setdefault(file_id, []).append((part_id, start))
+
+        searcher = RhythmSearch([rhythm])
+        for file_id, file_hits in by_file.items():
+            parts = Scopul(self.files[file_id], engine=self.engine).parts
+            matches = {}
+            for part_id, start in file_hits:
+                if part_id not in matches:
+                    table = parts[part_id].event_table
+                    found = searcher.search(table.event_lengths(), table.event_kinds(), overlap=True)[0]
+                    matches[part_id] = set(found)
+                if start in matches[part_id]:
+                    verified.add((file_id, part_id, start))
+
+        return verified
@@ -0,0 +1,91 @@
+from Scopul.EventTable import NOTE, CHORD, REST
+
+
+# A container class, whose job is to store data nicely
+class EventStats:
+    """Element statistics of a part or a score, returned by Part.stats() and Scopul.stats()
+
+    Attributes:
+        note_count, rest_count, chord_count: the number of notes, rests and chords
+        sounding_duration: the total quarter length of the notes and chords
+        measures: a numpy array of the measure numbers holding notes, sorted
+        density: a numpy array, the number of sounding pitches (chord notes included) of every measure in measures
+        velocity_histogram: a numpy array of 128 counts, one per velocity. Notes without a velocity are left out
+    """
+
+    def __init__(self, note_count, rest_count, chord_count, sounding_duration, measures, density, velocity_histogram) -> None:
+        self.note_count = note_count
+        self.rest_count = rest_count
+        self.chord_count = chord_count
+        self.sounding_duration = sounding_duration
+        self.measures = measures
+        self.density = density
+        self.velocity_histogram = velocity_histogram
+
+    @property
+    def velocity_mean(self) -> float:
+        """Returns the mean velocity of the notes with a velocity, None if there are none"""
+        import numpy as np
+
+        total = self.velocity_histogram.sum()
+        if total == 0:
+            return None
+        return float((np.arange(128) * self.velocity_histogram).sum() / total)
+
+    def __repr__(self) -> str:
+        return (
+            f"EventStats(notes={self.note_count}, rests={self.rest_count}, chords={self.chord_count}, "
+            f"sounding_duration={self.sounding_duration})"
+        )
+
+
+def event_stats(tables) -> EventStats:
+    """Computes the element statistics of event tables, with one vectorized pass over each column
+
+    Args:
+        tables: an iterable of EventTable objects, e.g. the parts of a score
+
+    Returns:
+        An EventStats object
+    """
+    import numpy as np
+
+    event_kind = [np.zeros(0, dtype=np.int8)]
+    event_length = [np.zeros(0)]
+    pitch = [np.zeros(0, dtype=np.int8)]
+    measure = [np.zeros(0, dtype=np.int32)]
+    velocity = [np.zeros(0, dtype=np.int8)]
+
+    for table in tables:
+        starts = np.asarray(table.starts, dtype=np.intp)
+        event_kind.append(np.asarray(table.kind, dtype=np.int8)[starts])
+        event_length.append(np.asarray(table.length, dtype=np.float64)[starts])
+        pitch.append(np.asarray(table.pitch, dtype=np.int8))
+        measure.append(np.asarray(table.measure, dtype=np.int32))
+        velocity.append(np.asarray(table.velocity, dtype=np.int8))
+
+    event_kind = np.concatenate(event_kind)
+    event_length = np.concatenate(event_length)
+    pitch = np.concatenate(pitch)
+    measure = np.concatenate(measure)
+    velocity = np.concatenate(velocity)
+
+    counts = np.bincount(event_kind, minlength=3)
+    sounding_duration = float(event_length[event_kind != REST].sum())
+
+    # Every sounding pitch is a row with a pitch
+    sounding = pitch >= 0
+    measures, density = np.unique(measure[sounding & (measure != -1)], return_counts=True)
+
+    velocity = velocity[sounding]
+    velocity_histogram = np.bincount(velocity[velocity >= 0].astype(np.intp), minlength=128)
+
+    return EventStats(
+        int(counts[NOTE]),
+        int(counts[REST]),
+        int(counts[CHORD]),
+        sounding_duration,
+        measures.astype(np.int64),
+        density,
+        velocity_histogram,
+    )
@@ -0,0 +1,360 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from mido import tempo2bpm
+
+# Kinds of events stored in the table
+NOTE = 0
+CHORD = 1
+REST = 2
+
+KIND_CODES = {NOTE: "n", CHORD: "c", REST: "r"}
+
+
+# A container class, whose job is to store the events of a part as parallel arrays
+class EventTable:
+    """Columnar storage for the events (Notes, Chords and Rests) of a part
+
+    Every sounding pitch is stored as one row, a rest is a single row with a pitch of -1.
+    The rows of a chord share the same group id, which is the index of the chord in Part.sequence
+
+    Columns:
+        kind: NOTE, CHORD or REST
+        onset: offset of the event from the start of the part, in quarter lengths
+        length: quarter length of the event
+        note_length: quarter length of the note of the row, a chord lasting as long as its longest note
+        measure: the measure number, -1 if the event is not in a measure
+        pitch: MIDI pitch of the row, -1 for rests
+        velocity: MIDI velocity of the row, -1 if unknown
+        group: index of the event the row belongs to
+
+    Columns are arrays, or read-only memoryviews of data read by score_file.load_score() or open_score(),
+    copied into arrays the first time the table is edited
+    """
+
+    COLUMNS = (
+        ("kind", "b"),
+        ("onset", "d"),
+        ("length", "d"),
+        ("note_length", "d"),
+        ("measure", "i"),
+        ("pitch", "b"),
+        ("velocity", "b"),
+        ("group", "i"),
+    )
+
+    def __init__(self) -> None:
+        for column, typecode in self.COLUMNS:
+            setattr(self, column, array(typecode))
+
+        # First row of every event
+        self.starts = array("i")
+
+        # music21 object of every event, None when the event was not read by music21
+        self.elements = []
+        self.from_music21_part = False
+
+        # True if the part holds percussion notes, which are left out of the table (they have no pitch)
+        self.percussion = False
+
+        # Built by measure_index(), dropped when events are added or replaced
+        self._measure_index = None
+
+        # Incremented on every change, so results computed from the table can be memoized
+        self.version = 0
+
+    def __len__(self) -> int:
+        """Returns the number of events (not rows) in the table"""
+        return len(self.starts)
+
+    @property
+    def row_count(self) -> int:
+        """Returns the number of rows in the table"""
+        return len(self.kind)
+
+    def append(
+        self,
+        kind: int,
+        onset: float,
+        length: float,
+        measure: int | None,
+        pitches: list,
+        velocities: list,
+        element=None,
+        lengths: list = None,
+    ) -> None:
+        """Appends an event to the table
+
+        Args:
+            kind: NOTE, CHORD or REST
+            onset: offset of the event in quarter lengths
+            length: quarter length of the event
+            measure: the measure number or None
+            pitches: a list of MIDI pitches, empty for rests
+            velocities: a list of velocities (None for unknown), one per pitch
+            element: the music21 object of the event (optional)
+            lengths: the quarter length of every note, one per pitch (optional, default is length)
+        """
+        self._writable()
+        group = len(self.starts)
+        self._measure_index = None
+        self.version += 1
+        self.starts.append(len(self.kind))
+        self.elements.append(element)
+
+        measure = -1 if measure is None else measure
+
+        # Rests still take up one row
+        if lengths is None:
+            lengths = [length] * len(pitches)
+        rows = list(zip(pitches, velocities, lengths)) if pitches else [(-1, None, length)]
+        for pitch, velocity, note_length in rows:
+            self.kind.append(kind)
+            self.onset.append(onset)
+            self.length.append(length)
+            self.note_length.append(note_length)
+            self.measure.append(measure)
+            self.pitch.append(pitch)
+            self.velocity.append(-1 if velocity is None else velocity)
+            self.group.append(group)
+
+    # ============================================================ EVENT ACCESS =============================================================
+    def event_kind(self, index: int) -> int:
+        """Returns the kind of the event at index"""
+        return self.kind[self.starts[index]]
+
+    def event_onset(self, index: int) -> float:
+        """Returns the onset of the event at index"""
+        return self.onset[self.starts[index]]
+
+    def event_length(self, index: int) -> float:
+        """Returns the quarter length of the event at index"""
+        return self.length[self.starts[index]]
+
+    def event_measure(self, index: int) -> int | None:
+        """Returns the measure number of the event at index, None if not in a measure"""
+        measure = self.measure[self.starts[index]]
+        return None if measure == -1 else measure
+
+    def event_rows(self, index: int) -> range:
+        """Returns the range of rows belonging to the event at index"""
+        end = self.starts[index + 1] if index + 1 < len(self.starts) else len(self.kind)
+        return range(self.starts[index], end)
+
+    def event_kinds(self) -> list:
+        """Returns the kind of every event"""
+        kind = self.kind
+        return [kind[row] for row in self.starts]
+
+    def event_lengths(self) -> list:
+        """Returns the quarter length of every event"""
+        length = self.length
+        return [length[row] for row in self.starts]
+
+    def event_measures(self) -> list:
+        """Returns the measure number (-1 if not in a measure) of every event"""
+        measure = self.measure
+        return [measure[row] for row in self.starts]
+
+    def indices_of(self, kind: int) -> list:
+        """Returns the indices of every event of a certain kind"""
+        kinds = self.kind
+        return [idx for idx, row in enumerate(self.starts) if kinds[row] == kind]
+
+    def sorted_by_measure(self) -> bool:
+        """Returns True if the rows are ordered by measure number, every measure holding a contiguous block"""
+        measure = self.measure
+        return all(measure[row] <= measure[row + 1] for row in range(len(measure) - 1))
+
+    def measure_events(self, measure: int) -> range:
+        """Returns the range of events in a measure, the rows must be sorted by measure
+
+        For a measure without events, the range is empty and starts where its events would be
+        """
+        first_row = bisect_left(self.measure, measure)
+        end_row = bisect_right(self.measure, measure)
+        first = self.group[first_row] if first_row < len(self.kind) else len(self.starts)
+        end = self.group[end_row] if end_row < len(self.kind) else len(self.starts)
+        return range(first, end)
+
+    def measure_index(self) -> tuple:
+        """Returns an index of the events by measure, built once from the measure column
+
+        Returns:
+            A tuple (numbers, runs) where numbers is the sorted list of measure numbers, and runs[i]
+            the list of (first, end) event ranges of measure numbers[i], a single range when the
+            measures are in order. Events without a measure are left out
+        """
+        if self._measure_index is None:
+            runs = {}
+            measures = self.event_measures()
+            first = 0
+            for idx in range(1, len(measures) + 1):
+                if idx == len(measures) or measures[idx] != measures[first]:
+                    if measures[first] != -1:
+                        runs.setdefault(measures[first], []).append((first, idx))
+                    first = idx
+
+            numbers = sorted(runs)
+            self._measure_index = (numbers, [runs[number] for number in numbers])
+        return self._measure_index
+
+    def measure_range(self, start: int, end: int) -> list:
+        """Returns the indices of the events in measures start to end (included), in order
+
+        Runs in O(log n + k), k being the number of events returned
+        """
+        numbers, runs = self.measure_index()
+        lo = bisect_left(numbers, start)
+        hi = bisect_right(numbers, end)
+
+        # Sorted, in case the measures are not in order in the table
+        ranges = sorted(run for measure_runs in runs[lo:hi] for run in measure_runs)
+        return [idx for first, stop in ranges for idx in range(first, stop)]
+
+    # ============================================================== EDITING ================================================================
+    def splice(self, first: int, end: int, other: "EventTable") -> None:
+        """Replaces the events first to end (excluded) with the events of another table
+
+        Only the rows after the replaced events are renumbered, nothing is read from music21
+        """
+        self._writable()
+        other._writable()
+        row_count = len(self.kind)
+        first_row = self.starts[first] if first < len(self.starts) else row_count
+        end_row = self.starts[end] if end < len(self.starts) else row_count
+        event_delta = len(other.starts) - (end - first)
+        row_delta = len(other.kind) - (end_row - first_row)
+
+        for column, _ in self.COLUMNS:
+            if column != "group":
+                getattr(self, column)[first_row:end_row] = getattr(other, column)
+
+        group = array("i", (idx + first for idx in other.group))
+        later_groups = array("i", (idx + event_delta for idx in self.group[end_row:]))
+        self.group[first_row:] = group + later_groups
+
+        starts = array("i", (row + first_row for row in other.starts))
+        later_starts = array("i", (row + row_delta for row in self.starts[end:]))
+        self.starts[first:] = starts + later_starts
+
+        self.elements[first:end] = other.elements
+        self._measure_index = None
+        self.version += 1
+        self.from_music21_part = self.from_music21_part and other.from_music21_part
+        self.percussion = self.percussion or other.percussion
+
+    def _writable(self) -> None:
+        """Copies the columns that are read-only views into arrays, before an edit"""
+        for column, typecode in self.COLUMNS + (("starts", "i"),):
+            values = getattr(self, column)
+            if not isinstance(values, array):
+                copy = array(typecode)
+                copy.frombytes(values.cast("B"))
+                setattr(self, column, copy)
+
+    # ============================================================ CONSTRUCTORS =============================================================
+    @classmethod
+    def from_music21(cls, part, offset: float = 0.0) -> "EventTable":
+        """Builds a table from a music21 part, walking it once
+
+        Args:
+            part: a music21 stream (a part, or a single measure)
+            offset: the offset of the stream in its part, added to every onset
+
+        Returns:
+            An EventTable, with events in the same order as part.recurse()
+        """
+        import music21
+
+        table = cls()
+        table.from_music21_part = True
+        for element in part.recurse():
+            if isinstance(element, music21.note.Note):
+                kind = NOTE
+                pitches = [element.pitch.midi]
+                velocities = [element.volume.velocity]
+            elif isinstance(element, music21.chord.Chord):
+                kind = CHORD
+                notes = list(element.notes)
+                pitches = [nt.pitch.midi for nt in notes]
+                velocities = [nt.volume.velocity for nt in notes]
+            elif isinstance(element, music21.note.Rest):
+                kind = REST
+                pitches = []
+                velocities = []
+            else:
+                if isinstance(element, (music21.note.Unpitched, music21.percussion.PercussionChord)):
+                    table.percussion = True
+                continue
+
+            try:
+                onset = offset + float(element.getOffsetInHierarchy(part))
+            except music21.sites.SitesException:
+                onset = offset + float(element.offset)
+
+            table.append(
+                kind,
+                onset,
+                float(element.duration.quarterLength),
+                element.measureNumber,
+                pitches,
+                velocities,
+                element,
+            )
+
+        return table
+
+    def to_music21(self, name=None, time_sigs: list = (), tempos: list = ()):
+        """Builds a music21 part, with measures, from the table
+
+        Every note keeps its own length (note_length): the notes of a chord that last longer or
+        shorter than the others are inserted as separate notes or chords at the same onset
+
+        Args:
+            name: the name of the part
+            time_sigs: a list of (offset, numerator, denominator, measure)
+            tempos: a list of (offset, midi tempo, measure)
+
+        Returns:
+            A music21 Part
+        """
+        import music21
+
+        part = music21.stream.Part()
+        part.partName = name
+
+        for offset, numerator, denominator, _ in time_sigs:
+            part.insert(offset, music21.meter.TimeSignature(f"{numerator}/{denominator}"))
+
+        for offset, midi_tempo, _ in tempos:
+            part.insert(offset, music21.tempo.MetronomeMark(number=round(tempo2bpm(midi_tempo), 2)))
+
+        for idx in range(len(self)):
+            rows = self.event_rows(idx)
+            first = rows.start
+
+            if self.kind[first] == REST:
+                element = music21.note.Rest()
+                element.quarterLength = self.length[first]
+                part.insert(self.onset[first], element)
+                continue
+
+            # Notes of a chord with other lengths become separate elements at the same onset
+            by_length = {}
+            for row in rows:
+                nt = music21.note.Note()
+                nt.pitch.midi = self.pitch[row]
+                if self.velocity[row] >= 0:
+                    nt.volume.velocity = self.velocity[row]
+                by_length.setdefault(self.note_length[row], []).append(nt)
+
+            for length, notes in by_length.items():
+                if self.kind[first] == NOTE or (len(notes) == 1 and len(by_length) > 1):
+                    element = notes[0]
+                else:
+                    element = music21.chord.Chord(notes)
+                element.quarterLength = length
+                part.insert(self.onset[first], element)
+
+        return part.makeMeasures()
+
@@ -1,11 +1,17 @@
 import re
-import music21
+from Scopul.conversions import name_to_number, number_to_name
 
 # A container class, whose job is to store data nicely
 class Note:
-    """A Class for all the notes"""
+    """A Class for all the notes
 
-    def __init__(self, m21=None, name=None, length=None, velocity=None, measure=None) -> None:
+    Notes only hold their pitch, onset, length, measure and velocity (in __slots__), the music21
+    note is created the first time it is accessed
+    """
+
+    __slots__ = ("_music21", "_name", "_pitch", "_onset", "_length", "_measure", "_velocity")
+
+    def __init__(self, m21=None, name=None, length=None, velocity=None, measure=None, pitch=None, onset=None) -> None:
         """
         A class representing a music note.
 
@@ -13,30 +19,62 @@ class Note:
             note: A music21 note object (optional).
             name: A string representing the name of the note in 'note octave' format (optional).
             length: A float or int representing the length of the note (optional).
+            velocity: An int, the velocity of the note (optional).
+            measure: An int, the measure of the note (optional).
+            pitch: An int, the MIDI pitch of the note, instead of name (optional).
+            onset: A float, the offset of the note in its part in quarter lengths (optional).
 
         Raises:
-            ValueError: If name is provided but is not in 'note octave' format.
+            ValueError: If name is provided but is not in 'note octave' format, or if no note is given.
             TypeError: If length is provided but is not a float or int.
         """
 
-        if m21 is not None:
-            self.music21 = m21
-            self._measure = m21.measureNumber
-            self._velocity = m21.volume.velocity
-        else:
-            self.music21 = music21.note.Note(name, quarterLength=length)
-            self._measure = velocity
-            self._velocity = measure
-
-        if name and not re.search(r"[a-zA-z][1-9]", name):
+        if name and not re.search(r"[a-gA-G][#-]*-?[0-9]", name):
             raise ValueError(
                 "name expects a note name in 'note octave' format, ex: 'A1' 'C4'"
             )
-        self._name = name if name else self.music21.pitch.nameWithOctave
+
+        if pitch is not None and not 0 <= pitch <= 127:
+            raise ValueError("pitch expects a MIDI note number, between 0 and 127")
+
+        if m21 is None and not name and pitch is None:
+            raise ValueError("Note expects a music21 note, a name or a pitch")
 
         if length and not isinstance(length, (int, float)):
             raise TypeError("length only accepts ints and floats")
-        self._length = length if length else self.music21.duration.quarterLength
+
+        # The music21 object is only created when it is needed
+        self._music21 = m21
+        if m21 is not None:
+            self._measure = m21.measureNumber
+            self._velocity = m21.volume.velocity
+        else:
+            self._measure = measure
+            self._velocity = velocity
+
+        # The name and the pitch are computed from each other when needed
+        self._name = name if name else None
+        self._pitch = pitch
+        self._onset = onset
+        if length:
+            self._length = length
+        else:
+            self._length = m21.duration.quarterLength if m21 is not None else 1.0
+
+    @property
+    def music21(self):
+        """Returns the music21 note, created on first access for notes not read by music21"""
+        if self._music21 is None:
+            import music21
+
+            self._music21 = music21.note.Note(self.name, quarterLength=self._length)
+            if self._velocity is not None:
+                self._music21.volume.velocity = self._velocity
+        return self._music21
+
+    @music21.setter
+    def music21(self, m21) -> None:
+        self._music21 = m21
 
     @property
     def name(self):
@@ -47,8 +85,32 @@ class Note:
             D5
             B-4
         """
+        if self._name is None:
+            if self._music21 is not None:
+                self._name = self._music21.pitch.nameWithOctave
+            else:
+                self._name = number_to_name(self._pitch)
         return self._name
 
+    @property
+    def pitch(self):
+        """Returns an int, the MIDI pitch of the note
+
+        Example:
+            60 (C4)
+        """
+        if self._pitch is None:
+            if self._music21 is not None:
+                self._pitch = self._music21.pitch.midi
+            else:
+                self._pitch = name_to_number(self._name)
+        return self._pitch
+
+    @property
+    def onset(self):
+        """Returns a float, the offset of the note in its part in quarter lengths (None if unknown)"""
+        return self._onset
+
     @property
     def measure(self):
         """Returns an int representing the measure"""
@@ -73,19 +135,35 @@ class Note:
 class Rest:
     """A Class for all the rests"""
 
-    def __init__(self, m21=None, length=None, measure=None) -> None:
+    __slots__ = ("_music21", "_onset", "_length", "_measure")
+
+    def __init__(self, m21=None, length=None, measure=None, onset=None) -> None:
 
         if length and isinstance(length, (int, float)):
             self._length = length
         else:
             self._length = m21.duration.quarterLength
 
+        # The music21 object is only created when it is needed
+        self._music21 = m21
         if m21 is not None:
-            self.music21 = m21
             self._measure = m21.measureNumber
         else:
             self._measure = measure
-            self.music21 = music21.note.Rest(quarterlength=length)
+        self._onset = onset
+
+    @property
+    def music21(self):
+        """Returns the music21 rest, created on first access for rests not read by music21"""
+        if self._music21 is None:
+            import music21
+
+            self._music21 = music21.note.Rest(quarterLength=self._length)
+        return self._music21
+
+    @music21.setter
+    def music21(self, m21) -> None:
+        self._music21 = m21
 
     @property
     def length(self):
@@ -96,6 +174,11 @@ class Rest:
         """
         return self._length
 
+    @property
+    def onset(self):
+        """Returns a float, the offset of the rest in its part in quarter lengths (None if unknown)"""
+        return self._onset
+
     @property
     def measure(self):
         """Returns an int, representing the measure number"""
@@ -103,21 +186,61 @@ class Rest:
 
 # A container class, whose job is to store data nicely
 class Chord:
-    """A Class to represent a chord (multiple notes at once)"""
+    """A Class to represent a chord (multiple notes at once)
+
+    A chord can be created from a music21 chord, from Note objects, or from MIDI pitches alone.
+    Its Note objects and music21 chord are only created when they are accessed
+    """
+
+    __slots__ = ("_music21", "_notes", "_pitches", "_velocities", "_onset", "_length", "_measure")
+
+    def __init__(
+        self,
+        m21=None,
+        notes: list = None,
+        measure=None,
+        pitches: list = None,
+        length=None,
+        velocities: list = None,
+        onset=None,
+    ) -> None:
+        self._pitches = None
+        self._velocities = None
+        self._onset = onset
 
-    def __init__(self, m21=None, notes: list = None, measure=None) -> None:
-        if isinstance(m21, music21.chord.Chord):
-            self.music21 = m21
-            self._notes = [Note(note) for note in list(m21.notes)]
+        if m21 is not None:
+            self._music21 = m21
+            self._notes = None
             self._measure = m21.measureNumber
             self._length = m21.duration.quarterLength
-        # if chord is not a music21 chord object
-        else:
-            notes = [note.music21 for note in notes]
-            self.music21 = music21.chord.Chord(notes)
-            self._notes = [Note(note) for note in notes]
+        # if chord is not a music21 chord object, the music21 chord is created when needed
+        elif notes is not None:
+            self._music21 = None
+            self._notes = list(notes)
+            self._measure = measure
+            self._length = self._notes[0].length
+        elif pitches:
+            self._music21 = None
+            self._notes = None
+            self._pitches = list(pitches)
+            self._velocities = list(velocities) if velocities is not None else [None] * len(self._pitches)
             self._measure = measure
-            self._length = notes[0].duration.quarterLength
+            self._length = length if length else 1.0
+        else:
+            raise ValueError("Chord expects a music21 chord, notes or pitches")
+
+    @property
+    def music21(self):
+        """Returns the music21 chord, created on first access for chords not read by music21"""
+        if self._music21 is None:
+            import music21
+
+            self._music21 = music21.chord.Chord([note.music21 for note in self.notes])
+        return self._music21
+
+    @music21.setter
+    def music21(self, m21) -> None:
+        self._music21 = m21
 
     @property
     def length(self):
@@ -128,11 +251,26 @@ class Chord:
         """
         return self._length
 
+    @property
+    def onset(self):
+        """Returns a float, the offset of the chord in its part in quarter lengths (None if unknown)"""
+        return self._onset
+
     @property
     def measure(self):
         """Returns an int, representing the measure number"""
         return self._measure
 
+    @property
+    def pitches(self):
+        """Returns a list of ints, the MIDI pitches of the chord"""
+        if self._pitches is None:
+            if self._notes is not None:
+                self._pitches = [note.pitch for note in self._notes]
+            else:
+                self._pitches = [pitch.midi for pitch in self._music21.pitches]
+        return self._pitches
+
     @property
     def notes(self):
         """Retrieves a list of notes in a chord
@@ -142,4 +280,12 @@ class Chord:
 
             [Note Object, Note Object]
         """
+        if self._notes is None:
+            if self._music21 is not None:
+                self._notes = [Note(note, onset=self._onset) for note in list(self._music21.notes)]
+            else:
+                self._notes = [
+                    Note(pitch=pitch, length=self._length, velocity=velocity, measure=self._measure, onset=self._onset)
+                    for pitch, velocity in zip(self._pitches, self._velocities)
+                ]
         return self._notes
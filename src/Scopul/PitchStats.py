@@ -0,0 +1,108 @@
+from Scopul.conversions import number_to_name, NOTES
+
+
+# A container class, whose job is to store data nicely
+class PitchStats:
+    """Pitch statistics of a part or a score, returned by Part.pitch_stats() and Scopul.pitch_stats()
+
+    Notes inside chords are counted, rests are not
+
+    Attributes:
+        count: the number of sounding pitches
+        highest, lowest: the highest and lowest MIDI pitch, None without notes
+        ambitus: highest - lowest, in semitones (0 without notes)
+        pitch_class_histogram: a numpy array of 12 counts, index 0 is C
+        measures: a numpy array of the measure numbers holding notes, sorted
+        measure_min, measure_max, measure_mean: numpy arrays, the pitch statistics of every measure in measures
+    """
+
+    def __init__(self, count, highest, lowest, pitch_class_histogram, measures, measure_min, measure_max, measure_mean) -> None:
+        self.count = count
+        self.highest = highest
+        self.lowest = lowest
+        self.ambitus = 0 if highest is None else highest - lowest
+        self.pitch_class_histogram = pitch_class_histogram
+        self.measures = measures
+        self.measure_min = measure_min
+        self.measure_max = measure_max
+        self.measure_mean = measure_mean
+
+    @property
+    def highest_name(self) -> str:
+        """Returns the name of the highest pitch ("C5"), None without notes"""
+        return None if self.highest is None else number_to_name(self.highest)
+
+    @property
+    def lowest_name(self) -> str:
+        """Returns the name of the lowest pitch ("C5"), None without notes"""
+        return None if self.lowest is None else number_to_name(self.lowest)
+
+    def pitch_classes(self) -> dict:
+        """Returns the pitch class histogram as a dict of pitch class name -> count"""
+        return {name: int(count) for name, count in zip(NOTES, self.pitch_class_histogram)}
+
+    def measure(self, number: int) -> tuple:
+        """Returns the (min, max, mean) pitch of a measure, None if the measure has no notes"""
+        import numpy as np
+
+        idx = int(np.searchsorted(self.measures, number))
+        if idx == len(self.measures) or self.measures[idx] != number:
+            return None
+        return int(self.measure_min[idx]), int(self.measure_max[idx]), float(self.measure_mean[idx])
+
+    def __repr__(self) -> str:
+        return f"PitchStats(count={self.count}, lowest={self.lowest_name}, highest={self.highest_name}, ambitus={self.ambitus})"
+
+
+def pitch_stats(tables) -> PitchStats:
+    """Computes the pitch statistics of event tables, in one vectorized pass over their pitch columns
+
+    Args:
+        tables: an iterable of EventTable objects, e.g. the parts of a score
+
+    Returns:
+        A PitchStats object
+    """
+    import numpy as np
+
+    tables = list(tables)
+    pitch = np.concatenate([np.zeros(0, dtype=np.int8)] + [np.asarray(table.pitch, dtype=np.int8) for table in tables])
+    measure = np.concatenate([np.zeros(0, dtype=np.int32)] + [np.asarray(table.measure, dtype=np.int32) for table in tables])
+
+    # Rests have the pitch -1
+    sounding = pitch >= 0
+    pitch = pitch[sounding].astype(np.int64)
+    measure = measure[sounding]
+
+    if pitch.size == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return PitchStats(0, None, None, np.zeros(12, dtype=np.int64), empty, empty, empty, np.zeros(0))
+
+    histogram = np.bincount(pitch % 12, minlength=12)
+
+    # Per measure, on the pitches sorted by measure (notes outside measures are left out)
+    in_measure = measure != -1
+    order = np.argsort(measure[in_measure], kind="stable")
+    by_measure = measure[in_measure][order]
+    pitch_by_measure = pitch[in_measure][order]
+    numbers, starts = np.unique(by_measure, return_index=True)
+
+    if numbers.size:
+        measure_min = np.minimum.reduceat(pitch_by_measure, starts)
+        measure_max = np.maximum.reduceat(pitch_by_measure, starts)
+        counts = np.diff(np.append(starts, pitch_by_measure.size))
+        measure_mean = np.add.reduceat(pitch_by_measure, starts) / counts
+    else:
+        measure_min = measure_max = np.zeros(0, dtype=np.int64)
+        measure_mean = np.zeros(0)
+
+    return PitchStats(
+        int(pitch.size),
+        int(pitch.max()),
+        int(pitch.min()),
+        histogram,
+        numbers.astype(np.int64),
+        measure_min,
+        measure_max,
+        measure_mean,
+    )
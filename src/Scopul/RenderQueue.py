@@ -0,0 +1,203 @@
+import json
+import os
+import pathlib
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from Scopul.config_musescore import musescore_path
+
+# How often, in seconds, a MuseScore run is checked for the outputs it wrote
+POLL_INTERVAL = 0.05
+
+
+# A container class, whose job is to store data nicely
+class RenderResult:
+    """The outcome of a render job
+
+    Attributes:
+        source: the path of the file rendered
+        output: the path of the file written by MuseScore
+        status: "ok", "failed" or "timeout"
+        error: the error reported by MuseScore, None if the job succeeded
+        seconds: the time the MuseScore run that rendered the file took
+    """
+
+    def __init__(self, source, output, status: str, error: str = None, seconds: float = 0.0) -> None:
+        self.source = source
+        self.output = output
+        self.status = status
+        self.error = error
+        self.seconds = seconds
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def __repr__(self) -> str:
+        return f"RenderResult({self.source!r} -> {self.output!r}, {self.status})"
+
+
+class RenderQueue:
+    """Renders many files (pdf, png, musicxml...) with MuseScore, batched and concurrent
+
+    Jobs are grouped in batches, every batch is rendered by one MuseScore run through a JSON job
+    file (mscore -j), and several runs happen at once. The timeout applies to every job: a run is
+    stopped when MuseScore writes no output for timeout seconds. When a run fails or is stopped,
+    the jobs of the batch that were not rendered are run again one by one, so that a single bad
+    file only fails itself (a job that hangs is reported after at most twice the timeout)
+
+        queue = RenderQueue(renderers=4)
+        queue.add_score(scop, "scop.pdf", title="Scop")
+        queue.add("other.mid", "other.pdf")
+        for result in queue.run():
+            print(result.source, result.status)
+
+    Args:
+        renderers: the number of MuseScore processes running at once, default is 2
+        batch_size: the number of jobs rendered by a MuseScore run, default is 16
+        timeout: the time a job may take, in seconds, default is 120
+        musescore: the path to MuseScore, default is the path set with config_musescore()
+    """
+
+    def __init__(self, renderers: int = 2, batch_size: int = 16, timeout: float = 120.0, musescore=None) -> None:
+        if renderers < 1 or batch_size < 1:
+            raise ValueError("renderers and batch_size must be positive integers")
+        if timeout <= 0:
+            raise ValueError("timeout must be a positive number")
+
+        self.renderers = renderers
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.musescore = str(musescore) if musescore is not None else None
+        # (source, output) of every job, in the order they were added
+        self._jobs = []
+        # Directory holding the musicxml of the scores added with add_score(), and the job files
+        self._workdir = None
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def add(self, source, output, overwrite: bool = False) -> None:
+        """Adds a file to render, MuseScore picks the format from the extension of the output
+
+        Raises:
+            FileNotFoundError: if there is no file at source
+            FileExistsError: if overwrite is False and there is a file at output
+        """
+        source = str(pathlib.Path(source).absolute())
+        output = str(pathlib.Path(output).absolute())
+
+        if not pathlib.Path(source).exists():
+            raise FileNotFoundError(f"{source} not found")
+
+        if pathlib.Path(output).exists():
+            if not overwrite:
+                raise FileExistsError(
+                    f"{output} already exists. To overwrite, set overwrite=True"
+                )
+            # Results are read from the outputs MuseScore writes
+            os.remove(output)
+
+        self._jobs.append((source, output))
+
+    def add_score(self, scop, output, title: str = "Scop", overwrite: bool = False) -> None:
+        """Adds a Scopul score to render, exported to musicxml first (see Scopul.to_musicxml())"""
+        source = self._directory() / f"score{len(self._jobs)}.musicxml"
+        with open(source, "wb") as file:
+            scop.to_musicxml(file, title=title)
+        self.add(source, output, overwrite=overwrite)
+
+    def _directory(self) -> pathlib.Path:
+        if self._workdir is None:
+            self._workdir = pathlib.Path(tempfile.mkdtemp(prefix="scopul_render_"))
+        return self._workdir
+
+    def run(self) -> list:
+        """Renders every job added, then empties the queue
+
+        Returns:
+            A list of RenderResult, in the order the jobs were added
+        """
+        mspath = self.musescore if self.musescore is not None else musescore_path()
+        jobs = self._jobs
+        batches = [jobs[idx:idx + self.batch_size] for idx in range(0, len(jobs), self.batch_size)]
+
+        # Created before the renderers start, they all write their job files to it
+        self._directory()
+        try:
+            with ThreadPoolExecutor(max_workers=self.renderers) as pool:
+                results = {}
+                for batch_results in pool.map(lambda batch: self._render_batch(mspath, batch), batches):
+                    results.update(batch_results)
+        finally:
+            self._jobs = []
+            if self._workdir is not None:
+                shutil.rmtree(self._workdir, ignore_errors=True)
+                self._workdir = None
+
+        return [results[job] for job in jobs]
+
+    def _render_batch(self, mspath: str, batch: list) -> dict:
+        """Renders a batch in one MuseScore run, then the jobs that failed one by one
+
+        Returns:
+            A dict (source, output) -> RenderResult
+        """
+        status, error, seconds = self._render(mspath, batch)
+        results = {}
+        retry = []
+        for job in batch:
+            if pathlib.Path(job[1]).exists():
+                results[job] = RenderResult(*job, "ok", seconds=seconds)
+            elif len(batch) == 1:
+                if status == "ok":
+                    status, error = "failed", f"MuseScore did not write {job[1]}"
+                results[job] = RenderResult(*job, status, error, seconds)
+            else:
+                retry.append(job)
+
+        for job in retry:
+            results.update(self._render_batch(mspath, [job]))
+        return results
+
+    def _render(self, mspath: str, batch: list) -> tuple:
+        """Runs MuseScore on a job file, stopped when no job is rendered for timeout seconds
+
+        Returns:
+            A tuple (status, error, seconds), status being "ok", "failed" or "timeout"
+        """
+        job_file = tempfile.NamedTemporaryFile("w", suffix=".json", dir=self._directory(), delete=False)
+        with job_file:
+            json.dump([{"in": source, "out": output} for source, output in batch], job_file)
+
+        outputs = [pathlib.Path(output) for _, output in batch]
+        start = time.perf_counter()
+        try:
+            with tempfile.TemporaryFile() as stderr:
+                process = subprocess.Popen([mspath, "-j", job_file.name], stdout=subprocess.DEVNULL, stderr=stderr)
+                rendered = 0
+                deadline = start + self.timeout
+                while process.poll() is None:
+                    # Every output written gives the next job its own timeout
+                    written = sum(output.exists() for output in outputs)
+                    if written > rendered:
+                        rendered = written
+                        deadline = time.perf_counter() + self.timeout
+
+                    if time.perf_counter() >= deadline:
+                        process.kill()
+                        process.wait()
+                        return "timeout", f"MuseScore took more than {self.timeout} seconds on a job", time.perf_counter() - start
+                    time.sleep(POLL_INTERVAL)
+
+                stderr.seek(0)
+                error = stderr.read().decode(errors="replace").strip()
+        finally:
+            os.remove(job_file.name)
+
+        seconds = time.perf_counter() - start
+        if process.returncode != 0:
+            return "failed", error or f"MuseScore exited with code {process.returncode}", seconds
+        return "ok", None, seconds
@@ -0,0 +1,156 @@
+from collections import deque
+from collections.abc import Iterable
+from Scopul.EventTable import NOTE, CHORD, REST
+
+# Note types accepted in rhythms
+KIND_VALUES = {"n": NOTE, "c": CHORD, "r": REST}
+
+
+def parse_rhythm(rhythm: Iterable) -> tuple:
+    """Splits a rhythm, in the format accepted by Part.search_rhythm(), into quarter lengths and note types
+
+    Args:
+        rhythm: a list of quarter lengths, or of [type, quarterlength] pairs
+
+    Returns:
+        A tuple (lengths, kinds), kinds being None where the rhythm does not specify a type
+
+    Raises:
+        ValueError: if the rhythm is empty
+    """
+    lengths = []
+    kinds = []
+
+    for note in rhythm:
+        if isinstance(note, Iterable) and not isinstance(note, str):
+            note = list(note)
+            kinds.append(KIND_VALUES.get(note[0]) if isinstance(note[0], str) else None)
+            lengths.append(float(note[-1]))
+        else:
+            kinds.append(None)
+            lengths.append(float(note))
+
+    if not lengths:
+        raise ValueError("rhythm must contain at least one note")
+
+    return lengths, kinds
+
+
+class RhythmSearch:
+    """A matcher for many rhythms at once, over the events of a part
+
+    The rhythms are compiled into an Aho-Corasick automaton (KMP for a single rhythm) over quarter
+    lengths, so a search reads the part once, whatever the number of rhythms. Note types are checked
+    on the positions of each rhythmic match that specify one.
+
+    Note types are not symbols of the automaton on purpose: without overlap, search_rhythm() has
+    always chosen its occurrences from left to right on the rhythm alone, then dropped those whose
+    types differ, so a rhythmic match with the wrong types still hides the matches it overlaps.
+    That choice needs every rhythmic match, which an alphabet of (type, length) would not give.
+    Positions without a type would also match any of the three types, turning each such rhythm into
+    up to 3 ** len(rhythm) patterns. Checking the types costs one comparison per typed position of a
+    rhythmic match
+
+    Args:
+        rhythms: a list of rhythms, in the format accepted by Part.search_rhythm()
+    """
+
+    def __init__(self, rhythms: Iterable) -> None:
+        self.lengths = []
+        # (position, kind) of the positions of every rhythm that specify a type
+        self.kinds = []
+
+        for rhythm in rhythms:
+            lengths, kinds = parse_rhythm(rhythm)
+            self.lengths.append(lengths)
+            self.kinds.append([(pos, kind) for pos, kind in enumerate(kinds) if kind is not None])
+
+        self._build()
+
+    def _build(self) -> None:
+        """Builds the goto, fail and output functions of the automaton"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._out = [[]]
+
+        # Trie of the rhythms
+        for rhythm_id, lengths in enumerate(self.lengths):
+            state = 0
+            for length in lengths:
+                nxt = self._goto[state].get(length)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][length] = nxt
+                state = nxt
+            self._out[state].append(rhythm_id)
+
+        # Failure links, breadth first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for length, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and length not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(length, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _rhythmic_matches(self, lengths: Iterable) -> list:
+        """Returns the start indices of every (overlapping) rhythmic match, for every rhythm"""
+        goto = self._goto
+        fail = self._fail
+        out = self._out
+        sizes = [len(lengths) for lengths in self.lengths]
+        matches = [[] for _ in self.lengths]
+
+        state = 0
+        for idx, length in enumerate(lengths):
+            while state and length not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(length, 0)
+            for rhythm_id in out[state]:
+                matches[rhythm_id].append(idx - sizes[rhythm_id] + 1)
+
+        return matches
+
+    def search(self, lengths: Iterable, kinds: list, overlap: bool = False) -> list:
+        """Searches every rhythm in a sequence of events
+
+        Args:
+            lengths: the quarter length of every event
+            kinds: the kind (NOTE, CHORD or REST) of every event
+            overlap: whether matches of a rhythm may overlap. When False, as in Part.search_rhythm(),
+                matches are chosen from left to right on their rhythm, then filtered by note types.
+                When True, the result is the same as matching (type, length) symbols
+
+        Returns:
+            A list with, for every rhythm, the list of start indices of its matches
+        """
+        results = []
+
+        for rhythm_id, starts in enumerate(self._rhythmic_matches(lengths)):
+            size = len(self.lengths[rhythm_id])
+            constraints = self.kinds[rhythm_id]
+
+            if not overlap:
+                chosen = []
+                next_free = 0
+                for start in starts:
+                    if start >= next_free:
+                        chosen.append(start)
+                        next_free = start + size
+                starts = chosen
+
+            results.append(
+                [
+                    start
+                    for start in starts
+                    if all(kinds[start + pos] == kind for pos, kind in constraints)
+                ]
+            )
+
+        return results
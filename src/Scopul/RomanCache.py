@@ -0,0 +1,164 @@
+import json
+import os
+import pathlib
+import tempfile
+from collections import OrderedDict
+
+# How music21 spells a MIDI pitch read from a file, one pitch at a time
+SPELLINGS = ["C", "C#", "D", "E-", "E", "F", "F#", "G", "G#", "A", "B-", "B"]
+
+
+def spell(pitch: int) -> str:
+    """Returns the name of a MIDI pitch with its octave, spelled like music21 spells the notes of a MIDI file
+
+    Example:
+        63 -> "E-4"
+    """
+    return f"{SPELLINGS[pitch % 12]}{pitch // 12 - 1}"
+
+
+class RomanCache:
+    """A size-bounded LRU cache of roman numeral figures, used by ChordProgression
+
+    Figures are keyed by the voicing of a chord, its bass and the key they are relative to (None for
+    figures relative to the chord's root, like romanNumeralFromChord(chord)): a figure depends on
+    whether the intervals above the bass are simple or compound, and on the spelling of the pitches.
+    MIDI pitches are spelled one at a time like the notes of a MIDI file read by music21 (see spell()),
+    the spelling of a pitch only depending on its pitch class: they are keyed by their intervals above
+    the bass and the spelled bass. music21 chords are keyed by their spelled pitches and bass
+
+    A warm-start file written by save() can be loaded by other processes (e.g. with
+    warm_start() as the initializer of a process pool) so they start with the figures already known
+
+    Args:
+        max_size: the maximum number of figures kept, default is 4096
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        if max_size <= 0:
+            raise ValueError("max_size must be a positive integer")
+
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    @staticmethod
+    def key(pitches, key: str = None) -> tuple:
+        """Returns the cache key of MIDI pitches: (sorted semitones above the bass, spelled bass pitch class, key)"""
+        bass = min(pitches)
+        return tuple(sorted({pitch - bass for pitch in pitches})), SPELLINGS[bass % 12], key
+
+    @staticmethod
+    def chord_key(chord, key: str = None) -> tuple:
+        """Returns the cache key of a music21 chord: (sorted pitch names with octaves, bass, key)"""
+        return tuple(sorted(pitch.nameWithOctave for pitch in chord.pitches)), chord.bass().nameWithOctave, key
+
+    def figure(self, pitches, key: str = None) -> str:
+        """Returns the roman numeral figure of MIDI pitches
+
+        Args:
+            pitches: an iterable of MIDI pitches
+            key: the key the figure is relative to ("E- major"), None for the chord's root
+        """
+        pitches = list(pitches)
+        return self._lookup(self.key(pitches, key), sorted(pitches), key)
+
+    def figure_of_chord(self, chord, key: str = None) -> str:
+        """Returns the roman numeral figure of a music21 chord, computed from the chord itself, see figure()"""
+        return self._lookup(self.chord_key(chord, key), chord, key)
+
+    def _lookup(self, cache_key: tuple, pitches, key: str = None) -> str:
+        figure = self._figures.get(cache_key)
+        if figure is not None:
+            self.hits += 1
+            self._figures.move_to_end(cache_key)
+            return figure
+
+        self.misses += 1
+        figure = self._compute(pitches, key)
+        self._store(cache_key, figure)
+        return figure
+
+    @staticmethod
+    def _compute(pitches, key: str = None) -> str:
+        """Computes the figure of MIDI pitches (or of a music21 chord) with music21"""
+        from music21 import chord, roman
+        from music21 import key as m21_key
+
+        # Spelled one pitch at a time: a chord of MIDI numbers is spelled as a whole by music21
+        if not isinstance(pitches, chord.Chord):
+            pitches = chord.Chord([spell(pitch) for pitch in pitches])
+
+        if key is None:
+            return roman.romanNumeralFromChord(pitches).figure
+
+        tonic, mode = key.split()
+        return roman.romanNumeralFromChord(pitches, m21_key.Key(tonic, mode)).figure
+
+    def _store(self, cache_key: tuple, figure: str) -> None:
+        self._figures[cache_key] = figure
+        self._figures.move_to_end(cache_key)
+        while len(self._figures) > self.max_size:
+            self._figures.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Returns the hits, misses, hit rate and size of the cache"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self._figures),
+            "max_size": self.max_size,
+        }
+
+    def clear(self) -> None:
+        """Removes every figure and resets the statistics"""
+        self._figures.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def save(self, path) -> None:
+        """Writes the figures to a warm-start file, from the least to the most recently used"""
+        entries = [[list(pitches), bass, key, figure] for (pitches, bass, key), figure in self._figures.items()]
+        path = pathlib.Path(path)
+
+        # Written to a temporary file first, so other processes never read half a file
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as file:
+                json.dump({"figures": entries}, file)
+            os.replace(tmp, path)
+        except BaseException:
+            pathlib.Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def load(self, path) -> int:
+        """Adds the figures of a warm-start file written by save()
+
+        Returns:
+            The number of figures read
+        """
+        with open(path) as file:
+            entries = json.load(file)["figures"]
+
+        for pitches, bass, key, figure in entries:
+            self._store((tuple(pitches), bass, key), figure)
+        return len(entries)
+
+
+# Shared by every ChordProgression of the process
+ROMAN_CACHE = RomanCache()
+
+
+def warm_start(path) -> None:
+    """Loads a warm-start file into the cache of the process, if it exists
+
+    Can be used as the initializer of a process pool
+    """
+    if os.path.exists(path):
+        ROMAN_CACHE.load(path)
@@ -1,13 +1,44 @@
-import music21
 from Scopul.MusicalElements import Note, Rest, Chord
 from Scopul.ChordProgression import ChordProgression
-from Scopul.scopul_exception import InvalidMusicElementError, PercussionChordifyError
-from Scopul.conversions import note_to_number
+from Scopul.scopul_exception import PercussionChordifyError
 from collections.abc import Iterable
-from Scopul.helpers import sublist
-from Scopul import TimeSignature, Tempo
-import re
+from Scopul.RhythmSearch import RhythmSearch, KIND_VALUES
+from Scopul.EventTable import EventTable, NOTE, CHORD, REST
+from Scopul.Transaction import PartEdit
+from Scopul.TimeSignature import TimeSignature
+from Scopul.PitchStats import PitchStats, pitch_stats
+from Scopul.EventStats import EventStats, event_stats
+from Scopul.key_profiles import key_timeline
 from copy import deepcopy
+from bisect import bisect_left, bisect_right
+
+
+def _kind_codes(kinds: Iterable) -> set:
+    """Converts element types (Note, Rest, Chord or "n", "r", "c") into a set of event kinds, None for all"""
+    if kinds is None:
+        return None
+
+    classes = {Note: NOTE, Chord: CHORD, Rest: REST}
+    codes = set()
+    for kind in kinds:
+        if kind in classes:
+            codes.add(classes[kind])
+        elif kind in KIND_VALUES:
+            codes.add(KIND_VALUES[kind])
+        else:
+            raise ValueError(f"{kind} is not an element type, use Note, Rest, Chord or 'n', 'r', 'c'")
+    return codes
+
+
+def _measure_runs(table: EventTable):
+    """Yields the (first, end) event ranges of consecutive events in the same measure"""
+    measure = table.measure
+    starts = table.starts
+    first = 0
+    for idx in range(1, len(starts) + 1):
+        if idx == len(starts) or measure[starts[idx]] != measure[starts[first]]:
+            yield first, idx
+            first = idx
 
 
 class Part:
@@ -18,7 +49,9 @@ class Part:
         part: Can be an iterbale consisting of Scopul musical elements OR a music21 part object
     """
 
-    def __init__(self, part: Iterable | music21.stream.Part) -> None:
+    def __init__(self, part: "Iterable | music21.stream.Part") -> None:
+        import music21
+
         if not isinstance(part, music21.stream.Part):
             p = music21.stream.Part()
             for ele in part:
@@ -38,192 +71,549 @@ class Part:
             self._part= part
             self.name = part.partName
 
+        # The Scopul object holding the part, told when an edit changes its tempos or time signatures
+        self._score = None
+        # Cached event table and Scopul wrappers, built on first use
+        self._table = None
+        self._wrappers = None
+        # (table, table version, EventStats) of the last stats() call
+        self._stats = None
+
+    @classmethod
+    def from_event_table(cls, table: EventTable, name=None, time_sigs: list = (), tempos: list = ()) -> "Part":
+        """Creates a Part from an EventTable, without going through music21
+
+        The music21 part is only built (from the table) the first time it is needed
+
+        Args:
+            table: an EventTable
+            name: the name of the part
+            time_sigs: a list of (offset, numerator, denominator, measure), used to build the music21 part
+            tempos: a list of (offset, midi tempo, measure), used to build the music21 part
+        """
+        part = cls.__new__(cls)
+        part._music21_part = None
+        part._context = (list(time_sigs), list(tempos))
+        part._score = None
+        part.name = name
+        part._table = table
+        part._wrappers = [None] * len(table)
+        part._stats = None
+        return part
+
+    @property
+    def _part(self):
+        """The music21 part, built from the event table when the Part was created without one"""
+        if self._music21_part is None:
+            time_sigs, tempos = self._context
+            self._music21_part = self._table.to_music21(self.name, time_sigs, tempos)
+        return self._music21_part
+
+    @_part.setter
+    def _part(self, part) -> None:
+        self._music21_part = part
+
+    @property
+    def event_table(self) -> EventTable:
+        """Retrieves the EventTable of the part
+
+        The table is built once, by walking the music21 part, and kept until the part is edited
+        with insert() or delete()
+        """
+        if self._table is None:
+            self._table = EventTable.from_music21(self._part)
+            self._wrappers = [None] * len(self._table)
+        return self._table
+
     @property
     def sequence(self):
-        sequence = []
-        # Looping through the part
-        if isinstance(self._part, music21.stream.Part):
-            for element in self._part.recurse():
-                # Setting the class and appending depending on the type of symbol
-                if isinstance(element, music21.note.Note):
-                    sequence.append(Note(element))
-                elif isinstance(element, music21.chord.Chord):
-                    sequence.append(Chord(element))
-                elif isinstance(element, music21.note.Rest):
-                    sequence.append(Rest(element))
-        return sequence
+        table = self.event_table
+        return [self._wrapper(idx) for idx in range(len(table))]
+
+    def _wrapper(self, index: int):
+        """Returns the (cached) Scopul musical element of the event at index"""
+        wrapper = self._wrappers[index]
+        if wrapper is None:
+            wrapper = self._new_wrapper(index)
+            self._wrappers[index] = wrapper
+        return wrapper
+
+    def _new_wrapper(self, index: int):
+        """Creates the Scopul musical element of the event at index, without caching it"""
+        table = self._table
+        element = table.elements[index]
+        kind = table.event_kind(index)
+        onset = table.event_onset(index)
+        if element is None:
+            return self._wrapper_from_rows(index)
+        if kind == NOTE:
+            return Note(element, onset=onset)
+        if kind == CHORD:
+            return Chord(element, onset=onset)
+        return Rest(element, onset=onset)
+
+    def _wrapper_from_rows(self, index: int):
+        """Creates the Scopul musical element of an event from the table alone, without music21"""
+        table = self._table
+        rows = table.event_rows(index)
+        kind = table.kind[rows.start]
+        onset = table.onset[rows.start]
+        length = table.length[rows.start]
+        measure = table.event_measure(index)
+
+        if kind == REST:
+            return Rest(length=length, measure=measure, onset=onset)
+
+        velocities = [None if table.velocity[row] == -1 else table.velocity[row] for row in rows]
+        if kind == NOTE:
+            return Note(
+                pitch=table.pitch[rows.start],
+                length=length,
+                velocity=velocities[0],
+                measure=measure,
+                onset=onset,
+            )
+        return Chord(
+            pitches=[table.pitch[row] for row in rows],
+            length=length,
+            velocities=velocities,
+            measure=measure,
+            onset=onset,
+        )
+
+    def _invalidate(self) -> None:
+        """Drops the cached event table, called after every edit"""
+        self._table = None
+        self._wrappers = None
+
+    def _meta_changed(self) -> None:
+        """Called after an edit that may change the tempos or time signatures of the part"""
+        if self._score is not None:
+            self._score._drop_meta_events()
 
 
     # =========================================================================================== METHODS ====================================================================================================================
-    def get_chord_progression(self):
+    def get_chord_progression(self, engine: str = "music21"):
+        """Retrieves the chord progression of the part
+
+        Args:
+            engine: "music21" chordifies the part with music21. "fast" finds the chords with a sweep
+                line over the event table and labels them through a pitch class set lookup table
+
+        Returns:
+            A ChordProgression object
+
+        Raises:
+            PercussionChordifyError: if the part holds percussion notes
+        """
+        if self.event_table.percussion:
+            raise PercussionChordifyError("Cannot get chord progression for Percussion part")
         try:
-            return ChordProgression(self)
+            return ChordProgression(self, engine)
         except AttributeError:
             raise PercussionChordifyError("Cannot get chord progression for Percussion part")
         
     def delete(self, index: int = 0):
-        """Deletes a object at the index of self.sequence
+        """Deletes the top-level element at an index of the music21 part
+
+            The elements of a part are its measures (and the meta elements before them), so
+            delete(1) removes a whole measure. To delete the element at an index of self.sequence,
+            use edit().delete(index)
+
             Args:
-                index: an in
+                index: an int
         """
         self._part.pop(index)
-        
+        self._invalidate()
+        # The measure may hold a tempo or a time signature, and the next ones moved
+        self._meta_changed()
+
     def insert(self, element, measure_number: int = None, position: int = 0):
         """Inserts a musical element into the current part at a certain location
 
+            Only the target measure is edited, the barlines stay where they are. A note longer
+            than the space left in the measure is split at the barline and tied into the next
+            measures (added after the last one if needed). A time signature bars the part again
+            from its measure on
+
             Args:
-                element: a Note, Rest or Chord object
-                measure_number: an int
+                element: a Note, Rest, Chord, Tempo or TimeSignature object
+                measure_number: an int, default is the measure of the last element
                 position: an int, the offset of the note within the measure
             Returns:
                 None
             
         """
-        if not isinstance(element, (Note, Rest, Chord, TimeSignature, Tempo)):
-            raise ValueError(f"{type(element)} is not a Scopul musical element (Notes, Rests, Chords, Tempo, TimeSignature)")
-        
-        if not measure_number:
-            # If no measure number is provided, add the element to the last measure in the part
-            measure_number = self.sequence[-1].measure
+        self.insert_many([(element, measure_number, position)])
 
-        new_part = music21.stream.Stream()
+    def insert_many(self, insertions: Iterable):
+        """Inserts many musical elements at once, the part is re-measured only once at the end
 
-        # copying into new part with modified time
-        element_added = False
-        for measure in self._part.getElementsByClass("Measure"):
+            Args:
+                insertions: an iterable of (element, measure_number, position) tuples, as the
+                    arguments of insert(). measure_number and position may be left out
+            Returns:
+                None
+        """
+        with self.edit() as tx:
+            for insertion in insertions:
+                tx.insert(*insertion)
 
-            if measure.number == measure_number and not element_added:
-                measure.insert(position, deepcopy(element.music21))
-                element_added = True
+    def edit(self) -> PartEdit:
+        """Starts a batch of edits, applied together when the with block ends
 
-            new_part.append(measure)
+            with part.edit() as tx:
+                tx.insert(Note(name="C5"), 3, 0)
+                tx.insert_tempo(90, 5)
+                tx.delete(10)
 
-        new_part = new_part.makeMeasures()
-        self._part.replace(self._part, new_part)
+        Edits are checked before anything is applied, and the part is restored if one fails.
+        See PartEdit
 
-    # Note list
-    def get_notes(self) -> list:
-        """Retrieves all the notes in a given sequence
+        Returns:
+            A PartEdit
+        """
+        return PartEdit(self)
+
+    def _measures(self) -> dict:
+        """Returns a dict of measure number -> music21 Measure, the first one for repeated numbers"""
+        measures = {}
+        for measure in self._part.getElementsByClass("Measure"):
+            measures.setdefault(measure.number, measure)
+        return measures
+
+    def _music21_table(self) -> EventTable:
+        """Returns the event table, read again from music21 if it was not (its events have no music21 objects)"""
+        if self._table is not None and not self._table.from_music21_part:
+            # The music21 part is built from the table before the table is dropped
+            part = self._part
+            self._table = EventTable.from_music21(part)
+            self._wrappers = [None] * len(self._table)
+        return self.event_table
+
+    def _snapshot(self, measure_numbers: set, deletions: list) -> tuple:
+        """Copies what _apply_edits() may change: the touched measures, the offsets of every measure
+        and the deleted elements that are not in a measure"""
+        measures = self._measures()
+        table = self.event_table
+        saved = {number: deepcopy(measures[number]) for number in measure_numbers if number in measures}
+        offsets = [(measure, measure.offset) for measure in self._part.getElementsByClass("Measure")]
+        loose = [
+            (table.elements[index], table.event_onset(index))
+            for index in deletions
+            if table.event_measure(index) is None
+        ]
+        return saved, offsets, loose
+
+    def _restore(self, snapshot: tuple) -> None:
+        """Puts back a snapshot taken by _snapshot()"""
+        saved, offsets, loose = snapshot
+
+        # Measures barred again by the edit are replaced by the measures they came from
+        current = {id(measure) for measure in self._part.getElementsByClass("Measure")}
+        original = {id(measure) for measure, _ in offsets}
+        for measure in list(self._part.getElementsByClass("Measure")):
+            if id(measure) not in original:
+                self._part.remove(measure)
+        for measure, offset in offsets:
+            if id(measure) in current:
+                self._part.setElementOffset(measure, offset)
+            else:
+                self._part.insert(offset, measure)
+
+        measures = self._measures()
+        for number, measure in saved.items():
+            self._part.replace(measures[number], measure)
+
+        for element, onset in loose:
+            if element.activeSite is not self._part:
+                self._part.insert(onset, element)
+
+        self._part.coreElementsChanged()
+        self._invalidate()
+
+    def _apply_edits(self, insertions: dict, deletions: list) -> None:
+        """Applies checked edits to the music21 part, then patches the event table
 
         Args:
-            seq: a list of Scopul musical symbols (Rest, Chord, Note)
+            insertions: a dict of measure number -> list of (position, Scopul element)
+            deletions: a list of event indices
+        """
+        from music21 import note
+
+        measures = list(self._part.getElementsByClass("Measure"))
+        lengths = self._bar_lengths(measures)
+        by_number = self._measures()
+        table = self.event_table
+
+        # Deletions first, while the indices still match the table
+        touched = set(insertions)
+        loose = False
+        for index in deletions:
+            number = table.event_measure(index)
+            if number is None:
+                self._part.remove(table.elements[index], recurse=True)
+                loose = True
+            else:
+                by_number[number].remove(table.elements[index], recurse=True)
+                touched.add(number)
+
+        added = []
+        for measure_number, elements in insertions.items():
+            idx = measures.index(by_number[measure_number])
+            for position, element in elements:
+                touched.update(self._place(measures, lengths, idx, position, deepcopy(element.music21), added))
+
+        # Measures added after the last one are filled with a rest
+        for measure in added:
+            if measure.highestTime < lengths[-1]:
+                measure.insert(measure.highestTime, note.Rest(quarterLength=lengths[-1] - measure.highestTime))
+
+        # Measures holding a new time signature no longer line up with the barlines: the part is
+        # barred again from the first of them on
+        metered = [
+            measures.index(by_number[number])
+            for number, elements in insertions.items()
+            if any(isinstance(element, TimeSignature) for _, element in elements)
+        ]
+        if metered:
+            self._rebar(measures, min(metered))
+            self._invalidate()
+        elif loose:
+            self._invalidate()
+        else:
+            self._splice_measures(sorted(touched))
+
+    @staticmethod
+    def _bar_lengths(measures: list) -> list:
+        """Returns the length of every measure, up to the start of the next one"""
+        lengths = [later.offset - measure.offset for measure, later in zip(measures, measures[1:])]
+        if measures:
+            lengths.append(max(measures[-1].highestTime, measures[-1].barDuration.quarterLength))
+        return lengths
+
+    def _spanned(self, measure_number: int, position: float, length: float) -> list:
+        """Returns the numbers of the measures an element inserted in a measure may reach, see _place()"""
+        measures = list(self._part.getElementsByClass("Measure"))
+        lengths = self._bar_lengths(measures)
+        idx = measures.index(self._measures()[measure_number])
+        numbers = [measures[idx].number]
+        end = position + length
+        while end > lengths[idx] and idx + 1 < len(measures):
+            end -= lengths[idx]
+            idx += 1
+            numbers.append(measures[idx].number)
+        return numbers
+
+    def _place(self, measures: list, lengths: list, idx: int, position: float, element, added: list) -> list:
+        """Inserts a music21 element into measures[idx], the barlines staying where they are
+
+        A note, chord or rest placed past the end of the measure goes to the measure it falls in.
+        One longer than the space left is split at the barlines and its pieces are tied, new measures
+        are added after the last one if needed (appended to measures, lengths and added)
 
         Returns:
-            a list of note objects extracted from the list
-
-        Raises:
-            InvalidMusicElementError: if found a type that is not Rest, Note or Chord
+            The numbers of the measures edited
+        """
+        from music21 import note, stream
+
+        def next_measure(idx: int) -> int:
+            if idx + 1 == len(measures):
+                measure = stream.Measure(number=measures[-1].number + 1)
+                self._part.insert(measures[-1].offset + lengths[-1], measure)
+                measures.append(measure)
+                lengths.append(lengths[-1])
+                added.append(measure)
+            return idx + 1
+
+        edited = []
+        if isinstance(element, note.GeneralNote) and element.quarterLength:
+            while position >= lengths[idx]:
+                position -= lengths[idx]
+                idx = next_measure(idx)
+
+            while position + element.quarterLength > lengths[idx]:
+                head, element = element.splitAtQuarterLength(lengths[idx] - position)
+                measures[idx].insert(position, head)
+                edited.append(measures[idx].number)
+                position = 0.0
+                idx = next_measure(idx)
+
+        measures[idx].insert(position, element)
+        edited.append(measures[idx].number)
+        return edited
+
+    def _rebar(self, measures: list, start: int) -> None:
+        """Bars again the measures of the part from measures[start] on, after a time signature was
+        inserted in it
+
+        Their elements keep their offsets and are copied into new measures, numbered from the number
+        of measures[start]. Every time signature starts a measure: one inserted in the middle of a
+        measure ends that measure early, as in MeasureMap. Notes and rests crossing a barline are split
+        and tied, the last measure is filled with a rest and empty measures are left out. The old
+        measures are only removed from the part, so a snapshot can put them back
+        """
+        from music21 import common, meter, note, stream
+
+        first = measures[start]
+        origin = first.offset
+
+        # The bar length in effect before the first measure, 4/4 if the part has no time signature
+        bar_length = 4.0
+        for measure in reversed(measures[:start]):
+            time_sigs = measure.getElementsByClass("TimeSignature")
+            if time_sigs:
+                bar_length = time_sigs.last().barDuration.quarterLength
+                break
+
+        elements = []
+        for measure in measures[start:]:
+            flat = deepcopy(measure).flatten()
+            for element in flat:
+                if not isinstance(element, stream.Stream):
+                    elements.append((common.opFrac(measure.offset - origin + flat.elementOffset(element)), element))
+        elements.sort(key=lambda item: item[0])
+
+        # A time signature inserted on the offset of another replaces it
+        time_sigs = {}
+        for offset, element in elements:
+            if isinstance(element, meter.TimeSignature):
+                time_sigs[offset] = element
+        elements = [
+            (offset, element)
+            for offset, element in elements
+            if not isinstance(element, meter.TimeSignature) or time_sigs[offset] is element
+        ]
+
+        end = max(
+            (common.opFrac(offset + element.quarterLength) for offset, element in elements
+             if isinstance(element, note.GeneralNote)),
+            default=0.0,
+        )
+
+        # (start, length) of every new measure, relative to origin
+        bars = []
+        changes = sorted(time_sigs.items())
+        position = 0.0
+        while position < end:
+            while changes and changes[0][0] <= position:
+                bar_length = changes.pop(0)[1].barDuration.quarterLength
+            length = bar_length
+            if changes and changes[0][0] < position + length:
+                length = common.opFrac(changes[0][0] - position)
+            bars.append((position, length))
+            position = common.opFrac(position + length)
+        if not bars:
+            bars.append((0.0, bar_length))
+        starts = [bar_start for bar_start, _ in bars]
+
+        rebarred = [stream.Measure(number=first.number + idx) for idx in range(len(bars))]
+        for offset, element in elements:
+            idx = max(bisect_right(starts, offset) - 1, 0)
+            if not isinstance(element, note.GeneralNote):
+                rebarred[idx].insert(min(offset - bars[idx][0], bars[idx][1]), element)
+                continue
+
+            # Split at every barline it crosses, the pieces are tied
+            while idx + 1 < len(bars) and offset + element.quarterLength > starts[idx + 1]:
+                head, element = element.splitAtQuarterLength(starts[idx + 1] - offset)
+                rebarred[idx].insert(offset - bars[idx][0], head)
+                offset = starts[idx + 1]
+                idx += 1
+            rebarred[idx].insert(offset - bars[idx][0], element)
+
+        last = rebarred[-1]
+        filled = last.highestTime
+        if filled < bars[-1][1]:
+            last.insert(filled, note.Rest(quarterLength=bars[-1][1] - filled))
+
+        for measure in measures[start:]:
+            self._part.remove(measure)
+        for (bar_start, _), measure in zip(bars, rebarred):
+            self._part.insert(origin + bar_start, measure)
+        self._part.coreElementsChanged()
+
+    def _splice_measures(self, measure_numbers: list) -> None:
+        """Updates the cached event table after edits to some measures
+
+        The edited measures are read again from music21, the other rows are kept as they are.
+        The table is dropped when it cannot be patched (tables not read from music21, or unordered measures)
         """
-        seq = self.sequence
-        # Notes list
-        notes = []
+        table = self._table
+        if table is None:
+            return
 
-        # If not a iterable, raise error
-        if not isinstance(seq, Iterable):
-            raise TypeError(
-                "Not an iterable. Include a iterable object of Scopul Rests, Chords or Note"
-            )
+        if not table.from_music21_part or not table.sorted_by_measure():
+            self._invalidate()
+            return
+
+        measures = {}
+        for measure in self._part.getElementsByClass("Measure"):
+            measures.setdefault(measure.number, measure)
 
-        # loop through the sequence
-        for idx, element in enumerate(seq):
-            # If its not a scopul sequence, raise error
-            if not isinstance(element, (Chord, Rest, Note)):
-                raise InvalidMusicElementError(
-                    f"Please include a valid Scopul Sequence that contains Chord, Rest or Note objects. Invalid type found : {type(element)} at index {idx}"
-                )
-            # Append to list
-            if isinstance(element, Note):
-                notes.append(element)
+        # From the last measure to the first, so the event indices of the next splices stay valid
+        for number in reversed(measure_numbers):
+            measure = measures[number]
+            events = table.measure_events(number)
+            rows = EventTable.from_music21(measure, offset=float(measure.offset))
+            table.splice(events.start, events.stop, rows)
+            self._wrappers[events.start:events.stop] = [None] * len(rows)
 
-        return notes
+    # Note list
+    def get_notes(self) -> list:
+        """Retrieves all the notes in the part
+
+        Returns:
+            a list of note objects extracted from the part
+        """
+        return [self._wrapper(idx) for idx in self.event_table.indices_of(NOTE)]
 
     # Gets a count of notes
     def get_note_count(self) -> int:
         """Retrieves the number of notes"""
-        return len(self.get_notes())
+        return self.stats().note_count
 
-    # Note list
+    # Rest list
     def get_rests(self) -> list:
-        """Retrieves all the notes in a given sequence
-
-        Args:
-            seq: a list of Scopul musical symbols (Rest, Chord, Note)
+        """Retrieves all the rests in the part
 
         Returns:
-            a list of rest objects extracted from the list
-
-        Raises:
-            InvalidMusicElementError: if found a type that is not Rest, Note or Chord
+            a list of rest objects extracted from the part
         """
-        seq = self.sequence
-        # rests list
-        rests = []
-
-        # If not a iterable, raise error
-        if not isinstance(seq, Iterable):
-            raise TypeError(
-                "Not an iterable. Include a iterable object of Scopul Rests, Chords or Note"
-            )
-
-        # loop through the sequence
-        for idx, element in enumerate(seq):
-            # If its not a scopul sequence, raise error
-            if not isinstance(element, (Chord, Rest, Note)):
-                raise InvalidMusicElementError(
-                    f"Please include a valid Scopul Sequence that contains Chord, Rest or Note objects. Invalid type found : {type(element)} at index {idx}"
-                )
-            # Append to list
-            if isinstance(element, Note):
-                rests.append(element)
-
-        return rests
+        return [self._wrapper(idx) for idx in self.event_table.indices_of(REST)]
 
     # Gets a count of rests
     def get_rest_count(self) -> int:
         """Retrieves the number of rests"""
-        return len(self.get_rests())
-
-        # Note list
+        return self.stats().rest_count
 
+    # Chord list
     def get_chords(self) -> list:
-        """Retrieves all the chords in a given sequence
-
-        Args:
-            seq: a list of Scopul musical symbols (Rest, Chord, Note)
+        """Retrieves all the chords in the part
 
         Returns:
-            a list of chords objects extracted from the list
-
-        Raises:
-            InvalidMusicElementError: if found a type that is not Rest, Note or Chord
+            a list of chords objects extracted from the part
         """
-        seq = self.sequence
-        # chords list
-        chords = []
+        return [self._wrapper(idx) for idx in self.event_table.indices_of(CHORD)]
 
-        # If not a iterable, raise error
-        if not isinstance(seq, Iterable):
-            raise TypeError(
-                "Not an iterable. Include a iterable object of Scopul Rests, Chords or Note"
-            )
+    # Gets a count of chords
+    def get_chord_count(self) -> int:
+        """Retrieves the number of chords"""
+        return self.stats().chord_count
 
-        # loop through the sequence
-        for idx, element in enumerate(seq):
-            # If its not a scopul sequence, raise error
-            if not isinstance(element, (Chord, Rest, Note)):
-                raise InvalidMusicElementError(
-                    f"Please include a valid Scopul Sequence that contains Chord, Rest or Note objects. Invalid type found : {type(element)} at index {idx}"
-                )
-            # Append to list
-            if isinstance(element, Note):
-                chords.append(element)
+    def stats(self) -> EventStats:
+        """Computes the counts of notes, rests and chords, the sounding duration, the note density
+        per measure and the velocity distribution in one pass over the event table. See EventStats
 
-        return chords
+        The result is kept until the part is edited
 
-    # Gets a count of notes
-    def get_chord_count(self) -> int:
-        """Retrieves the number of notes"""
-        return len(self.get_chords())
+        Returns:
+            An EventStats object
+        """
+        table = self.event_table
+        if self._stats is None or self._stats[0] is not table or self._stats[1] != table.version:
+            self._stats = (table, table.version, event_stats([table]))
+        return self._stats[2]
 
     def get_measure(self, measures: int | list):
         """Fetches the contents of a measure.
@@ -247,11 +637,7 @@ class Part:
             if measures <= 0:
                 raise ValueError("get_measure only allows positive integers")
 
-            seq = []
-            for element in self.sequence:
-                if element.measure == measures:
-                    seq.append(element)
-            return seq
+            start, end = measures, measures
 
         # If list
         elif isinstance(measures, Iterable):
@@ -265,11 +651,7 @@ class Part:
             if len(measures) != 2:
                 raise ValueError("usage: get_measure([start, end])")
 
-            seq = []
-            for element in self.sequence:
-                if element.measure in range(measures[0], measures[1] + 1):
-                    seq.append(element)
-            return seq
+            start, end = measures
 
         # Incorrect type
         else:
@@ -277,48 +659,126 @@ class Part:
                 f"get_measure only accepts int or iterable, instead got {type(measures)}"
             )
 
+        return [self._wrapper(idx) for idx in self.event_table.measure_range(start, end)]
+
+    def iter_events(self, kinds: Iterable = None, start_measure: int = None, end_measure: int = None):
+        """Yields the chords, notes and rests of the part lazily, in onset order
+
+        Elements are created as they are yielded and are not kept by the part, so a huge part can
+        be streamed through without building part.sequence
+
+        Args:
+            kinds: the types of elements to yield, Note, Rest and Chord (or "n", "r" and "c"), default is all
+            start_measure: the first measure to yield, default is the first of the part
+            end_measure: the last measure to yield (included), default is the last of the part
+
+        Yields:
+            Note, Rest and Chord objects
+        """
+        for _, idx in self._iter_indices(kinds, start_measure, end_measure):
+            wrapper = self._wrappers[idx]
+            yield wrapper if wrapper is not None else self._new_wrapper(idx)
+
+    def _iter_indices(self, kinds: Iterable = None, start_measure: int = None, end_measure: int = None):
+        """Yields (onset, event index) for iter_events(), one measure at a time"""
+        table = self.event_table
+        wanted = _kind_codes(kinds)
+
+        if start_measure is None and end_measure is None:
+            runs = _measure_runs(table)
+        else:
+            numbers, measure_runs = table.measure_index()
+            lo = 0 if start_measure is None else bisect_left(numbers, start_measure)
+            hi = len(numbers) if end_measure is None else bisect_right(numbers, end_measure)
+            runs = sorted(run for runs_of_measure in measure_runs[lo:hi] for run in runs_of_measure)
+
+        onset = table.onset
+        starts = table.starts
+        kind = table.kind
+        for first, end in runs:
+            # Events are in onset order within a voice, voices of a measure are merged here
+            for idx in sorted(range(first, end), key=lambda idx: (onset[starts[idx]], idx)):
+                if wanted is None or kind[starts[idx]] in wanted:
+                    yield onset[starts[idx]], idx
+
+    def iter_measures(self):
+        """Yields the measures of the part in order, from the measure index of the event table
+
+        Yields:
+            Tuples (measure_number, elements), elements being the list of chords, notes and rests of the measure
+        """
+        table = self.event_table
+        numbers, runs = table.measure_index()
+        for number, measure_runs in zip(numbers, runs):
+            yield number, [self._wrapper(idx) for first, end in measure_runs for idx in range(first, end)]
+
     def get_highest_note(self):
-        """Retrieves all the chords in a given sequence
+        """Retrieves the highest note in the part, notes inside chords included
+
+        Returns:
+            a Note object, or 0 if the part has no notes
+        """
+        return self._extreme_note(highest=True)
+
+    def get_lowest_note(self):
+        """Retrieves the lowest note in the part, notes inside chords included
+
+        Returns:
+            a Note object, or 0 if the part has no notes
+        """
+        return self._extreme_note(highest=False)
+
+    def _extreme_note(self, highest: bool):
+        """Finds the first highest or lowest note with numpy, on the pitch column of the event table"""
+        import numpy as np
+
+        table = self.event_table
+        pitch = np.asarray(table.pitch, dtype=np.int16)
+        sounding = np.flatnonzero(pitch >= 0)
+        if sounding.size == 0:
+            return 0
+
+        pitches = pitch[sounding]
+        row = int(sounding[np.argmax(pitches) if highest else np.argmin(pitches)])
+        idx = table.group[row]
+
+        element = self._wrapper(idx)
+        if table.event_kind(idx) == CHORD:
+            return element.notes[row - table.starts[idx]]
+        return element
+
+    def key_timeline(self, window_measures: int = 4, hop: int = 1) -> list:
+        """Estimates the key of every window of measures, to find modulations
+
+        Pitch class histograms (weighted by duration) are computed once per measure, the windows
+        are slid with prefix sums and correlated with the 24 Krumhansl-Kessler key profiles at once
 
         Args:
-            seq: a list of Scopul musical symbols (Rest, Chord, Note)
+            window_measures: the number of measures in a window
+            hop: the number of measures between the starts of two windows
 
         Returns:
-            a list of chords objects extracted from the list
+            A list of (measure, key, confidence) where measure is the first measure of the window,
+            key is formatted like Scopul.key ("E- major", None for windows without notes) and
+            confidence is the correlation with the key profile
 
         Raises:
-            InvalidMusicElementError: if found a type that is not Rest, Note or Chord
+            ValueError: if window_measures or hop is not a positive integer
         """
-        seq = self.sequence
-        # highest note
-        highest = 0
+        return key_timeline([self.event_table], window_measures, hop)
 
-        # If not a list, raise error
-        if not isinstance(seq, Iterable):
-            raise TypeError(
-                "Not a list. Include a list of Scopul Rests, Chords or Note"
-            )
+    def pitch_stats(self) -> PitchStats:
+        """Computes the pitch statistics of the part with numpy: highest and lowest pitch, ambitus,
+        pitch class histogram and per measure min/max/mean. See PitchStats
 
-        # loop through the sequence
-        for idx, element in enumerate(seq):
-            if not isinstance(element, (Chord, Rest, Note)):
-                raise InvalidMusicElementError(
-                    f"Please include a valid Scopul Sequence that contains Chord, Rest or Note objects. Invalid type found : {type(element)} at index {idx}"
-                )
-            # Append to list
-            if isinstance(element, Note):
-                if highest == 0:
-                    highest = element
-                else:
-                    note_val = note_to_number(element.name[0], int(element.name[1]))
-                    if note_val > note_to_number(highest.name[0], int(highest.name[1])):
-                        highest = element
-
-        return highest
+        Returns:
+            A PitchStats object
+        """
+        return pitch_stats([self.event_table])
 
     # rhythm -> List of rhythm
     # gets a list of all the occurrences of a rhythm in the current part
-    def search_rhythm(self, rhythm: Iterable):
+    def search_rhythm(self, rhythm: Iterable, overlap: bool = False):
         """gets a list of all the occurrences of a rhythm in the current part
 
         Args:
@@ -340,6 +800,8 @@ class Part:
                         c: Chord
                         n: Note
 
+            overlap: whether occurrences may overlap, default is False
+
             Returns:
                 a list of lists, with each list containing the Scopul musical element objects that satisfy the rhythm:
                 For Example:
@@ -347,66 +809,26 @@ class Part:
 
                     >>> [[Scopul.Note, Scopul.Note, Scopul.Rest], [Scopul.Rest, Scopul.Rest, Scopul.Chord]] # Sample output
         """
+        return self.search_rhythms([rhythm], overlap=overlap)[0]
 
-        # Creating the note type list
-        type_list = []
-
-        for note in rhythm:
-            try:
-                if note[0] not in ["r", "c", "n"]:
-                    raise TypeError # Potential idea ("Incorrect note type found. Note types include: 'r' (Rests), 'n' (Notes) or 'c' (Chords)")
-
-                type_list.append(note[0])
-
-            except TypeError:
-                type_list.append(None)
-
-        # Create rhythm type regex
-        type_regex = [re.escape(x) if x is not None else "." for x in type_list]
-        type_regex = "^" + "".join(type_regex) + "$"
-
-        # Creating rhythm list
-        rhythm_list = []
-
-        for note in rhythm:
-            try:
-                rhythm_list.append(note[-1])
-
-            except TypeError:
-                rhythm_list.append(note)
-
-        # Filtering part by rhythm
-
-        seq_element_list = [element for element in self.sequence]
-        seq_ql_list = [element.music21.quarterLength for element in self.sequence]
-
-        # Use the sublist function to find all occurrences of the given rhythm in the sequence
-        rhythm_indices = sublist(seq_ql_list, rhythm_list, overlap=False)
-
-        # Extract the sublists of elements that correspond to the found rhythmic patterns
-        rhythm_list = [seq_element_list[i[0] : i[-1] + 1] for i in rhythm_indices]
-
-        # Filter part by note types
-        final_list = []
-        for sequence in rhythm_list:
-            # Comparing rhythm type regex to sequence note types
-            match = re.match(
-                type_regex,
-                "".join(
-                    [
-                        "c"
-                        if type(element) == Chord
-                        else "r"
-                        if type(element) == Rest
-                        else "n"
-                        for element in sequence
-                    ]
-                ),
-            )
-            if match:
-                final_list.append(sequence)
-
-        # Return the list of rhythmic patterns
-        return final_list
+    def search_rhythms(self, rhythms: Iterable, overlap: bool = False) -> list:
+        """Searches many rhythms at once, reading the part a single time
 
+        Args:
+            rhythms: a list of rhythms, in the format accepted by search_rhythm()
+            overlap: whether occurrences of a rhythm may overlap, default is False
 
+        Returns:
+            A list with, for every rhythm, the same list search_rhythm() would return
+        """
+        table = self.event_table
+        searcher = RhythmSearch(rhythms)
+        matches = searcher.search(table.event_lengths(), table.event_kinds(), overlap=overlap)
+
+        return [
+            [
+                [self._wrapper(idx) for idx in range(start, start + len(lengths))]
+                for start in starts
+            ]
+            for lengths, starts in zip(searcher.lengths, matches)
+        ]
@@ -0,0 +1,181 @@
+from bisect import bisect_right
+from math import floor
+from numbers import Real
+from Scopul.mido_loader import MeasureMap, EPSILON
+
+# MIDI files without a tempo at the start are at 120 bpm
+DEFAULT_TEMPO = 500000
+
+
+class TempoMap:
+    """Converts positions of a score between ticks, quarter offsets, seconds and (measure, beat)
+
+    Built once from the tempo and time signature events of a score: the time in seconds at which
+    every tempo starts is summed up front, so a conversion is a binary search. Every method takes a
+    number, or an iterable of numbers (converted together with numpy, returning numpy arrays)
+
+    Args:
+        tempos: a list of (offset, midi tempo, measure)
+        time_sigs: a list of (offset, numerator, denominator, measure)
+        ticks_per_beat: the resolution of the MIDI file, None if unknown
+    """
+
+    def __init__(self, tempos: list, time_sigs: list, ticks_per_beat: int = None) -> None:
+        # Segments of constant tempo: start offset, start time in seconds and midi tempo
+        self.offsets = [0.0]
+        self.seconds = [0.0]
+        self.tempos = [DEFAULT_TEMPO]
+
+        for offset, midi_tempo, _ in sorted(tempos, key=lambda event: event[0]):
+            # A tempo on the same offset replaces the previous one
+            if offset <= self.offsets[-1] + EPSILON:
+                self.tempos[-1] = midi_tempo
+                continue
+
+            self.seconds.append(self.seconds[-1] + (offset - self.offsets[-1]) * self.tempos[-1] / 1e6)
+            self.offsets.append(offset)
+            self.tempos.append(midi_tempo)
+
+        # The time signatures of the score as they are, without the 4/4 MeasureMap assumes when there is none
+        self.time_sigs = [
+            (offset, numerator, denominator) for offset, numerator, denominator, _ in sorted(time_sigs, key=lambda event: event[0])
+        ]
+        self.measure_map = MeasureMap(self.time_sigs)
+        self.ticks_per_beat = ticks_per_beat
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @staticmethod
+    def _segments(bounds: list, values):
+        """Returns the index of the segment (starting at bounds) of every value"""
+        if isinstance(values, Real):
+            return max(bisect_right(bounds, values + EPSILON) - 1, 0)
+
+        import numpy as np
+
+        return np.maximum(np.searchsorted(bounds, values + EPSILON, side="right") - 1, 0)
+
+    @staticmethod
+    def _columns(*columns):
+        """Returns columns as numpy arrays, to be indexed by the result of _segments()"""
+        import numpy as np
+
+        return [np.asarray(column, dtype=np.float64) for column in columns]
+
+    @staticmethod
+    def _values(values):
+        if isinstance(values, Real):
+            return values
+
+        import numpy as np
+
+        return np.asarray(values, dtype=np.float64)
+
+    def offset_to_seconds(self, offsets):
+        """Converts quarter offsets to seconds"""
+        offsets = self._values(offsets)
+        seg = self._segments(self.offsets, offsets)
+        if isinstance(offsets, Real):
+            return self.seconds[seg] + (offsets - self.offsets[seg]) * self.tempos[seg] / 1e6
+
+        starts, seconds, tempos = self._columns(self.offsets, self.seconds, self.tempos)
+        return seconds[seg] + (offsets - starts[seg]) * tempos[seg] / 1e6
+
+    def seconds_to_offset(self, seconds):
+        """Converts seconds to quarter offsets"""
+        seconds = self._values(seconds)
+        seg = self._segments(self.seconds, seconds)
+        if isinstance(seconds, Real):
+            return self.offsets[seg] + (seconds - self.seconds[seg]) * 1e6 / self.tempos[seg]
+
+        starts, times, tempos = self._columns(self.offsets, self.seconds, self.tempos)
+        return starts[seg] + (seconds - times[seg]) * 1e6 / tempos[seg]
+
+    def _resolution(self) -> int:
+        if self.ticks_per_beat is None:
+            raise ValueError("ticks can not be converted, the resolution of the file is unknown")
+        return self.ticks_per_beat
+
+    def ticks_to_offset(self, ticks):
+        """Converts MIDI ticks to quarter offsets"""
+        return self._values(ticks) / self._resolution()
+
+    def offset_to_ticks(self, offsets):
+        """Converts quarter offsets to MIDI ticks, rounded to the nearest tick"""
+        ticks = self._values(offsets) * self._resolution()
+        if isinstance(ticks, Real):
+            return round(ticks)
+        return ticks.round().astype("int64")
+
+    def ticks_to_seconds(self, ticks):
+        """Converts MIDI ticks to seconds"""
+        return self.offset_to_seconds(self.ticks_to_offset(ticks))
+
+    def seconds_to_ticks(self, seconds):
+        """Converts seconds to MIDI ticks, rounded to the nearest tick"""
+        return self.offset_to_ticks(self.seconds_to_offset(seconds))
+
+    def offset_to_measure_beat(self, offsets) -> tuple:
+        """Converts quarter offsets to measure numbers and beats
+
+        Beats start at 1 and are counted in the unit of the time signature (eighths in 6/8)
+
+        Returns:
+            A tuple (measure, beat), of numpy arrays for an iterable of offsets
+        """
+        measure_map = self.measure_map
+        offsets = self._values(offsets)
+        seg = self._segments(measure_map.starts, offsets)
+        if isinstance(offsets, Real):
+            elapsed = offsets - measure_map.starts[seg]
+            bars = floor(elapsed / measure_map.bar_lengths[seg] + EPSILON)
+            beat = (elapsed - bars * measure_map.bar_lengths[seg]) / measure_map.beat_lengths[seg] + 1
+            return measure_map.measures[seg] + bars, beat
+
+        import numpy as np
+
+        starts, measures, bar_lengths, beat_lengths = self._columns(
+            measure_map.starts, measure_map.measures, measure_map.bar_lengths, measure_map.beat_lengths
+        )
+        elapsed = offsets - starts[seg]
+        bars = np.floor(elapsed / bar_lengths[seg] + EPSILON)
+        beat = (elapsed - bars * bar_lengths[seg]) / beat_lengths[seg] + 1
+        return (measures[seg] + bars).astype(np.int64), beat
+
+    def measure_beat_to_offset(self, measures, beats=1.0):
+        """Converts measure numbers and beats (starting at 1) to quarter offsets"""
+        measure_map = self.measure_map
+        if isinstance(measures, Real) and isinstance(beats, Real):
+            seg = max(bisect_right(measure_map.measures, measures) - 1, 0)
+            return (
+                measure_map.starts[seg]
+                + (measures - measure_map.measures[seg]) * measure_map.bar_lengths[seg]
+                + (beats - 1) * measure_map.beat_lengths[seg]
+            )
+
+        import numpy as np
+
+        measures = np.asarray(measures, dtype=np.float64)
+        beats = np.asarray(beats, dtype=np.float64)
+        seg = np.maximum(np.searchsorted(measure_map.measures, measures, side="right") - 1, 0)
+        starts, firsts, bar_lengths, beat_lengths = self._columns(
+            measure_map.starts, measure_map.measures, measure_map.bar_lengths, measure_map.beat_lengths
+        )
+        return starts[seg] + (measures - firsts[seg]) * bar_lengths[seg] + (beats - 1) * beat_lengths[seg]
+
+    def seconds_to_measure_beat(self, seconds) -> tuple:
+        """Converts seconds to measure numbers and beats, see offset_to_measure_beat()"""
+        return self.offset_to_measure_beat(self.seconds_to_offset(seconds))
+
+    def table_times(self, table) -> tuple:
+        """Converts the rows of an EventTable to seconds
+
+        Returns:
+            A tuple (starts, ends) of numpy arrays, aligned with the rows of the table
+        """
+        import numpy as np
+
+        onsets = np.asarray(table.onset, dtype=np.float64)
+        ends = onsets + np.asarray(table.note_length, dtype=np.float64)
+        return self.offset_to_seconds(onsets), self.offset_to_seconds(ends)
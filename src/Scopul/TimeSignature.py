@@ -1,5 +1,3 @@
-from music21 import meter, converter, stream, note, chord, midi, tempo
-from Scopul.scopul_exception import MeasureNotFoundException
 import re
 
 # A container class, whose job is to store data nicely
@@ -10,8 +8,25 @@ class TimeSignature:
         Args:
             scopul: A Scopul Object
         """
-        self.music21 = meter.TimeSignature(value=value)
-        self.ratio = f"{self.music21.numerator}/{self.music21.denominator}"
-        self.numerator = int(self.ratio.split("/")[0])
-        self.denominator = int(self.ratio.split("/")[1])
+        self._music21 = None
+        self._value = value
+
+        # Simple ratios are read directly, anything else is left to music21
+        if re.fullmatch(r"\s*\d+\s*/\s*\d+\s*", value):
+            numerator, denominator = value.split("/")
+            self.numerator = int(numerator)
+            self.denominator = int(denominator)
+        else:
+            self.numerator = self.music21.numerator
+            self.denominator = self.music21.denominator
+        self.ratio = f"{self.numerator}/{self.denominator}"
         self.measure = measure
+
+    @property
+    def music21(self):
+        """Returns a music21 TimeSignature, created on first access"""
+        if self._music21 is None:
+            from music21 import meter
+
+            self._music21 = meter.TimeSignature(value=self._value)
+        return self._music21
@@ -0,0 +1,231 @@
+from Scopul.MusicalElements import Note, Rest, Chord
+from Scopul.TimeSignature import TimeSignature
+from Scopul.Tempo import Tempo
+from Scopul.scopul_exception import MeasureNotFoundException
+
+
+class PartEdit:
+    """A batch of edits to a Part, created by Part.edit()
+
+    Edits are queued, then checked against the event table of the part and applied together
+    when the with block ends (or when commit() is called). Only the measures holding an edit are
+    read again. If applying an edit fails, the part is restored as it was before the batch
+
+    Args:
+        part: a Scopul Part
+    """
+
+    def __init__(self, part) -> None:
+        self.part = part
+        # (element, measure_number, position)
+        self._insertions = []
+        # event indices in part.sequence, as it was before the batch
+        self._deletions = []
+        self._snapshot = None
+
+    def __enter__(self) -> "PartEdit":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            # The block failed before anything was applied
+            self.discard()
+        return False
+
+    def __len__(self) -> int:
+        return len(self._insertions) + len(self._deletions)
+
+    def insert(self, element, measure_number: int = None, position: float = 0) -> None:
+        """Queues an insertion, see Part.insert()"""
+        if not isinstance(element, (Note, Rest, Chord, TimeSignature, Tempo)):
+            raise ValueError(f"{type(element)} is not a Scopul musical element (Notes, Rests, Chords, Tempo, TimeSignature)")
+        self._insertions.append((element, measure_number, position))
+
+    def insert_tempo(self, tempo, measure_number: int = None, position: float = 0) -> None:
+        """Queues a tempo change
+
+        Args:
+            tempo: a Tempo object, or a bpm
+        """
+        if not isinstance(tempo, Tempo):
+            if not isinstance(tempo, (int, float)) or tempo <= 0:
+                raise ValueError("Tempo must be a positive number")
+            tempo = Tempo(tempo)
+        self.insert(tempo, measure_number, position)
+
+    def insert_time_signature(self, time_sig, measure_number: int = None, position: float = 0) -> None:
+        """Queues a time signature change
+
+        Args:
+            time_sig: a TimeSignature object, or a str like "3/4"
+        """
+        if not isinstance(time_sig, TimeSignature):
+            time_sig = TimeSignature(time_sig)
+        self.insert(time_sig, measure_number, position)
+
+    def delete(self, index: int) -> None:
+        """Queues the deletion of the element at an index of part.sequence
+
+        Indices refer to the sequence as it was before the batch, whatever the other edits. Unlike
+        Part.delete(), which removes a top-level element (a measure) of the music21 part
+        """
+        self._deletions.append(index)
+
+    def discard(self) -> None:
+        """Drops every queued edit"""
+        self._insertions = []
+        self._deletions = []
+
+    @property
+    def meta_changed(self) -> bool:
+        """True if a tempo or a time signature is queued"""
+        return any(isinstance(element, (Tempo, TimeSignature)) for element, _, _ in self._insertions)
+
+    def commit(self) -> None:
+        """Checks and applies every queued edit, then empties the batch
+
+        Raises:
+            ValueError: if an element is not a Scopul musical element, or is deleted twice
+            IndexError: if a deleted index is out of the sequence
+            MeasureNotFoundException: if a measure does not exist
+        """
+        self._apply()
+        self._snapshot = None
+        self.discard()
+
+    def _plan(self) -> tuple:
+        """Checks the queued edits against the event table
+
+        Returns:
+            A tuple (insertions, deletions, touched) where
+                insertions: a dict of measure number -> list of (position, element)
+                deletions: a sorted list of event indices
+                touched: the set of measure numbers an edit may change
+        """
+        part = self.part
+        table = part._music21_table()
+        measures = part._measures()
+
+        for index in self._deletions:
+            if not -len(table) <= index < len(table):
+                raise IndexError(f"Index {index} is out of the sequence of part {part.name}")
+        deletions = sorted({index % len(table) for index in self._deletions})
+        if len(deletions) != len(self._deletions):
+            raise ValueError("An element cannot be deleted twice in the same edit")
+
+        insertions = {}
+        for element, measure_number, position in self._insertions:
+            if not measure_number:
+                # If no measure number is provided, add the element to the last measure in the part
+                measure_number = table.event_measure(len(table) - 1)
+
+            if measure_number not in measures:
+                raise MeasureNotFoundException(f"Measure {measure_number} not found in part {part.name}")
+
+            insertions.setdefault(measure_number, []).append((position, element))
+
+        touched = {table.event_measure(index) for index in deletions}
+        for measure_number, elements in insertions.items():
+            for position, element in elements:
+                # Notes longer than the space left in the measure go on in the next ones
+                length = getattr(element, "length", None) or 0
+                touched.update(part._spanned(measure_number, position, length))
+        return insertions, deletions, touched
+
+    def _apply(self) -> None:
+        """Applies the queued edits, keeping what is needed to roll them back"""
+        if not len(self):
+            return
+
+        insertions, deletions, touched = self._plan()
+        self._snapshot = self.part._snapshot(touched, deletions)
+        try:
+            self.part._apply_edits(insertions, deletions)
+        except BaseException:
+            self._rollback()
+            raise
+
+        if self.meta_changed:
+            self.part._meta_changed()
+
+    def _rollback(self) -> None:
+        """Restores the part as it was before _apply()"""
+        if self._snapshot is not None:
+            self.part._restore(self._snapshot)
+            self._snapshot = None
+
+
+class ScoreEdit:
+    """A batch of edits to the parts of a Scopul object, created by Scopul.edit()
+
+    Every part is edited through its own PartEdit (see part()). The batch is applied when the
+    with block ends: if any part fails, every part is restored
+
+    Args:
+        score: a Scopul object
+    """
+
+    def __init__(self, score) -> None:
+        self.score = score
+        # part index -> PartEdit
+        self._edits = {}
+
+    def __enter__(self) -> "ScoreEdit":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> bool:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+    def part(self, index: int) -> PartEdit:
+        """Returns the batch of edits of a part
+
+        Args:
+            index: the index of the part in Scopul.parts
+        """
+        if index not in self._edits:
+            self._edits[index] = PartEdit(self.score.parts[index])
+        return self._edits[index]
+
+    __getitem__ = part
+
+    def insert_tempo(self, tempo, measure_number: int = None, position: float = 0) -> None:
+        """Queues a tempo change in the first part, see PartEdit.insert_tempo()"""
+        self.part(0).insert_tempo(tempo, measure_number, position)
+
+    def insert_time_signature(self, time_sig, measure_number: int = None, position: float = 0) -> None:
+        """Queues a time signature change in every part. See PartEdit.insert_time_signature()"""
+        for index in range(len(self.score.parts)):
+            self.part(index).insert_time_signature(time_sig, measure_number, position)
+
+    def discard(self) -> None:
+        """Drops every queued edit"""
+        for edit in self._edits.values():
+            edit.discard()
+
+    def commit(self) -> None:
+        """Checks and applies the edits of every part, see PartEdit.commit()"""
+        edits = list(self._edits.values())
+
+        # Every part is checked before any is touched
+        for edit in edits:
+            edit._plan()
+
+        applied = []
+        try:
+            for edit in edits:
+                edit._apply()
+                applied.append(edit)
+        except BaseException:
+            for edit in reversed(applied):
+                edit._rollback()
+            raise
+
+        for edit in edits:
+            edit._snapshot = None
+            edit.discard()
@@ -1,3 +1,5 @@
+__version__ = "1.1.4"
+
 from Scopul.scopul import Scopul
 from Scopul.helpers import midi_tempo2bpm, bpm2midi_tempo, sublist, get_tempos
 from Scopul.scopul_exception import InvalidFileFormatError, InvalidMusicElementError
@@ -7,4 +9,13 @@ from Scopul.Sequence import Part
 from Scopul.MusicalElements import Chord, Note, Rest
 from Scopul.conversions import note_to_number, number_to_note
 from Scopul.config_musescore import config_musescore
+from Scopul.corpus import ScoreSummary, load_many, iter_corpus
+from Scopul.cache import ParseCache
+from Scopul.CorpusIndex import CorpusIndex
+from Scopul.Transaction import PartEdit, ScoreEdit
+from Scopul.PitchStats import PitchStats
+from Scopul.EventStats import EventStats
+from Scopul.RomanCache import RomanCache, ROMAN_CACHE
+from Scopul.TempoMap import TempoMap
+from Scopul.RenderQueue import RenderQueue, RenderResult
 # Imports for scopul
\ No newline at end of file
@@ -0,0 +1,180 @@
+import asyncio
+import io
+import os
+import pathlib
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from Scopul.config_musescore import musescore_path
+from Scopul.score_file import load_score
+from Scopul.scopul_exception import InvalidFileFormatError
+from Scopul.scopul import ENGINES
+
+# Process pool shared by the coroutines that are not given an executor, created on first use
+_executor = None
+
+
+def default_executor() -> ProcessPoolExecutor:
+    """Returns the process pool used when no executor is given, one process per CPU"""
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor()
+    return _executor
+
+
+def shutdown_executor() -> None:
+    """Stops the processes of the default pool, a new pool is created when it is needed again"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _check_output(fp, ext: str, overwrite: bool) -> None:
+    """Checks the extension of an output path, and removes the file there if overwrite is True"""
+    if pathlib.Path(fp).suffix != ext:
+        raise InvalidFileFormatError(f"Expected {ext}, got {pathlib.Path(fp).suffix}")
+
+    if pathlib.Path(fp).exists():
+        if not overwrite:
+            raise FileExistsError(f"{fp} already exists. To overwrite, set overwrite=True")
+        os.remove(fp)
+
+
+async def _run(executor, timeout, func, *args):
+    """Runs func(*args) in a process pool
+
+    On a timeout or a cancellation, a call that has not started yet is dropped. A call already
+    running finishes in its process, and its result is discarded
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(executor or default_executor(), func, *args)
+    return await asyncio.wait_for(future, timeout)
+
+
+# ----------------------------------------- Run in the process pool -----------------------------------------
+
+def parse_score(path, engine: str, cache) -> bytes:
+    """Loads a MIDI file and serializes its event model (see score_file.dump_score())"""
+    from Scopul.scopul import Scopul
+
+    return Scopul(path, engine=engine, cache=cache)._dump()
+
+
+def _score(data: bytes):
+    from Scopul.scopul import Scopul
+
+    return Scopul.from_event_tables(None, *load_score(data))
+
+
+def midi_bytes(data: bytes) -> bytes:
+    """Writes a serialized score to the bytes of a MIDI file, see Scopul.to_midi()"""
+    buffer = io.BytesIO()
+    _score(data).save_midi(buffer, engine="mido")
+    return buffer.getvalue()
+
+
+def musicxml_bytes(data: bytes, title: str) -> bytes:
+    """Exports a serialized score to musicxml, see Scopul.to_musicxml()"""
+    return _score(data).to_musicxml(title=title)
+
+
+# ------------------------------------------------ Coroutines ------------------------------------------------
+
+async def load(path, engine: str = "music21", cache=None, executor=None, timeout: float = None):
+    """Loads a MIDI file in a process pool, without blocking the event loop
+
+    The file is parsed in another process and only its event model comes back, the music21 score
+    is built again (from the event tables) the first time it is needed
+
+    Args:
+        path: path to the MIDI file
+        engine, cache: see Scopul.construct()
+        executor: the process pool to parse the file in, default is default_executor()
+        timeout: the time the parsing may take, in seconds (optional)
+
+    Returns:
+        A Scopul
+
+    Raises:
+        asyncio.TimeoutError: if the parsing takes more than timeout seconds
+    """
+    from Scopul.scopul import Scopul
+
+    data = await _run(executor, timeout, parse_score, path, engine, cache)
+    return Scopul.from_event_tables(path, *load_score(data), engine=engine)
+
+
+async def save_midi(
+    scop, fp=None, overwrite: bool = True, engine: str = "mido", executor=None, timeout: float = None
+) -> None:
+    """Writes a score to a MIDI file (see Scopul.save_midi()) without blocking the event loop
+
+    With engine="mido" the event tables are serialized in a process pool. The music21 score does not
+    cross processes cheaply, so with engine="music21" it is written in a thread of the event loop
+
+    Args:
+        fp: a path, or a binary file object to stream the file to. Defaults to the path of the score
+        engine: "mido" (default) or "music21", see Scopul.save_midi()
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, instead got {engine}")
+
+    if not fp:
+        fp = scop.path
+
+    if engine == "mido":
+        data = await _run(executor, timeout, midi_bytes, scop._dump())
+    else:
+        loop = asyncio.get_running_loop()
+        data = await asyncio.wait_for(loop.run_in_executor(None, scop._music21_midi_bytes), timeout)
+    if hasattr(fp, "write"):
+        fp.write(data)
+        return
+
+    _check_output(fp, ".mid", overwrite)
+    with open(fp, "wb") as file:
+        file.write(data)
+
+
+async def generate_pdf(
+    scop, fp, title: str = "Scop", overwrite: bool = False, executor=None, timeout: float = None
+) -> None:
+    """Generates a pdf of a score (see Scopul.generate_pdf()) without blocking the event loop
+
+    The musicxml is exported from the event tables in a process pool, then MuseScore runs as an
+    asyncio subprocess. On a timeout or a cancellation, MuseScore is killed
+
+    Raises:
+        asyncio.TimeoutError: if the export and MuseScore take more than timeout seconds altogether
+        subprocess.CalledProcessError: if MuseScore fails
+    """
+    mspath = musescore_path()
+    _check_output(fp, ".pdf", overwrite)
+
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    xml = await _run(executor, timeout, musicxml_bytes, scop._dump(), title)
+
+    file = tempfile.NamedTemporaryFile(suffix=".musicxml", delete=False)
+    try:
+        with file:
+            file.write(xml)
+
+        process = await asyncio.create_subprocess_exec(
+            mspath, "-o", str(fp), file.name, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            _, stderr = await asyncio.wait_for(process.communicate(), remaining)
+        except BaseException:
+            # Timed out or cancelled, MuseScore does not outlive the coroutine
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, [mspath, "-o", str(fp), file.name], stderr=stderr)
+    finally:
+        os.remove(file.name)
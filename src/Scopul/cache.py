@@ -0,0 +1,97 @@
+import hashlib
+import os
+import pathlib
+from Scopul.score_file import load_score, write_score
+
+SUFFIX = ".scop"
+
+
+class ParseCache:
+    """An on-disk cache of parsed MIDI files
+
+    Entries hold the event tables, tempos and time signatures of a file, keyed by a hash of the
+    file's content, the engine used to parse it and the Scopul version. When the cache grows past
+    max_bytes, the least recently used entries are removed
+
+    Args:
+        directory: the directory to store the cache in, created if missing
+        max_bytes: the size cap of the cache, default is 512 MiB
+    """
+
+    def __init__(self, directory, max_bytes: int = 512 * 2**20) -> None:
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer")
+
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def key(self, path, engine: str) -> str:
+        """Returns the cache key of a file: its content hash, the engine and the Scopul version"""
+        from Scopul import __version__
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as file:
+            for block in iter(lambda: file.read(2**20), b""):
+                digest.update(block)
+
+        return f"{digest.hexdigest()}-{engine}-{__version__}"
+
+    def _entry(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}{SUFFIX}"
+
+    def get(self, key: str):
+        """Retrieves an entry
+
+        Returns:
+            A tuple (parts, tempos, time_sigs, ticks_per_beat) (see score_file.load_score()), None if missing
+        """
+        entry = self._entry(key)
+        try:
+            data = entry.read_bytes()
+            # Marking the entry as recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            return None
+
+        try:
+            return load_score(data)
+        except (ValueError, EOFError, UnicodeDecodeError):
+            # Corrupt entry, dropped
+            entry.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, parts: list, tempos: list, time_sigs: list, ticks_per_beat: int = None) -> None:
+        """Stores an entry, see score_file.dump_score() for the arguments"""
+        # Replaced at once, so other processes never read half an entry
+        write_score(self._entry(key), parts, tempos, time_sigs, ticks_per_beat)
+        self.evict()
+
+    def evict(self) -> None:
+        """Removes the least recently used entries until the cache is under max_bytes"""
+        entries = []
+        total = 0
+        for entry in self.directory.glob(f"*{SUFFIX}"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self) -> None:
+        """Removes every entry"""
+        for entry in self.directory.glob(f"*{SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    @property
+    def size(self) -> int:
+        """Returns the size of the cache in bytes"""
+        return sum(entry.stat().st_size for entry in self.directory.glob(f"*{SUFFIX}"))
@@ -1,5 +1,28 @@
 import os
+import pathlib
+from Scopul.scopul_exception import NoMusePathError
 
 
 def config_musescore(path):
     os.environ["MUSESCORE_PATH"] = f"{path}"
+
+
+def musescore_path() -> str:
+    """Returns the path to MuseScore set with config_musescore()
+
+    Raises:
+        NoMusePathError: if the path is not set
+        FileNotFoundError: if there is no file at the path
+    """
+    try:
+        mspath = os.environ["MUSESCORE_PATH"]
+    except KeyError:
+        raise NoMusePathError(
+            "Path to musescore not set. please set using config_musescore()"
+        )
+
+    if not pathlib.Path(mspath).exists():
+        raise FileNotFoundError(
+            f"MuseScore path at {mspath} not found. Please check to see if it exists"
+        )
+    return mspath
@@ -1,3 +1,5 @@
+import re
+
 INSTRUMENTS = [
     "Acoustic Grand Piano",
     "Bright Acoustic Piano",
@@ -169,3 +171,34 @@ def note_to_number(note: str, octave: int) -> int:
     assert 0 <= note <= 127, errors["notes"]
 
     return note
+
+
+def number_to_name(number: int) -> str:
+    """Converts a MIDI note number to a name in 'note octave' format, using the same octave numbers as music21
+
+    Example:
+        60 -> "C4"
+        61 -> "C#4"
+    """
+    assert 0 <= number <= 127, errors["notes"]
+    return f"{NOTES[number % NOTES_IN_OCTAVE]}{number // NOTES_IN_OCTAVE - 1}"
+
+
+def name_to_number(name: str) -> int:
+    """Converts a name in 'note octave' format to a MIDI note number, using the same octave numbers as music21
+
+    Sharps are written "#" and flats "-", like music21
+
+    Example:
+        "C4" -> 60
+        "B-4" -> 70
+    """
+    match = re.fullmatch(r"\s*([a-gA-G])([#-]*)(-?[0-9]+)\s*", name)
+    assert match, errors["notes"]
+    letter, accidentals, octave = match.groups()
+
+    number = NOTES.index(letter.upper()) + accidentals.count("#") - accidentals.count("-")
+    number += NOTES_IN_OCTAVE * (int(octave) + 1)
+
+    assert 0 <= number <= 127, errors["notes"]
+    return number
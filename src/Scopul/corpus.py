@@ -0,0 +1,203 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+MIDI_EXTENSIONS = (".mid", ".midi")
+
+
+# A container class, whose job is to store data nicely
+class ScoreSummary:
+    """A compact, picklable summary of a MIDI file, returned by load_many() and iter_corpus()
+
+    Attributes:
+        path: path to the MIDI file
+        parts: a list of part names
+        tempo_list: a list of Tempo objects
+        time_sig_list: a list of TimeSignature objects
+        note_count, rest_count, chord_count: counts over every part
+        key: the key of the file ("D minor"), None if not analyzed
+        length: the length of the file, in seconds
+        error: None, or a str describing why the file could not be loaded
+    """
+
+    def __init__(
+        self,
+        path,
+        parts: list = None,
+        tempo_list: list = None,
+        time_sig_list: list = None,
+        note_count: int = 0,
+        rest_count: int = 0,
+        chord_count: int = 0,
+        key: str = None,
+        length: float = None,
+        error: str = None,
+    ) -> None:
+        self.path = path
+        self.parts = parts if parts is not None else []
+        self.tempo_list = tempo_list if tempo_list is not None else []
+        self.time_sig_list = time_sig_list if time_sig_list is not None else []
+        self.note_count = note_count
+        self.rest_count = rest_count
+        self.chord_count = chord_count
+        self.key = key
+        self.length = length
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Returns True if the file was loaded without errors"""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        if not self.ok:
+            return f"ScoreSummary({self.path!r}, error={self.error!r})"
+        return f"ScoreSummary({self.path!r}, parts={len(self.parts)}, notes={self.note_count}, key={self.key!r})"
+
+
+def summarize(path, engine: str = "music21", key: bool = True) -> ScoreSummary:
+    """Loads a MIDI file and summarizes it, errors are returned in the summary instead of raised
+
+    Args:
+        path: path to the MIDI file
+        engine: the engine used to load the file, see Scopul.construct()
+        key: whether to analyze the key of the file (needs music21)
+
+    Returns:
+        A ScoreSummary
+    """
+    from Scopul.scopul import Scopul
+
+    try:
+        scop = Scopul(path, engine=engine)
+        parts = scop.parts
+        return ScoreSummary(
+            path,
+            parts=[part.name for part in parts],
+            tempo_list=scop.tempo_list,
+            time_sig_list=scop.time_sig_list,
+            note_count=sum(part.get_note_count() for part in parts),
+            rest_count=sum(part.get_rest_count() for part in parts),
+            chord_count=sum(part.get_chord_count() for part in parts),
+            key=scop.key if key else None,
+            length=scop.get_audio_length(),
+        )
+    except Exception as error:
+        return ScoreSummary(path, error=f"{type(error).__name__}: {error}")
+
+
+def process_pool(workers: int, warm_start=None) -> ProcessPoolExecutor:
+    """Creates a pool of processes, whose roman numeral cache is warmed from a file first
+
+    Args:
+        workers: the number of processes
+        warm_start: the path of a warm-start file written by RomanCache.save(), loaded by every
+            worker as it starts (see RomanCache.warm_start()). None to start with an empty cache
+    """
+    if warm_start is None:
+        return ProcessPoolExecutor(max_workers=workers)
+
+    from Scopul.RomanCache import warm_start as load_warm_start
+
+    return ProcessPoolExecutor(max_workers=workers, initializer=load_warm_start, initargs=(str(warm_start),))
+
+
+def load_many(paths, workers: int = None, engine: str = "music21", key: bool = True, warm_start=None):
+    """Loads many MIDI files in parallel, in a pool of processes
+
+    Summaries are yielded as soon as they are ready, so not in the order of paths.
+    A file that fails to load does not stop the others, its summary has an error instead. So does a
+    file whose worker dies (the files the pool was loading at that time get an error summary too, the
+    next ones are loaded by a new pool) or that can not be sent to a worker
+
+    Args:
+        paths: an iterable of paths to MIDI files
+        workers: the number of processes, default is the number of CPUs. 1 loads the files in this process
+        engine: the engine used to load the files, see Scopul.construct()
+        key: whether to analyze the key of the files (needs music21)
+        warm_start: the path of a roman numeral warm-start file loaded by every worker, see process_pool()
+
+    Yields:
+        ScoreSummary objects
+    """
+    if workers is not None and workers < 1:
+        raise ValueError("workers must be a positive integer")
+
+    if workers == 1:
+        if warm_start is not None:
+            from Scopul.RomanCache import warm_start as load_warm_start
+
+            load_warm_start(warm_start)
+        for path in paths:
+            yield summarize(path, engine, key)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    executor = process_pool(workers, warm_start)
+    # Only a few files per worker are queued at once, so huge corpora are not submitted up front
+    max_pending = 4 * workers
+    # The path of every future
+    pending = {}
+    paths = iter(paths)
+
+    try:
+        while True:
+            for path in paths:
+                pending[executor.submit(summarize, path, engine, key)] = path
+                if len(pending) >= max_pending:
+                    break
+
+            if not pending:
+                break
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            broken = False
+            for future in done:
+                path = pending.pop(future)
+                try:
+                    yield future.result()
+                except Exception as error:
+                    # A worker died, or the path or the summary could not be pickled
+                    broken = broken or isinstance(error, BrokenProcessPool)
+                    yield ScoreSummary(path, error=f"{type(error).__name__}: {error}")
+
+            if broken:
+                # A broken pool takes no more files
+                executor.shutdown(wait=True, cancel_futures=True)
+                executor = process_pool(workers, warm_start)
+    finally:
+        # Stops the workers even if the caller stopped iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def find_midi_files(directory, recursive: bool = True) -> list:
+    """Lists the MIDI files (.mid, .midi) in a directory, sorted by path"""
+    if recursive:
+        files = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(directory)
+            for name in names
+        ]
+    else:
+        files = [os.path.join(directory, name) for name in os.listdir(directory)]
+
+    return sorted(file for file in files if file.lower().endswith(MIDI_EXTENSIONS))
+
+
+def iter_corpus(
+    directory, workers: int = None, recursive: bool = True, engine: str = "music21", key: bool = True, warm_start=None
+):
+    """Loads every MIDI file of a directory in parallel, see load_many()
+
+    Args:
+        directory: path to the directory
+        workers: the number of processes, default is the number of CPUs
+        recursive: whether to also load the files in sub-directories
+        engine: the engine used to load the files, see Scopul.construct()
+        key: whether to analyze the key of the files (needs music21)
+        warm_start: the path of a roman numeral warm-start file loaded by every worker, see process_pool()
+
+    Yields:
+        ScoreSummary objects
+    """
+    yield from load_many(find_midi_files(directory, recursive), workers, engine, key, warm_start)
@@ -0,0 +1,96 @@
+import heapq
+from Scopul.RomanCache import ROMAN_CACHE
+
+# Digits onsets and ends are rounded to, far below the smallest quantized length
+DIGITS = 9
+
+
+def _measures(table) -> list:
+    """Returns the time points and the notes of every measure of a table, in the order of the measures
+
+    Returns:
+        A list of (time points, notes) where time points is the set of the onsets and ends of the
+        rows of the measure (rests included), and notes the (onset, end, pitch) of its notes
+    """
+    measures = {}
+    for row in range(table.row_count):
+        # Rounded, so a note ending where another starts (1/3 + 1/3 and 2/3) meets it
+        onset = round(table.onset[row], DIGITS)
+        end = round(table.onset[row] + table.note_length[row], DIGITS)
+        times, notes = measures.setdefault(table.measure[row], (set(), []))
+        times.update((onset, end))
+        if table.pitch[row] >= 0 and end > onset:
+            notes.append((onset, end, table.pitch[row]))
+    measures = [measures[number] for number in sorted(measures)]
+
+    # music21 ties notes over barlines into the next measure, the notes of tables read without
+    # music21 are split the same way
+    if not table.from_music21_part:
+        for (times, notes), (next_times, next_notes) in zip(measures, measures[1:]):
+            barline = min(next_times)
+            for idx, (onset, end, pitch) in enumerate(notes):
+                if end > barline:
+                    notes[idx] = (onset, barline, pitch)
+                    times.add(barline)
+                    next_notes.append((barline, end, pitch))
+                    next_times.add(end)
+    return measures
+
+
+def _sweep(times: set, notes: list) -> list:
+    """Returns the sonorities between the time points of a measure, see sonorities()"""
+    notes = sorted(notes)
+    times = sorted(times)
+
+    result = []
+    ending = []
+    active = {}
+    position = 0
+    for idx, time in enumerate(times[:-1]):
+        while ending and ending[0][0] <= time:
+            _, pitch = heapq.heappop(ending)
+            active[pitch] -= 1
+            if not active[pitch]:
+                del active[pitch]
+
+        while position < len(notes) and notes[position][0] <= time:
+            _, end, pitch = notes[position]
+            heapq.heappush(ending, (end, pitch))
+            active[pitch] = active.get(pitch, 0) + 1
+            position += 1
+
+        if active:
+            result.append((time, times[idx + 1] - time, tuple(sorted(active))))
+
+    return result
+
+
+def sonorities(table) -> list:
+    """Finds the vertical sonorities of a part, like music21's chordify(), with a sweep line
+
+    Like chordify(), measures are swept one at a time, and a new sonority starts at every onset
+    and every end of a note or a rest of the measure, sustained notes included. Notes over a barline
+    are split at the barline
+
+    Args:
+        table: an EventTable
+
+    Returns:
+        A list of (onset, quarter length, pitches) where pitches is a sorted tuple of MIDI pitches
+    """
+    result = []
+    for times, notes in _measures(table):
+        result += _sweep(times, notes)
+    return result
+
+
+def roman_figure(pitches) -> str:
+    """Returns the roman numeral figure of MIDI pitches, like roman.romanNumeralFromChord(chord).figure
+
+    The pitches are spelled like the notes of a MIDI file read by music21. Figures are looked up in
+    the process-wide RomanCache, and computed with music21 the first time a voicing is seen
+
+    Args:
+        pitches: a sorted tuple of MIDI pitches
+    """
+    return ROMAN_CACHE.figure(pitches)
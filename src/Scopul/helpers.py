@@ -1,5 +1,5 @@
-from music21 import tempo
 from collections.abc import Iterable
+from functools import wraps
 from mido import tempo2bpm, bpm2tempo
 from Scopul.Tempo import Tempo
 
@@ -57,7 +57,31 @@ def sublist(lst, sublist, overlap=False):
     return sublists
 
 
+def deprecated(reason: str):
+    """Marks a function as deprecated, like deprecated.deprecated
+
+    The deprecated package is only imported the first time the function is called
+    """
+
+    def decorator(func):
+        decorated = []
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not decorated:
+                from deprecated import deprecated as deprecate
+
+                decorated.append(deprecate(reason=reason)(func))
+            return decorated[0](*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def get_tempos(midi):
+    from music21 import tempo
+
     lst = []
     for meta_message in midi.flat:
         if isinstance(meta_message, tempo.MetronomeMark):
@@ -0,0 +1,152 @@
+from Scopul.EventTable import REST
+
+# Krumhansl-Kessler key profiles, index 0 is the tonic
+MAJOR_PROFILE = (6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88)
+MINOR_PROFILE = (6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17)
+
+# Tonic names by pitch class, spelled like music21 keys
+MAJOR_TONICS = ("C", "D-", "D", "E-", "E", "F", "F#", "G", "A-", "A", "B-", "B")
+MINOR_TONICS = ("C", "C#", "D", "E-", "E", "F", "F#", "G", "G#", "A", "B-", "B")
+
+# The 24 keys, in the order of the rows of profile_matrix(): 12 major keys then 12 minor keys
+KEYS = tuple(f"{tonic} major" for tonic in MAJOR_TONICS) + tuple(f"{tonic} minor" for tonic in MINOR_TONICS)
+
+
+def profile_matrix():
+    """Returns the 24 key profiles as a (24, 12) numpy array, every row centered and of unit norm
+
+    so that a product with a centered, normalized pitch class histogram is a Pearson correlation
+    """
+    import numpy as np
+
+    rows = [np.roll(MAJOR_PROFILE, tonic) for tonic in range(12)]
+    rows += [np.roll(MINOR_PROFILE, tonic) for tonic in range(12)]
+    matrix = np.array(rows, dtype=np.float64)
+    matrix -= matrix.mean(axis=1, keepdims=True)
+    return matrix / np.linalg.norm(matrix, axis=1, keepdims=True)
+
+
+def _sounding(table) -> tuple:
+    """Returns the pitch classes, quarter lengths and measures of the sounding rows of a table"""
+    import numpy as np
+
+    pitch = np.asarray(table.pitch, dtype=np.int16)
+    sounding = (pitch >= 0) & (np.asarray(table.kind, dtype=np.int8) != REST)
+    return (
+        pitch[sounding] % 12,
+        np.asarray(table.note_length, dtype=np.float64)[sounding],
+        np.asarray(table.measure, dtype=np.int64)[sounding],
+    )
+
+
+def pitch_class_weights(tables):
+    """Returns the duration weighted pitch class histogram of event tables, a numpy array of 12 floats"""
+    import numpy as np
+
+    weights = np.zeros(12)
+    for table in tables:
+        pitch_class, length, _ = _sounding(table)
+        weights += np.bincount(pitch_class, weights=length, minlength=12)
+    return weights
+
+
+def measure_pitch_class_weights(tables) -> tuple:
+    """Returns the duration weighted pitch class histogram of every measure of event tables
+
+    Returns:
+        A tuple (measures, weights): the sorted measure numbers, and a (len(measures), 12) numpy array.
+        Notes outside measures are left out
+    """
+    import numpy as np
+
+    parts = [_sounding(table) for table in tables]
+    pitch_class = np.concatenate([np.zeros(0, dtype=np.int16)] + [part[0] for part in parts])
+    length = np.concatenate([np.zeros(0)] + [part[1] for part in parts])
+    measure = np.concatenate([np.zeros(0, dtype=np.int64)] + [part[2] for part in parts])
+
+    in_measure = measure != -1
+    measures, rows = np.unique(measure[in_measure], return_inverse=True)
+    weights = np.zeros((len(measures), 12))
+    np.add.at(weights, (rows, pitch_class[in_measure]), length[in_measure])
+    return measures, weights
+
+
+def key_correlations(weights):
+    """Correlates pitch class histograms with the 24 key profiles, in one matrix product
+
+    Args:
+        weights: a numpy array of 12 floats, or a (n, 12) array of histograms
+
+    Returns:
+        A numpy array of 24 (or (n, 24)) correlations, in the order of KEYS. Empty histograms correlate to 0
+    """
+    import numpy as np
+
+    weights = np.asarray(weights, dtype=np.float64)
+    centered = weights - weights.mean(axis=-1, keepdims=True)
+    norm = np.linalg.norm(centered, axis=-1, keepdims=True)
+    centered = np.divide(centered, norm, out=np.zeros_like(centered), where=norm > 0)
+    return centered @ profile_matrix().T
+
+
+def estimate_key(weights) -> tuple:
+    """Finds the key of a pitch class histogram, Krumhansl-Schmuckler style
+
+    Returns:
+        A tuple (key, confidence), key being formatted like Scopul.key ("E- major") and confidence
+        the correlation with its profile. (None, 0.0) for an empty histogram
+    """
+    import numpy as np
+
+    correlations = key_correlations(weights)
+    best = int(np.argmax(correlations))
+    if correlations[best] == 0:
+        return None, 0.0
+    return KEYS[best], float(correlations[best])
+
+
+def key_timeline(tables, window_measures: int = 4, hop: int = 1) -> list:
+    """Estimates the key of sliding windows of measures, see Part.key_timeline()
+
+    The pitch class histogram of every measure is computed once, windows are summed with prefix
+    sums and correlated with the 24 key profiles in a single matrix product
+
+    Returns:
+        A list of (first measure of the window, key, confidence)
+    """
+    import numpy as np
+
+    if window_measures < 1 or hop < 1:
+        raise ValueError("window_measures and hop must be positive integers")
+
+    measures, weights = measure_pitch_class_weights(tables)
+    if len(measures) == 0:
+        return []
+
+    # One row per measure number, measures without notes included
+    first = int(measures[0])
+    dense = np.zeros((int(measures[-1]) - first + 1, 12))
+    dense[measures - first] = weights
+
+    prefix = np.zeros((len(dense) + 1, 12))
+    np.cumsum(dense, axis=0, out=prefix[1:])
+
+    window = min(window_measures, len(dense))
+    starts = np.arange(0, len(dense) - window + 1, hop)
+    windows = prefix[starts + window] - prefix[starts]
+
+    correlations = key_correlations(windows)
+    best = np.argmax(correlations, axis=1)
+    confidence = correlations[np.arange(len(best)), best]
+
+    return [
+        (first + int(start), KEYS[key] if score > 0 else None, float(score) if score > 0 else 0.0)
+        for start, key, score in zip(starts, best, confidence)
+    ]
+
+
+def transpose_key(key: str, semitones: int) -> str:
+    """Transposes a key formatted like Scopul.key ("E- major") by a number of semitones"""
+    idx = KEYS.index(key)
+    mode = idx - idx % 12
+    return KEYS[mode + (idx + semitones) % 12]
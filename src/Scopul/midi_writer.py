@@ -0,0 +1,85 @@
+from mido import MetaMessage, Message, MidiFile, MidiTrack
+from Scopul.EventTable import REST
+
+# Resolution of files whose own resolution is unknown
+DEFAULT_TICKS_PER_BEAT = 480
+
+# Velocity of notes whose velocity is unknown, mido's default
+DEFAULT_VELOCITY = 64
+
+# Channel 10 (9 from 0) is for percussion
+PERCUSSION_CHANNEL = 9
+
+
+def part_channel(index: int) -> int:
+    """Returns the MIDI channel of the part at index, skipping the percussion channel"""
+    channel = index % 15
+    return channel + 1 if channel >= PERCUSSION_CHANNEL else channel
+
+
+def _track(events: list) -> MidiTrack:
+    """Builds a track from (tick, order, message), messages on the same tick sorted by order"""
+    track = MidiTrack()
+    tick = 0
+    for event_tick, _, message in sorted(events, key=lambda event: (event[0], event[1])):
+        track.append(message.copy(time=event_tick - tick))
+        tick = event_tick
+    track.append(MetaMessage("end_of_track", time=0))
+    return track
+
+
+def conductor_track(tempo_map, ticks_per_beat: int) -> MidiTrack:
+    """Builds the first track of a file, holding the tempos and time signatures of a TempoMap
+
+    Only the time signatures of the score are written, a score without any gets none
+    """
+    events = []
+    for offset, numerator, denominator in tempo_map.time_sigs:
+        message = MetaMessage("time_signature", numerator=numerator, denominator=denominator)
+        events.append((round(offset * ticks_per_beat), 0, message))
+
+    for offset, midi_tempo in zip(tempo_map.offsets, tempo_map.tempos):
+        events.append((round(offset * ticks_per_beat), 1, MetaMessage("set_tempo", tempo=midi_tempo)))
+
+    return _track(events)
+
+
+def part_track(table, ticks_per_beat: int, name: str = None, channel: int = 0) -> MidiTrack:
+    """Builds the track of a part from its EventTable, one note_on/note_off pair per sounding row
+
+    Notes without a length (grace notes) are left out. On the same tick, notes end before others start
+    """
+    events = []
+    if name is not None:
+        events.append((0, 0, MetaMessage("track_name", name=name)))
+
+    rows = zip(table.kind, table.onset, table.note_length, table.pitch, table.velocity)
+    for kind, onset, length, pitch, velocity in rows:
+        if kind == REST or pitch < 0 or length <= 0:
+            continue
+
+        start = round(onset * ticks_per_beat)
+        end = max(round((onset + length) * ticks_per_beat), start + 1)
+        velocity = velocity if velocity > 0 else DEFAULT_VELOCITY
+        events.append((start, 2, Message("note_on", channel=channel, note=pitch, velocity=velocity)))
+        events.append((end, 1, Message("note_off", channel=channel, note=pitch, velocity=0)))
+
+    return _track(events)
+
+
+def build_midi(parts: list, tempo_map) -> MidiFile:
+    """Serializes parts straight to a mido MidiFile, without music21
+
+    Args:
+        parts: a list of (name, EventTable)
+        tempo_map: the TempoMap of the score, its resolution is kept
+
+    Returns:
+        A type 1 MidiFile: a conductor track, then a track per part
+    """
+    ticks_per_beat = tempo_map.ticks_per_beat or DEFAULT_TICKS_PER_BEAT
+    midi = MidiFile(type=1, ticks_per_beat=ticks_per_beat)
+    midi.tracks.append(conductor_track(tempo_map, ticks_per_beat))
+    for idx, (name, table) in enumerate(parts):
+        midi.tracks.append(part_track(table, ticks_per_beat, name, part_channel(idx)))
+    return midi
@@ -0,0 +1,324 @@
+import struct
+from bisect import bisect_right
+from math import ceil, floor
+from mido import MidiFile
+from Scopul.EventTable import EventTable, NOTE, CHORD, REST
+from Scopul.conversions import program_to_instrument
+from Scopul.midi_writer import PERCUSSION_CHANNEL
+from Scopul.scopul_exception import InvalidFileFormatError
+
+# Tolerance used when placing onsets on barlines
+EPSILON = 1e-9
+
+# Offsets and lengths are snapped to sixteenths or eighth triplets, like music21 does when parsing
+QUARTER_LENGTH_DIVISORS = (4, 3)
+
+
+class MeasureMap:
+    """Maps offsets (in quarter lengths) to measure numbers using the time signatures of a file
+
+    Args:
+        time_sigs: a list of (offset, numerator, denominator), sorted by offset
+    """
+
+    def __init__(self, time_sigs: list) -> None:
+        # Segments of constant time signature: start offset, first measure, bar and beat lengths
+        self.starts = []
+        self.measures = []
+        self.bar_lengths = []
+        self.beat_lengths = []
+
+        # MIDI files without a time signature at the start are in 4/4
+        if not time_sigs or time_sigs[0][0] > 0:
+            time_sigs = [(0.0, 4, 4)] + list(time_sigs)
+
+        for offset, numerator, denominator in time_sigs:
+            bar_length = numerator * 4 / denominator
+
+            # A time signature on the same offset replaces the previous one
+            if self.starts and offset <= self.starts[-1] + EPSILON:
+                self.bar_lengths[-1] = bar_length
+                self.beat_lengths[-1] = 4 / denominator
+                continue
+
+            if self.starts:
+                # A change in the middle of a measure starts a new measure
+                elapsed = (offset - self.starts[-1]) / self.bar_lengths[-1]
+                measure = self.measures[-1] + ceil(elapsed - EPSILON)
+            else:
+                measure = 1
+
+            self.starts.append(offset)
+            self.measures.append(measure)
+            self.bar_lengths.append(bar_length)
+            self.beat_lengths.append(4 / denominator)
+
+    def measure_at(self, offset: float) -> int:
+        """Returns the measure number at an offset"""
+        seg = max(bisect_right(self.starts, offset + EPSILON) - 1, 0)
+        elapsed = (offset - self.starts[seg]) / self.bar_lengths[seg]
+        return self.measures[seg] + floor(elapsed + EPSILON)
+
+    def measure_start(self, measure: int) -> float:
+        """Returns the offset at which a measure starts"""
+        seg = max(bisect_right(self.measures, measure) - 1, 0)
+        return self.starts[seg] + (measure - self.measures[seg]) * self.bar_lengths[seg]
+
+
+def read_ticks_per_beat(path) -> int:
+    """Reads the resolution of a MIDI file from its header, without reading its tracks
+
+    Returns:
+        The ticks per beat, None for files timed in SMPTE frames
+    """
+    with open(path, "rb") as file:
+        header = file.read(14)
+
+    if len(header) < 14 or header[:4] != b"MThd":
+        raise InvalidFileFormatError(f"{path} is not a MIDI file")
+
+    division = struct.unpack(">h", header[12:14])[0]
+    return division if division > 0 else None
+
+
+def read_tracks(path) -> tuple:
+    """Reads the notes and meta messages of a MIDI file with mido
+
+    Args:
+        path: path to the MIDI file
+
+    Returns:
+        A tuple (tracks, tempos, time_sigs, ticks_per_beat) where
+            tracks: a list of (name, notes) with notes being (start tick, end tick, pitch, velocity, channel).
+                A track without a track_name is named after the instrument of its first program_change,
+                or "Percussion" if it plays on the percussion channel
+            tempos: a list of (tick, midi tempo)
+            time_sigs: a list of (tick, numerator, denominator)
+    """
+    midi = MidiFile(path)
+    tracks = []
+    tempos = []
+    time_sigs = []
+
+    for track in midi.tracks:
+        tick = 0
+        name = None
+        program = None
+        channel = None
+        # (start tick, order of the note_on, end tick, pitch, velocity, channel)
+        notes = []
+        played = 0
+        # (channel, pitch) -> list of (start tick, order, velocity), released first in first out
+        sounding = {}
+
+        for msg in track:
+            tick += msg.time
+            if msg.type == "note_on" and msg.velocity > 0:
+                if channel is None:
+                    channel = msg.channel
+                sounding.setdefault((msg.channel, msg.note), []).append((tick, played, msg.velocity))
+                played += 1
+            elif msg.type in ("note_on", "note_off"):
+                started = sounding.get((msg.channel, msg.note))
+                if started:
+                    start, order, velocity = started.pop(0)
+                    notes.append((start, order, tick, msg.note, velocity, msg.channel))
+            elif msg.type == "set_tempo":
+                tempos.append((tick, msg.tempo))
+            elif msg.type == "time_signature":
+                time_sigs.append((tick, msg.numerator, msg.denominator))
+            elif msg.type == "track_name" and name is None:
+                name = msg.name
+            elif msg.type == "program_change" and program is None:
+                program = msg.program
+
+        # Notes that are never released end with the track
+        for (note_channel, pitch), started in sounding.items():
+            for start, order, velocity in started:
+                notes.append((start, order, tick, pitch, velocity, note_channel))
+
+        # Tracks without notes (like the conductor track) are not parts
+        if played:
+            # Ordered by start, then in the order they were played, as music21 reads them
+            notes.sort(key=lambda note: note[:2])
+            # Unnamed tracks are named after their instrument, as music21 does
+            if name is None and channel == PERCUSSION_CHANNEL:
+                name = "Percussion"
+            elif name is None and program is not None:
+                name = program_to_instrument(program + 1)
+            tracks.append((name, [(start, end, pitch, velocity, note_channel) for start, _, end, pitch, velocity, note_channel in notes]))
+
+    tempos.sort(key=lambda event: event[0])
+    time_sigs.sort(key=lambda event: event[0])
+    return tracks, tempos, time_sigs, midi.ticks_per_beat
+
+
+def quantize(value: float, divisors: tuple = QUARTER_LENGTH_DIVISORS) -> tuple:
+    """Snaps a quarter length to the nearest multiple of 1 / divisor, for the divisor with the smallest error
+
+    Ties go to the smallest unit, as in music21's Stream.quantize()
+
+    Returns:
+        A tuple (quantized value, divisor used)
+    """
+    found = []
+    for divisor in divisors:
+        # Dividing a whole number of units keeps the values exact: 2 / 3 rather than 2 * (1 / 3)
+        multiple = floor(value * divisor)
+        if value > (multiple + 0.5) / divisor:
+            multiple += 1
+        match = multiple / divisor
+        found.append((round(abs(value - match), 7), 1 / divisor, match, divisor))
+    _, _, match, divisor = min(found)
+    return match, divisor
+
+
+def group_chords(notes: list, ticks_per_beat: int) -> list:
+    """Groups the notes of a track into chords, like music21's MIDI import
+
+    Notes starting and ending within a quantization unit of the first note of a group make a chord
+    with it. Notes starting together but ending apart stay separate notes
+
+    Args:
+        notes: a list of (start tick, end tick, pitch, velocity, channel), sorted by start tick
+        ticks_per_beat: the resolution of the file
+
+    Returns:
+        A list of groups, every group being a list of notes
+    """
+    tolerance = ticks_per_beat / max(QUARTER_LENGTH_DIVISORS)
+    gathered = set()
+    groups = []
+    for idx, (start, end, *_) in enumerate(notes):
+        if idx in gathered:
+            continue
+
+        group = [notes[idx]]
+        for other in range(idx + 1, len(notes)):
+            other_start, other_end, *_ = notes[other]
+            if abs(other_start - start) >= tolerance:
+                break
+            # Like music21, a note already in a chord can join the next one too
+            if abs(other_end - end) <= tolerance:
+                group.append(notes[other])
+                gathered.add(other)
+        groups.append(group)
+    return groups
+
+
+def build_table(notes: list, ticks_per_beat: int, measure_map: MeasureMap) -> EventTable:
+    """Builds an EventTable from the notes of a track
+
+    Notes are grouped into chords like music21 does (see group_chords()), then their onsets and
+    lengths are quantized like music21 does (every note of a chord keeping its own length). Gaps
+    where nothing sounds become rests, split at barlines. Notes and chords with a note on the
+    percussion channel are left out (setting table.percussion), as music21 reads them as unpitched
+    percussion
+
+    Unlike music21, notes are not split at barlines nor spread over voices, so overlapping notes
+    do not get the rests music21 fills their voices with. music21 also stretches a measure holding
+    a note longer than the measure, moving every later measure: the onsets here stay those of the file
+
+    Args:
+        notes: a list of (start tick, end tick, pitch, velocity, channel), sorted by start tick
+        ticks_per_beat: the resolution of the file
+        measure_map: a MeasureMap of the file
+
+    Returns:
+        An EventTable
+    """
+    table = EventTable()
+    sounding_until = 0.0
+    smallest = 1 / max(QUARTER_LENGTH_DIVISORS)
+
+    # (quantized onset, [(length, pitch, velocity)]) of every note or chord, chords ordered by pitch
+    events = []
+    for group in group_chords(notes, ticks_per_beat):
+        # music21 reads these as unpitched percussion, which is left out of its event tables
+        if any(channel == PERCUSSION_CHANNEL for *_, channel in group):
+            table.percussion = True
+            continue
+        onset, _ = quantize(group[0][0] / ticks_per_beat)
+        members = sorted(((end - begin) / ticks_per_beat, pitch, velocity) for begin, end, pitch, velocity, _ in group)
+        events.append((onset, sorted(members, key=lambda note: (note[1], note[0]))))
+    events.sort(key=lambda event: event[0])
+    onsets = sorted({onset for onset, _ in events})
+
+    for onset, group in events:
+        next_onset = None
+        later = bisect_right(onsets, onset)
+        if later < len(onsets):
+            next_onset = onsets[later]
+            _, next_divisor = quantize(next_onset)
+
+        lengths = []
+        for raw_length, _, _ in group:
+            length, _ = quantize(raw_length)
+            # A gap smaller than the smallest unit before the next onset is closed with its divisor
+            if next_onset is not None and 0 < next_onset - (onset + length) < smallest:
+                length, _ = quantize(raw_length, (next_divisor,))
+            # Notes never quantize to nothing
+            lengths.append(length if length > 0 else smallest)
+        length = max(lengths)
+
+        # Filling the silence before this event with rests
+        if onset > sounding_until + EPSILON:
+            add_rests(table, sounding_until, onset, measure_map)
+
+        table.append(
+            CHORD if len(lengths) > 1 else NOTE,
+            onset,
+            length,
+            measure_map.measure_at(onset),
+            [pitch for _, pitch, _ in group],
+            [velocity for _, _, velocity in group],
+            lengths=lengths,
+        )
+        sounding_until = max(sounding_until, onset + length)
+
+    return table
+
+
+def add_rests(table: EventTable, start: float, end: float, measure_map: MeasureMap) -> None:
+    """Appends rests to a table covering start to end, one per measure crossed"""
+    while start < end - EPSILON:
+        measure = measure_map.measure_at(start)
+        stop = min(end, measure_map.measure_start(measure + 1))
+        table.append(REST, start, stop - start, measure, [], [])
+        start = stop
+
+
+def load_midi(path) -> tuple:
+    """Reads a MIDI file into Scopul's event model without music21
+
+    Args:
+        path: path to the MIDI file
+
+    Returns:
+        A tuple (parts, tempos, time_sigs, ticks_per_beat) where
+            parts: a list of (name, EventTable)
+            tempos: a list of (offset, midi tempo, measure)
+            time_sigs: a list of (offset, numerator, denominator, measure)
+        Offsets are in quarter lengths
+    """
+    tracks, tempo_ticks, time_sig_ticks, ticks_per_beat = read_tracks(path)
+
+    measure_map = MeasureMap(
+        [(tick / ticks_per_beat, num, den) for tick, num, den in time_sig_ticks]
+    )
+
+    tempos = []
+    for tick, midi_tempo in tempo_ticks:
+        offset = tick / ticks_per_beat
+        tempos.append((offset, midi_tempo, measure_map.measure_at(offset)))
+
+    time_sigs = []
+    for tick, numerator, denominator in time_sig_ticks:
+        offset = tick / ticks_per_beat
+        time_sigs.append((offset, numerator, denominator, measure_map.measure_at(offset)))
+
+    parts = [
+        (name, build_table(notes, ticks_per_beat, measure_map)) for name, notes in tracks
+    ]
+
+    return parts, tempos, time_sigs, ticks_per_beat
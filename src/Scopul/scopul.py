@@ -1,4 +1,5 @@
-from music21 import converter, environment, stream, note, tempo, chord, meter
+# Imports for scopul (music21 is only imported by the methods that need it)
+import heapq
 import os
 import pathlib
 from collections.abc import Iterable
@@ -8,19 +9,30 @@ from Scopul.scopul_exception import (
     NoMusePathError,
     MeasureNotFoundException,
 )
-from mido import bpm2tempo, tempo2bpm, MidiFile
-from deprecated import deprecated
+from Scopul.config_musescore import musescore_path
+from mido import bpm2tempo, tempo2bpm
 # Setting up music21 with MuseScore
 from Scopul.TimeSignature import TimeSignature
 from Scopul.Tempo import Tempo
 from Scopul.Sequence import Part, Rest, Chord, Note
-from Scopul.helpers import get_tempos
+from Scopul.helpers import get_tempos, deprecated
+from Scopul.mido_loader import load_midi, read_ticks_per_beat, EPSILON
+from Scopul.TempoMap import TempoMap
+from Scopul.cache import ParseCache
+from Scopul.score_file import dump_score, write_score, open_score
+from Scopul.Transaction import ScoreEdit
+from Scopul.PitchStats import PitchStats, pitch_stats
+from Scopul.EventStats import EventStats, event_stats
+from Scopul.key_profiles import estimate_key, pitch_class_weights
 import subprocess
+import tempfile
+
+ENGINES = ("music21", "mido")
 
 
 class Scopul:
-    def __init__(self, audio):
-        self.construct(audio)
+    def __init__(self, audio, engine: str = "music21", cache=None):
+        self.construct(audio, engine=engine, cache=cache)
 
     # Time Signature (time_sig)
     @property
@@ -33,6 +45,15 @@ class Scopul:
 
 
         """
+        # Read by mido, no need for music21
+        if self._time_sigs is not None:
+            return [
+                TimeSignature(value=f"{numerator}/{denominator}", measure=None if measure == -1 else measure)
+                for _, numerator, denominator, measure in self._time_sigs
+            ]
+
+        from music21 import meter
+
         # List of signatures
         sig_list = []
 
@@ -49,6 +70,34 @@ class Scopul:
     
     @property
     def key(self):
+        """Analyzes the key of the score with music21 ("E- major")
+
+        The result is kept until a part is edited, see get_key()
+        """
+        return self.get_key()
+
+    def get_key(self, method: str = "music21") -> str:
+        """Analyzes the key of the score, the result is kept until a part is edited
+
+        Args:
+            method: "music21" analyzes every part, then the whole score, with music21.
+                "fast" correlates the duration weighted pitch class histogram of the event tables
+                with the Krumhansl-Kessler key profiles, without building a music21 stream
+
+        Returns:
+            A str, like "E- major". None with the "fast" method if the score has no notes
+        """
+        if method == "music21":
+            return self._memoized("key", self._analyze_key)
+        if method == "fast":
+            return self._memoized(
+                "fast_key", lambda: estimate_key(pitch_class_weights(part.event_table for part in self.parts))[0]
+            )
+        raise ValueError(f"method must be 'music21' or 'fast', instead got {method}")
+
+    def _analyze_key(self) -> str:
+        from music21 import stream
+
         s = stream.Stream()
         for part in self.music21.parts:
             try:
@@ -61,6 +110,24 @@ class Scopul:
         # print the key signature
         return f"{key_sig.tonic.name} {key_sig.mode}"
 
+    def _memoized(self, name: str, compute):
+        """Returns the result of compute(), kept until a part is added or edited
+
+        Results are keyed by name, and by the event table (and its version) of every part
+        """
+        tables = [part.event_table for part in self.parts]
+        versions = [table.version for table in tables]
+        cached = self._memo.get(name)
+        if (
+            cached is None
+            or len(cached[0]) != len(tables)
+            or any(old is not new for old, new in zip(cached[0], tables))
+            or cached[1] != versions
+        ):
+            cached = (tables, versions, compute())
+            self._memo[name] = cached
+        return cached[2]
+
     # Midi File (midi)
     @property
     def path(self):
@@ -91,12 +158,162 @@ class Scopul:
         Returns:
             A list of Tempo objects
         """
-        return get_tempos(self.music21)
+        # Read by mido, no need for music21
+        if self._tempos is not None:
+            return [
+                Tempo(round(tempo2bpm(midi_tempo), 2), None if measure == -1 else measure)
+                for _, midi_tempo, measure in self._tempos
+            ]
+
+        # Scanning the music21 score once, until a part is edited
+        return list(self._memoized("tempo_list", lambda: get_tempos(self.music21)))
+
+    @property
+    def tempo_map(self) -> TempoMap:
+        """Retrieves the TempoMap of the score, to convert between ticks, offsets, seconds and measures
+
+        It is built once from the tempos and time signatures, and again after a part is edited
+        """
+        return self._memoized("tempo_map", self._build_tempo_map)
+
+    def _build_tempo_map(self) -> TempoMap:
+        ticks_per_beat = self._ticks_per_beat
+        if ticks_per_beat is None and self.path is not None and pathlib.Path(self.path).is_file():
+            ticks_per_beat = read_ticks_per_beat(self.path)
+        return TempoMap(*self._meta_events(), ticks_per_beat)
+
+    @property
+    def music21(self):
+        """Retrieves the music21 score
+
+        When the file was loaded with engine="mido", the score is only built the first time it is needed
+        """
+        if self._music21 is None:
+            from music21 import stream
+
+            score = stream.Score()
+            for part in self._parts:
+                score.insert(0, part._part)
+            self._music21 = score
+        return self._music21
+
+    @music21.setter
+    def music21(self, score) -> None:
+        self._music21 = score
 
     # ================================== METHODS=============================================
-    def get_audio_length(self) -> int:
-        """Returns the audio length"""
-        return MidiFile(self._audio).length
+    @staticmethod
+    def load_many(paths, workers: int = None, engine: str = "music21", key: bool = True, warm_start=None):
+        """Loads many MIDI files in parallel and yields a ScoreSummary for each, as they finish
+
+        See Scopul.corpus.load_many()
+        """
+        from Scopul.corpus import load_many
+
+        return load_many(paths, workers=workers, engine=engine, key=key, warm_start=warm_start)
+
+    @staticmethod
+    def iter_corpus(
+        directory, workers: int = None, recursive: bool = True, engine: str = "music21", key: bool = True, warm_start=None
+    ):
+        """Loads every MIDI file of a directory in parallel and yields a ScoreSummary for each
+
+        See Scopul.corpus.iter_corpus()
+        """
+        from Scopul.corpus import iter_corpus
+
+        return iter_corpus(
+            directory, workers=workers, recursive=recursive, engine=engine, key=key, warm_start=warm_start
+        )
+
+    @staticmethod
+    async def aload(path, engine: str = "music21", cache=None, executor=None, timeout: float = None) -> "Scopul":
+        """Loads a MIDI file in a process pool, without blocking the event loop
+
+            scop = await Scopul.aload("test.mid")
+
+        See Scopul.async_api.load()
+        """
+        from Scopul.async_api import load
+
+        return await load(path, engine=engine, cache=cache, executor=executor, timeout=timeout)
+
+    async def asave_midi(
+        self, fp=None, overwrite: bool = True, engine: str = "mido", executor=None, timeout: float = None
+    ) -> None:
+        """Saves the MIDI file like save_midi(), serialized in a process pool
+
+        See Scopul.async_api.save_midi()
+        """
+        from Scopul.async_api import save_midi
+
+        await save_midi(self, fp=fp, overwrite=overwrite, engine=engine, executor=executor, timeout=timeout)
+
+    async def agenerate_pdf(
+        self, fp: str = "", title: str = "Scop", overwrite: bool = False, executor=None, timeout: float = None
+    ) -> None:
+        """Generates a pdf like generate_pdf(), without blocking the event loop
+
+        See Scopul.async_api.generate_pdf()
+        """
+        from Scopul.async_api import generate_pdf
+
+        await generate_pdf(self, fp or self.path, title=title, overwrite=overwrite, executor=executor, timeout=timeout)
+
+    def get_audio_length(self) -> float:
+        """Returns the audio length in seconds, up to the end of the last note or rest
+
+        Computed from the tempo map, without reading the file again
+        """
+        def length():
+            end = max(
+                (max(onset + length for onset, length in zip(part.event_table.onset, part.event_table.length))
+                 for part in self.parts if part.event_table.row_count),
+                default=0.0,
+            )
+            return self.tempo_map.offset_to_seconds(end)
+
+        return self._memoized("audio_length", length)
+
+    def note_times(self, part) -> tuple:
+        """Computes the start and end of every note of a part in seconds, see TempoMap.table_times()
+
+        Args:
+            part: a Part, or the index of a part
+
+        Returns:
+            A tuple (starts, ends) of numpy arrays, aligned with the rows of the part's event table
+            (a chord has a row per note)
+        """
+        if not isinstance(part, Part):
+            part = self.parts[part]
+        return self.tempo_map.table_times(part.event_table)
+
+    def seek(self, seconds: float) -> list:
+        """Finds where playback resumes in every part, at a time in seconds
+
+        Returns:
+            A list with an index per part: the first element of the part's sequence still sounding at
+            that time (len(part.sequence) when the part has ended)
+        """
+        import numpy as np
+
+        offset = self.tempo_map.seconds_to_offset(seconds)
+
+        def running_ends():
+            # The latest end of the elements up to every element, so that ends can be binary searched
+            ends = []
+            for part in self.parts:
+                table = part.event_table
+                starts = np.asarray(table.starts, dtype=np.int64)
+                event_ends = np.asarray(table.onset)[starts] + np.asarray(table.length)[starts]
+                ends.append(np.maximum.accumulate(event_ends) if len(starts) else event_ends)
+            return ends
+
+        return [
+            int(np.searchsorted(ends, offset + EPSILON, side="right"))
+            for ends in self._memoized("running_ends", running_ends)
+        ]
     
     # Generate a pdf
     def generate_pdf(
@@ -104,48 +321,40 @@ class Scopul:
         fp: str = "",
         title: str = "Scop",
         overwrite: bool = False,
+        timeout: float = None,
     ) -> None:
 
         """Generates a pdf of the midi
 
-        Creates a pdf by turning it into musicxml then to pdf
+        Creates a pdf by turning it into musicxml (in memory, see to_musicxml()) then to pdf with MuseScore
 
         Args:
             output: a str that represents the name of the file
             fp: a str that represents the file path as to where to save the pdf. Default is '', which will save to the current working directory
+            title: the title printed on the pdf
             overwrite: a boolean, indicates whether to overwrite files or not
+            timeout: the time MuseScore may take, in seconds (optional). To render many scores, see RenderQueue
 
         Returns:
             None, just generates a pdf in the path specified with the name specified
 
         Raises:
             FileExistsError: if overwrite is False and there is a file at the same path
+            subprocess.CalledProcessError: if MuseScore fails
+            subprocess.TimeoutExpired: if MuseScore takes more than timeout seconds
         """
 
         if fp == "":
             fp = self.path
 
         # Looking for muse score path
-        try:
-            mspath = os.environ["MUSESCORE_PATH"]
-        except:
-            raise NoMusePathError(
-                "Path to musescore not set. please set using config_musescore()"
-            )
-
-        # checking for existence of the path
-        if not pathlib.Path(os.environ["MUSESCORE_PATH"]).exists():
-            raise FileNotFoundError(
-                f"MuseScore path at {os.environ['MUSESCORE_PATH']} not found. Please check to see if it exists"
-            )
+        mspath = musescore_path()
 
         # Check for correct file format
         ext = pathlib.Path(fp).suffix
         if ext != ".pdf":
             raise InvalidFileFormatError(f"Expected .pdf, got {ext}")
 
-        midi = self.music21
-
         # Check for overwrite
         if overwrite:
             if pathlib.Path(fp).exists():
@@ -157,10 +366,42 @@ class Scopul:
                     f"{fp} already exists. To overwrite, set overwrite=True"
                 )
 
-        # Creates the pdf and deletes the musicxml file
-        self.generate_musicxml(fp=fp.replace(".pdf", ".xml"),title=title,overwrite=True)
-        subprocess.run(f'"{mspath}" -o "{fp}" "{fp.replace(".pdf", ".xml")}" -T "{title}" 0')
-        os.remove(fp.replace(".pdf", ".xml"))
+        # MuseScore reads the musicxml from a single temporary file, deleted once the pdf is made
+        file = tempfile.NamedTemporaryFile(suffix=".musicxml", delete=False)
+        try:
+            with file:
+                self.to_musicxml(file, title=title)
+            subprocess.run([mspath, "-o", str(fp), file.name], check=True, capture_output=True, timeout=timeout)
+        finally:
+            os.remove(file.name)
+
+    def to_musicxml(self, fp=None, title: str = "scop"):
+        """Exports the score to musicxml in memory with music21, without MuseScore
+
+        Args:
+            fp: a binary file object (optional) to stream the musicxml to
+            title: the movement title of the score, set while the musicxml is generated
+
+        Returns:
+            The musicxml as bytes, None if it was written to fp
+        """
+        from music21 import metadata
+        from music21.musicxml.m21ToXml import GeneralObjectExporter
+
+        score = self.music21
+        previous = score.metadata
+        score_metadata = metadata.Metadata()
+        score_metadata.movementName = title
+        score.metadata = score_metadata
+        try:
+            xml = GeneralObjectExporter(score).parse()
+        finally:
+            # The score keeps its own metadata
+            score.metadata = previous
+
+        if fp is None:
+            return xml
+        fp.write(xml)
 
     def generate_musicxml(
         self,
@@ -168,111 +409,259 @@ class Scopul:
         overwrite: bool = False,
         title = 'scop',
     ) -> None:
-        """Generates a musicxml of the midi
+        """Generates a musicxml of the midi, see to_musicxml()
 
         Args:
             output: a str that represents the name of the file
-            fp: a str that represents the file path as to where to save the pdf. Default is '', which will save to the current working directory
+            fp: a str that represents the file path as to where to save the musicxml, or a binary file object to stream it to. Default is '', which will save to the current working directory
             overwrite: a boolean, indicates whether to overwrite files or not
+            title: the movement title of the score
 
         Returns:
-            None, just generates a pdf in the path specified with the name specified
+            None, just generates a musicxml in the path specified with the name specified
 
         Raises:
             FileExistsError: if overwrite is False and there is a file at the same path
         """
+        if hasattr(fp, "write"):
+            self.to_musicxml(fp, title=title)
+            return
+
         if fp == "":
             fp = self.path
 
-        # Looking for muse score path
-        try:
-            mspath = os.environ["MUSESCORE_PATH"]
-        except:
-            raise NoMusePathError(
-                "Path to musescore not set. please set using config_musescore()"
-            )
-
-        # Checking for existence of the path
-        if not pathlib.Path(os.environ["MUSESCORE_PATH"]):
-            raise FileNotFoundError(
-                f"MuseScore path at {os.environ['MUSESCORE_PATH']} not found. Please check to see if it exists"
-            )
-
         # Check for correct file format
         ext = pathlib.Path(fp).suffix
         if ext != ".xml":
             raise InvalidFileFormatError(f"Expected .xml, got {ext}")
 
         # Check for overwrite
-        if overwrite:
-            if pathlib.Path(fp).exists():
-                os.remove(fp)
+        if not overwrite and pathlib.Path(fp).exists():
+            raise FileExistsError(
+                f"{fp} already exists. To overwrite, set overwrite=True"
+            )
 
-        # If not overwrite
+        with open(fp, "wb") as file:
+            self.to_musicxml(file, title=title)
+
+    # (Re)constructor
+    def construct(self, path, engine: str = None, cache=None) -> None:
+        """Constructor function to reconstruct the object
+
+        Can also be called with a setter to the midi property. For example:
+
+        testmidi.path = "test.mid"
+
+        Args:
+            path: path to the MIDI file
+            engine: "music21" (default) parses the file with music21. "mido" reads the file with mido
+                only, the music21 score is then built the first time it is needed (key analysis, export...)
+            cache: a ParseCache, or a path to a cache directory (optional). Files already in the cache
+                are not parsed again, the music21 score is then built from the cached event tables when needed
+
+        Raises:
+            ValueError: if the engine is not "music21" or "mido"
+        """
+        # Keeping the engine and cache when reconstructing
+        if engine is None:
+            engine = getattr(self, "_engine", "music21")
+        if cache is None:
+            cache = getattr(self, "_cache", None)
+        elif not isinstance(cache, ParseCache):
+            cache = ParseCache(cache)
+
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, instead got {engine}")
+
+        self._path = path
+        self._engine = engine
+        self._cache = cache
+        # name -> (tables, table versions, result), see _memoized()
+        self._memo = {}
+
+        cached = None
+        if cache is not None:
+            key = cache.key(path, engine)
+            cached = cache.get(key)
+
+        if cached is not None:
+            self._from_event_tables(*cached)
+        elif engine == "mido":
+            self._from_event_tables(*load_midi(path))
         else:
-            if pathlib.Path(fp).exists():
-                raise FileExistsError(
-                    f"{fp} already exists. To overwrite, set overwrite=True"
-                )
+            from music21 import converter
 
+            self._tempos = None
+            self._time_sigs = None
+            self._ticks_per_beat = None
+            self._music21 = converter.parse(path).makeMeasures()
+            self._parts = [Part(part) for part in self._music21.parts]
+            for part in self._parts:
+                part._score = self
 
-        # Creates the pdf and deletes the musicxml file
-        subprocess.run(f'"{mspath}" -o "{fp}" "{self.path}" -T {title} 0')
+        if cache is not None and cached is None:
+            tempos, time_sigs = self._meta_events()
+            parts = [(part.name, part.event_table) for part in self._parts]
+            cache.put(key, parts, tempos, time_sigs, self._ticks_per_beat)
 
-        # Open the file and read all the lines into a list
-        with open(fp, 'r') as file:
-            lines = file.readlines()
+    def _from_event_tables(self, parts: list, tempos: list, time_sigs: list, ticks_per_beat: int = None) -> None:
+        """Builds the parts from event tables, the music21 score is only built when needed
 
-        # Insert the new line at index 3
-        lines.insert(3, f'<movement-title>{title}</movement-title>\n')
+        Args:
+            parts: a list of (name, EventTable)
+            tempos: a list of (offset, midi tempo, measure)
+            time_sigs: a list of (offset, numerator, denominator, measure)
+            ticks_per_beat: the resolution of the MIDI file, None if unknown
+        """
+        self._tempos = list(tempos)
+        self._time_sigs = list(time_sigs)
+        self._ticks_per_beat = ticks_per_beat
+        self._music21 = None
+        self._parts = [
+            Part.from_event_table(table, name, self._time_sigs, self._tempos)
+            for name, table in parts
+        ]
+        for part in self._parts:
+            part._score = self
+
+    @classmethod
+    def from_event_tables(
+        cls, path, parts: list, tempos: list, time_sigs: list, ticks_per_beat: int = None, engine: str = "mido"
+    ) -> "Scopul":
+        """Creates a Scopul from an event model (see score_file.load_score()), without reading the file
+
+        The music21 score is only built (from the event tables) the first time it is needed
 
-        # Open the file in write mode and write the modified lines back to the file
-        with open(fp, 'w') as file:
-            file.writelines(lines)
+        Args:
+            path: the path of the MIDI file the events were read from
+            parts, tempos, time_sigs, ticks_per_beat: see _from_event_tables()
+            engine: the engine the events were read with, kept when the path is changed
+        """
+        scop = cls.__new__(cls)
+        scop._path = path
+        scop._engine = engine
+        scop._cache = None
+        scop._memo = {}
+        scop._from_event_tables(parts, tempos, time_sigs, ticks_per_beat)
+        return scop
 
-    # (Re)constructor
-    def construct(self, path) -> None:
-        """Constructor function to reconstruct the object
+    def save_binary(self, fp) -> None:
+        """Saves the parts, tempos and time signatures in Scopul's memory-mappable binary format
 
-        Can also be called with a setter to the midi property. For example:
+        Reopening the file with Scopul.open_binary() needs neither mido nor music21, see
+        Scopul.score_file.dump_score()
 
-        testmidi.music21 = "test.mid"
+        Args:
+            fp: the path of the file, replaced if it exists
+        """
+        tempos, time_sigs = self._meta_events()
+        parts = [(part.name, part.event_table) for part in self._parts]
+        write_score(fp, parts, tempos, time_sigs, self._ticks_per_beat, source=self.path)
+
+    @classmethod
+    def open_binary(cls, fp) -> "Scopul":
+        """Opens a file written by save_binary(), memory-mapped instead of read
 
+        The event tables are views of the file until they are edited, and the music21 score is only
+        built when it is needed. The path of the score is the path of the MIDI file it was saved from
+
+        Raises:
+            ValueError: if the file is not in Scopul's binary format
         """
+        parts, tempos, time_sigs, ticks_per_beat, source = open_score(fp)
+        return cls.from_event_tables(source, parts, tempos, time_sigs, ticks_per_beat)
 
-        self._path = path
-        self.music21 = converter.parse(path).makeMeasures()
-        self._parts = []
-        for part in self.music21.parts:
-            self._parts.append(Part(part))
+    def _dump(self) -> bytes:
+        """Serializes the parts, tempos and time signatures, see score_file.dump_score()"""
+        tempos, time_sigs = self._meta_events()
+        parts = [(part.name, part.event_table) for part in self._parts]
+        return dump_score(parts, tempos, time_sigs, self._ticks_per_beat)
+
+    def _drop_meta_events(self) -> None:
+        """Drops the tempos and time signatures read by mido (or from a cache) after a part changed
+        them, they are read again from the music21 score"""
+        self._tempos = None
+        self._time_sigs = None
+
+    def _meta_events(self) -> tuple:
+        """Retrieves the tempos and time signatures as tuples
 
-    def save_midi(self, fp=None, overwrite=True):
+        Returns:
+            A tuple (tempos, time_sigs) where
+                tempos: a list of (offset, midi tempo, measure)
+                time_sigs: a list of (offset, numerator, denominator, measure)
+        """
+        if self._tempos is not None:
+            return self._tempos, self._time_sigs
+
+        from music21 import meter, tempo
+
+        tempos = []
+        time_sigs = []
+        for meta_message in self.music21.flat:
+            measure = meta_message.measureNumber if meta_message.measureNumber is not None else -1
+            if isinstance(meta_message, tempo.MetronomeMark) and meta_message.number:
+                tempos.append((float(meta_message.offset), bpm2tempo(meta_message.number), measure))
+            elif isinstance(meta_message, meter.TimeSignature):
+                time_sigs.append(
+                    (float(meta_message.offset), meta_message.numerator, meta_message.denominator, measure)
+                )
+
+        return tempos, time_sigs
+
+    def to_midi(self):
+        """Serializes the parts, tempos and time signatures straight to a mido MidiFile
+
+        The event tables are written as they are (velocities, onsets and the length of every note
+        included), without music21. See Scopul.midi_writer.build_midi()
+
+        Returns:
+            A mido MidiFile
+        """
+        from Scopul.midi_writer import build_midi
+
+        return build_midi([(part.name, part.event_table) for part in self.parts], self.tempo_map)
+
+    def save_midi(self, fp=None, overwrite=True, engine: str = "mido"):
         """
         Save the MIDI file to the specified output file path.
 
         Args:
             self: A reference to the current object.
-            output (str): The name of the MIDI output file.
-            fp (str, optional): The path to the directory where the output file will be saved. Defaults to the current directory.
-            overwrite (bool, optional): Whether to overwrite the output file if it already exists. Defaults to False.
+            fp (str or file object, optional): The path of the output file, or a binary file object
+                (like io.BytesIO) to stream the file to. Defaults to the path of the score.
+            overwrite (bool, optional): Whether to overwrite the output file if it already exists. Defaults to True.
+            engine (str, optional): "mido" (default) writes the event tables directly, see to_midi().
+                Its onsets and lengths are quantized, so the file read back can differ slightly from
+                the score. "music21" writes the music21 score with music21
 
         Raises:
             InvalidFileFormatError: If the output file has an invalid file extension.
             FileExistsError: If the output file already exists and overwrite is set to False.
+            ValueError: If the engine is not "music21" or "mido"
 
         Returns:
             None
         """
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, instead got {engine}")
 
         if not fp:
             fp = self.path
+
+        # Streaming to a file object
+        if hasattr(fp, "write"):
+            if engine == "mido":
+                self.to_midi().save(file=fp)
+            else:
+                fp.write(self._music21_midi_bytes())
+            return
+
         # Check for correct file format
         ext = pathlib.Path(fp).suffix
         if ext != ".mid":
             raise InvalidFileFormatError(f"Expected .mid, got {ext}")
 
-        midi = self.music21
-
         # Check for overwrite
         if overwrite:
             if pathlib.Path(fp).exists():
@@ -285,9 +674,18 @@ class Scopul:
                     f"{fp} already exists. To overwrite, set overwrite=True"
                 )
 
+        if engine == "mido":
+            self.to_midi().save(fp)
+        else:
+            self.music21.write("midi", fp=fp)
+
+    def _music21_midi_bytes(self) -> bytes:
+        """Translates the music21 score to the bytes of a MIDI file with music21"""
+        from music21 import midi
+
+        midi_file = midi.translate.streamToMidiFile(self.music21)
+        return midi_file.writestr()
 
-        midi.write("midi", fp=fp)
-    
     def append_part(self, part: Part) -> None:
         """Appends a Scopul Part to the object
 
@@ -297,7 +695,63 @@ class Scopul:
         Returns:
             None
         """
-        self._parts.append(part._part)
+        self._parts.append(part)
+        part._score = self
+        if self._music21 is not None:
+            self._music21.insert(0, part._part)
+
+    def iter_events(self, kinds: Iterable = None, start_measure: int = None, end_measure: int = None):
+        """Yields the chords, notes and rests of every part lazily, merged in onset order
+
+        Args:
+            see Part.iter_events()
+
+        Yields:
+            Tuples (part, element), part being the Part the element belongs to
+        """
+        def events(part_idx, part):
+            for onset, idx in part._iter_indices(kinds, start_measure, end_measure):
+                yield onset, part_idx, idx
+
+        parts = self.parts
+        merged = heapq.merge(*(events(part_idx, part) for part_idx, part in enumerate(parts)))
+        for _, part_idx, idx in merged:
+            part = parts[part_idx]
+            wrapper = part._wrappers[idx]
+            yield part, wrapper if wrapper is not None else part._new_wrapper(idx)
+
+    def stats(self) -> EventStats:
+        """Computes the element statistics of every part together, see Part.stats()
+
+        The result is kept until a part is edited
+
+        Returns:
+            An EventStats object
+        """
+        return self._memoized("stats", lambda: event_stats(part.event_table for part in self.parts))
+
+    def pitch_stats(self) -> PitchStats:
+        """Computes the pitch statistics of every part together, see Part.pitch_stats()
+
+        Returns:
+            A PitchStats object
+        """
+        return pitch_stats(part.event_table for part in self.parts)
+
+    def edit(self) -> ScoreEdit:
+        """Starts a batch of edits to the parts, applied together when the with block ends
+
+            with scop.edit() as tx:
+                tx.part(0).insert(Note(name="C5"), 3, 0)
+                tx.insert_time_signature("3/4", 9)
+                tx.insert_tempo(120, 9)
+
+        If an edit fails, every part is restored. See ScoreEdit
+
+        Returns:
+            A ScoreEdit
+        """
+        return ScoreEdit(self)
 
 
 # ---------------------------------------------------DEPRECATED-------------------------------------------------------------------------------
@@ -322,6 +776,8 @@ class Scopul:
         If a metronome mark already exists at the specified location, its tempo
         will be updated to the new tempo value
         """
+        from music21 import stream, tempo, note, chord, meter
+
         # Checking if part is a scopul part
         if not isinstance(part, Part):
             raise TypeError("Provided part is not a Scopul Part object")
@@ -377,6 +833,8 @@ class Scopul:
         Returns:
             None, only modifies the midi
         """
+        from music21 import stream, tempo, note, chord, meter
+
         # Getting the Music21 converter object and the Muic21 part object
         midi_file = self.music21
         part = part._part
@@ -428,6 +886,8 @@ class Scopul:
         Returns:
             None
         """
+        from music21 import stream
+
         if not isinstance(element, (Note, Rest, Chord)):
             raise ValueError("Not a Scopul musical element (Notes, Rests, Chords)")
         
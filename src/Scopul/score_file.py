@@ -0,0 +1,195 @@
+import json
+import mmap
+import os
+import pathlib
+import struct
+import sys
+import tempfile
+from array import array
+from Scopul.EventTable import EventTable
+
+MAGIC = b"SCOPUL"
+FORMAT_VERSION = 3
+
+# Every column starts on a multiple of ALIGNMENT bytes, so it can be viewed in place
+ALIGNMENT = 64
+
+# magic, format version, ticks per beat (0 if unknown), tempo count, time signature count,
+# part count, length of the JSON metadata
+HEADER = struct.Struct("<6sHIIIII")
+
+TEMPO_COLUMNS = (("offset", "d"), ("midi_tempo", "I"), ("measure", "i"))
+TIME_SIG_COLUMNS = (("offset", "d"), ("numerator", "I"), ("denominator", "I"), ("measure", "i"))
+TABLE_COLUMNS = EventTable.COLUMNS + (("starts", "i"),)
+
+
+def _padding(position: int) -> int:
+    return -position % ALIGNMENT
+
+
+def _little_endian(values: array) -> bytes:
+    """Returns the bytes of an array in little-endian order"""
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _event_columns(events: list, columns: tuple) -> list:
+    """Turns a list of event tuples into an array per column"""
+    return [array(typecode, (event[idx] for event in events)) for idx, (_, typecode) in enumerate(columns)]
+
+
+def dump_score(parts: list, tempos: list, time_sigs: list, ticks_per_beat: int = None, source=None) -> bytes:
+    """Serializes the event model of a score into Scopul's binary format
+
+    The data holds a header, JSON metadata (the source path and the name, size and percussion flag
+    of every part), then every column as a little-endian array aligned on ALIGNMENT bytes: the
+    tempo columns, the time signature columns, and the event columns of every part. A file of this
+    data can be memory-mapped and its columns viewed in place, see open_score()
+
+    Args:
+        parts: a list of (name, EventTable)
+        tempos: a list of (offset, midi tempo, measure)
+        time_sigs: a list of (offset, numerator, denominator, measure)
+        ticks_per_beat: the resolution of the MIDI file, None if unknown
+        source: the path of the MIDI file the score was read from (optional)
+
+    Returns:
+        bytes
+    """
+    metadata = {
+        "source": None if source is None else str(source),
+        "parts": [
+            {"name": name, "events": len(table), "rows": table.row_count, "percussion": table.percussion}
+            for name, table in parts
+        ],
+    }
+    encoded = json.dumps(metadata).encode("utf-8")
+
+    columns = _event_columns(tempos, TEMPO_COLUMNS) + _event_columns(time_sigs, TIME_SIG_COLUMNS)
+    for _, table in parts:
+        columns += [getattr(table, column) for column, _ in TABLE_COLUMNS]
+
+    blocks = [
+        HEADER.pack(MAGIC, FORMAT_VERSION, ticks_per_beat or 0, len(tempos), len(time_sigs), len(parts), len(encoded)),
+        encoded,
+    ]
+    position = HEADER.size + len(encoded)
+    for values in columns:
+        blocks.append(bytes(_padding(position)))
+        position += _padding(position)
+        data = _little_endian(values)
+        blocks.append(data)
+        position += len(data)
+    return b"".join(blocks)
+
+
+def _column(buffer, position: int, typecode: str, count: int) -> tuple:
+    """Returns a view of a column of buffer (a copy on big-endian machines), and the position after it"""
+    position += _padding(position)
+    size = count * array(typecode).itemsize
+    if position + size > len(buffer):
+        raise ValueError("Truncated Scopul binary score")
+    view = buffer[position : position + size]
+    if sys.byteorder == "big":
+        values = array(typecode)
+        values.frombytes(view)
+        values.byteswap()
+    else:
+        values = view.cast(typecode)
+    return values, position + size
+
+
+def _read(data) -> tuple:
+    """Reads data written by dump_score(), see open_score() for what is returned"""
+    buffer = memoryview(data).cast("B")
+    if len(buffer) < HEADER.size:
+        raise ValueError("Not a Scopul binary score")
+
+    magic, version, ticks_per_beat, tempo_count, time_sig_count, part_count, metadata_length = HEADER.unpack_from(buffer)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise ValueError("Not a Scopul binary score, or written by an incompatible version")
+
+    position = HEADER.size + metadata_length
+    metadata = json.loads(bytes(buffer[HEADER.size : position]).decode("utf-8"))
+
+    tempo_columns = []
+    for _, typecode in TEMPO_COLUMNS:
+        values, position = _column(buffer, position, typecode, tempo_count)
+        tempo_columns.append(values)
+
+    time_sig_columns = []
+    for _, typecode in TIME_SIG_COLUMNS:
+        values, position = _column(buffer, position, typecode, time_sig_count)
+        time_sig_columns.append(values)
+
+    parts = []
+    for part in metadata["parts"][:part_count]:
+        table = EventTable()
+        for column, typecode in TABLE_COLUMNS:
+            count = part["events"] if column == "starts" else part["rows"]
+            values, position = _column(buffer, position, typecode, count)
+            setattr(table, column, values)
+        table.elements = [None] * part["events"]
+        table.percussion = part.get("percussion", False)
+        parts.append((part["name"], table))
+
+    tempos = list(zip(*tempo_columns)) if tempo_count else []
+    time_sigs = list(zip(*time_sig_columns)) if time_sig_count else []
+    return parts, tempos, time_sigs, ticks_per_beat or None, metadata["source"]
+
+
+def load_score(data) -> tuple:
+    """Reads data written by dump_score()
+
+    The columns of the event tables are read-only views of data, copied into arrays the first
+    time a table is edited
+
+    Args:
+        data: a bytes-like object
+
+    Returns:
+        A tuple (parts, tempos, time_sigs, ticks_per_beat), see dump_score()
+
+    Raises:
+        ValueError: if data is not in Scopul's binary format
+    """
+    return _read(data)[:4]
+
+
+def write_score(path, parts: list, tempos: list, time_sigs: list, ticks_per_beat: int = None, source=None) -> None:
+    """Writes a score to a file with dump_score(), the file is replaced at once
+
+    Written to a temporary file first, so other processes never read half a file
+    """
+    data = dump_score(parts, tempos, time_sigs, ticks_per_beat, source)
+    path = pathlib.Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        pathlib.Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def open_score(path) -> tuple:
+    """Opens a file written by write_score(), memory-mapped instead of read
+
+    The columns of the event tables are read-only memoryviews of the file: numpy.asarray() wraps
+    them without a copy, and a table is copied into arrays when it is edited
+
+    Returns:
+        A tuple (parts, tempos, time_sigs, ticks_per_beat, source), see dump_score()
+
+    Raises:
+        ValueError: if the file is not in Scopul's binary format
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size < HEADER.size:
+            raise ValueError("Not a Scopul binary score")
+        # The mapping stays open after the file is closed, as long as a view uses it
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return _read(buffer)
@@ -0,0 +1,37 @@
+import sys
+import pytest
+
+# Stands in for MuseScore: copies the input of every job to its output, given a job file (-j) or
+# an input and an output (-o). Skips the files named "broken", takes a while on the files named
+# "slow" and hangs on the files named "hang"
+STUB = """#!{python}
+import json, shutil, sys, time
+
+args = sys.argv[1:]
+if "-j" in args:
+    jobs = json.load(open(args[args.index("-j") + 1]))
+else:
+    jobs = [{{"in": args[-1], "out": args[args.index("-o") + 1]}}]
+
+failed = False
+for job in jobs:
+    if "hang" in job["in"] or "hang" in job["out"]:
+        time.sleep(60)
+    if "slow" in job["in"]:
+        time.sleep(0.6)
+    if "broken" in job["in"]:
+        failed = True
+        continue
+    shutil.copy(job["in"], job["out"])
+sys.exit(1 if failed else 0)
+"""
+
+
+@pytest.fixture
+def musescore(tmp_path, monkeypatch):
+    stub = tmp_path / "mscore"
+    stub.write_text(STUB.format(python=sys.executable))
+    stub.chmod(0o755)
+    # What config_musescore() sets, restored after the test
+    monkeypatch.setenv("MUSESCORE_PATH", str(stub))
+    return stub
@@ -0,0 +1,76 @@
+import asyncio
+import io
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul
+from Scopul.async_api import shutdown_executor
+
+file1 = "testfiles/test1.mid"
+
+
+@pytest.fixture(scope="module", autouse=True)
+def executor():
+    yield
+    shutdown_executor()
+
+
+def test_aload():
+    scop = asyncio.run(Scopul.aload(file1, engine="mido"))
+    expected = Scopul(file1, engine="mido")
+
+    assert [part.name for part in scop.parts] == [part.name for part in expected.parts]
+    assert list(scop.parts[0].event_table.pitch) == list(expected.parts[0].event_table.pitch)
+    assert scop.tempo_list[0].midi_tempo == expected.tempo_list[0].midi_tempo
+    assert scop._music21 is None
+
+
+def test_aload_timeout():
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(Scopul.aload(file1, timeout=0))
+
+
+def test_asave_midi():
+    scop = Scopul(file1, engine="mido")
+    buffer = io.BytesIO()
+    asyncio.run(scop.asave_midi(buffer))
+
+    expected = io.BytesIO()
+    scop.save_midi(expected)
+    assert buffer.getvalue() == expected.getvalue()
+
+    buffer = io.BytesIO()
+    asyncio.run(scop.asave_midi(buffer, engine="mido"))
+    expected = io.BytesIO()
+    scop.save_midi(expected, engine="mido")
+    assert buffer.getvalue() == expected.getvalue()
+
+
+def test_agenerate_pdf(tmp_path, musescore):
+    scop = Scopul(file1, engine="mido")
+    path = tmp_path / "test1.pdf"
+    asyncio.run(scop.agenerate_pdf(str(path), title="Test title"))
+    assert b"<movement-title>Test title</movement-title>" in path.read_bytes()
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(scop.agenerate_pdf(str(tmp_path / "hang.pdf"), timeout=5))
+
+
+def test_agenerate_pdf_cancel(tmp_path, musescore):
+    scop = Scopul(file1, engine="mido")
+
+    async def cancel():
+        task = asyncio.create_task(scop.agenerate_pdf(str(tmp_path / "hang.pdf")))
+        await asyncio.sleep(3)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(cancel())
@@ -0,0 +1,93 @@
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, Note, ParseCache
+from Scopul.EventTable import EventTable
+from Scopul.score_file import open_score
+
+file1 = "testfiles/test1.mid"
+file2 = "testfiles/test2.mid"
+
+
+def test_binary_round_trip(tmp_path):
+    scop = Scopul(file2, engine="mido")
+    path = tmp_path / "test2.scopb"
+    scop.save_binary(path)
+
+    opened = Scopul.open_binary(path)
+    assert opened.path == file2
+    assert opened._music21 is None
+    assert [part.name for part in opened.parts] == [part.name for part in scop.parts]
+    assert opened.tempo_list[0].midi_tempo == scop.tempo_list[0].midi_tempo
+    assert opened.time_sig_list[0].ratio == scop.time_sig_list[0].ratio
+
+    for part, opened_part in zip(scop.parts, opened.parts):
+        for column, _ in EventTable.COLUMNS:
+            assert list(getattr(opened_part.event_table, column)) == list(getattr(part.event_table, column))
+        assert len(opened_part.sequence) == len(part.sequence)
+
+
+def test_binary_percussion(tmp_path):
+    # Percussion notes are not stored, the parts holding them stay marked as percussion
+    scop = Scopul("testfiles/test4.mid", engine="mido")
+    path = tmp_path / "test4.scopb"
+    scop.save_binary(path)
+    assert Scopul.open_binary(path).parts[0].event_table.percussion
+
+
+def test_binary_views(tmp_path):
+    np = pytest.importorskip("numpy")
+
+    scop = Scopul(file1, engine="mido")
+    path = tmp_path / "test1.scopb"
+    scop.save_binary(path)
+    table = Scopul.open_binary(path).parts[0].event_table
+
+    # Columns are views of the file, numpy wraps them without a copy
+    onset = np.asarray(table.onset)
+    assert not onset.flags.writeable
+    assert onset.ctypes.data % 64 == 0
+    assert list(onset) == list(scop.parts[0].event_table.onset)
+
+
+def test_binary_edit(tmp_path):
+    scop = Scopul(file1, engine="mido")
+    path = tmp_path / "test1.scopb"
+    scop.save_binary(path)
+
+    opened = Scopul.open_binary(path)
+    part = opened.parts[0]
+    part.insert(Note(name="C5"), 2, 0)
+    assert any(note.name == "C5" and note.measure == 2 for note in part.get_notes())
+
+    # Saving over the opened file
+    opened.save_binary(path)
+    reopened = Scopul.open_binary(path).parts[0]
+    assert len(reopened.sequence) == len(part.sequence)
+    assert list(reopened.event_table.pitch) == list(part.event_table.pitch)
+
+
+def test_cache_entries(tmp_path):
+    # Entries of the parse cache are in the same format, they can be memory-mapped too
+    cache = ParseCache(tmp_path / "cache")
+    scop = Scopul(file1, engine="mido", cache=cache)
+    entry = cache._entry(cache.key(file1, "mido"))
+
+    parts, tempos, _, _, _ = open_score(entry)
+    assert [name for name, _ in parts] == [part.name for part in scop.parts]
+    assert list(parts[0][1].pitch) == list(scop.parts[0].event_table.pitch)
+    assert tempos[0][1] == scop.tempo_list[0].midi_tempo
+
+
+def test_not_binary(tmp_path):
+    path = tmp_path / "test1.scopb"
+    path.write_bytes(b"not a score" * 10)
+    with pytest.raises(ValueError):
+        Scopul.open_binary(path)
@@ -0,0 +1,48 @@
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, ParseCache
+
+file1 = "testfiles/test1.mid"
+file2 = "testfiles/test2.mid"
+
+
+def test_cache_hit(tmp_path):
+    fresh = Scopul(file1, cache=tmp_path)
+    cached = Scopul(file1, cache=tmp_path)
+
+    # Loaded from the cache, the music21 score is not parsed
+    assert cached._music21 is None
+    assert [part.name for part in cached.parts] == [part.name for part in fresh.parts]
+    assert len(cached.parts[0].sequence) == len(fresh.parts[0].sequence)
+    assert list(cached.parts[0].event_table.pitch) == list(fresh.parts[0].event_table.pitch)
+    assert cached.time_sig_list[0].ratio == fresh.time_sig_list[0].ratio
+    assert cached.tempo_list[0].midi_tempo == fresh.tempo_list[0].midi_tempo
+
+
+def test_cache_key(tmp_path):
+    cache = ParseCache(tmp_path)
+
+    assert cache.key(file1, "music21") == cache.key(file1, "music21")
+    assert cache.key(file1, "music21") != cache.key(file1, "mido")
+    assert cache.key(file1, "mido") != cache.key(file2, "mido")
+
+
+def test_cache_eviction(tmp_path):
+    cache = ParseCache(tmp_path)
+    Scopul(file1, engine="mido", cache=cache)
+    entry_size = cache.size
+
+    # Room for one entry only, the least recently used one is evicted
+    cache.max_bytes = entry_size
+    Scopul(file2, engine="mido", cache=cache)
+
+    assert cache.get(cache.key(file1, "mido")) is None
+    assert cache.get(cache.key(file2, "mido")) is not None
@@ -0,0 +1,82 @@
+import glob
+import os
+import sys
+import inspect
+import pytest
+import music21
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, Chord, Note
+from Scopul import InvalidMusicElementError
+from Scopul.scopul_exception import PercussionChordifyError
+
+file1 = "testfiles/test1.mid"
+corpus = sorted(glob.glob("testfiles/*.mid"))
+
+
+def test_chord_progression_edits():
+    progression = Scopul(file1).parts[0].get_chord_progression()
+    figures = list(progression.roman_chords)
+    assert progression.length == len(progression.chords) == len(figures)
+
+    triad = Chord(notes=[Note(name="C4"), Note(name="E4"), Note(name="G4")])
+    progression.append(triad)
+    assert progression.roman_chords[-1] == music21.roman.romanNumeralFromChord(triad.music21).figure
+    assert progression.chords[-1] is triad
+
+    progression.delete(0)
+    assert progression.roman_chords == figures[1:] + [progression.roman_chords[-1]]
+    assert len(progression.music21.getElementsByClass("Chord")) == progression.length
+
+    with pytest.raises(InvalidMusicElementError):
+        progression.append(Note(name="C4"))
+
+
+def test_chord_progression_transpose():
+    progression = Scopul(file1).parts[0].get_chord_progression()
+    figures = list(progression.roman_chords)
+    tonic, mode = progression.key.split()
+    pitches = progression.chords[0].pitches
+
+    progression.transpose(2)
+    assert progression.roman_chords == figures
+    assert progression.chords[0].pitches == [pitch + 2 for pitch in pitches]
+    assert progression.key.split()[1] == mode
+    assert progression.key.split()[0] == music21.key.Key(tonic, mode).transpose(2).tonic.name
+
+
+@pytest.mark.parametrize("path", corpus)
+def test_fast_engine_matches_music21(path):
+    try:
+        scop = Scopul(path)
+    except Exception:
+        pytest.skip(f"music21 cannot read {path}")
+
+    for part in scop.parts:
+        # Percussion notes have no pitch, both engines reject their parts
+        if part.event_table.percussion:
+            with pytest.raises(PercussionChordifyError):
+                part.get_chord_progression()
+            with pytest.raises(PercussionChordifyError):
+                part.get_chord_progression(engine="fast")
+            continue
+
+        slow = part.get_chord_progression()
+        fast = part.get_chord_progression(engine="fast")
+
+        # The music21 engine is compared with figures computed without the RomanCache, the fast
+        # engine with the music21 engine, chord for chord
+        chords = part._part.chordify().recurse().getElementsByClass("Chord")
+        assert slow.roman_chords == [music21.roman.romanNumeralFromChord(chord).figure for chord in chords]
+        assert fast.roman_chords == slow.roman_chords
+        assert [chord.length for chord in fast.chords] == pytest.approx([chord.length for chord in slow.chords])
+
+    part = scop.parts[0]
+    if not part.event_table.percussion:
+        assert part.get_chord_progression(engine="fast").key.split()[1] in ("major", "minor")
+        with pytest.raises(ValueError):
+            part.get_chord_progression(engine="slow")
@@ -0,0 +1,82 @@
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, ScoreSummary, Tempo
+
+directory = "testfiles"
+file1 = "testfiles/test1.mid"
+
+
+class CrashingPath(str):
+    """A path that kills the worker process unpickling it"""
+
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+class LocalPath(str):
+    """A path that can not be pickled"""
+
+    def __reduce__(self):
+        raise TypeError("cannot pickle LocalPath")
+
+
+def test_iter_corpus():
+    summaries = list(Scopul.iter_corpus(directory, workers=2, engine="mido", key=False))
+    midi_files = [name for name in os.listdir(directory) if name.endswith(".mid")]
+
+    assert len(summaries) == len(midi_files)
+    assert all(isinstance(summary, ScoreSummary) for summary in summaries)
+
+    # test1_quantized.mid is truncated (its header declares 3 tracks, it holds 1): it gets an error summary
+    broken = os.path.join(directory, "test1_quantized.mid")
+    for summary in summaries:
+        assert summary.ok == (summary.path != broken)
+    assert "EOFError" in next(summary.error for summary in summaries if summary.path == broken)
+
+
+def test_summary():
+    summary = next(Scopul.load_many([file1], workers=1))
+    scop = Scopul(file1)
+
+    assert summary.parts == [part.name for part in scop.parts]
+    assert summary.note_count == sum(part.get_note_count() for part in scop.parts)
+    assert summary.key == scop.key
+    assert isinstance(summary.tempo_list[0], Tempo)
+    assert summary.length > 0
+
+
+def test_errors_per_file():
+    paths = [file1, "testfiles/missing.mid", "testfiles/New Text Document.txt"]
+    summaries = {summary.path: summary for summary in Scopul.load_many(paths, workers=2, engine="mido", key=False)}
+
+    assert summaries[file1].ok
+    assert not summaries["testfiles/missing.mid"].ok
+    assert not summaries["testfiles/New Text Document.txt"].ok
+
+
+def test_crashed_worker():
+    crash = CrashingPath("testfiles/crash.mid")
+    paths = [crash] + [file1] * 11
+    summaries = list(Scopul.load_many(paths, workers=2, engine="mido", key=False))
+
+    # Every file gets a summary, the files after the crash are loaded by a new pool
+    assert len(summaries) == len(paths)
+    assert "BrokenProcessPool" in next(summary.error for summary in summaries if summary.path == crash)
+    assert sum(summary.ok for summary in summaries) >= 4
+
+
+def test_unpicklable_path():
+    unpicklable = LocalPath(file1)
+    summaries = list(Scopul.load_many([unpicklable, file1], workers=2, engine="mido", key=False))
+
+    assert len(summaries) == 2
+    for summary in summaries:
+        assert summary.ok == (summary.path is not unpicklable)
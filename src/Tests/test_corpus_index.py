@@ -0,0 +1,50 @@
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, CorpusIndex
+
+file1 = "testfiles/test1.mid"
+file2 = "testfiles/test2.mid"
+
+
+@pytest.fixture(scope="module")
+def index(tmp_path_factory):
+    path = tmp_path_factory.mktemp("index") / "corpus.idx"
+    with CorpusIndex.build([file1, file2], path, engine="mido", workers=2) as index:
+        yield index
+
+
+def test_query_rhythm(index):
+    part = Scopul(file1, engine="mido").parts[0]
+    rhythm = [0.75, 0.25, 0.5, 0.75, 0.25, 0.5]
+    hits = index.query_rhythm(rhythm, verify=True)
+
+    # Every occurrence found by search_rhythm is found by the index
+    expected = {(file1, 0, part.sequence.index(match[0])) for match in part.search_rhythm(rhythm, overlap=True)}
+    assert expected <= set(hits)
+    assert all(path in (file1, file2) for path, _, _ in hits)
+
+
+def test_short_query(index):
+    # Shorter than a gram, answered as a prefix lookup
+    assert len(index.query_rhythm([0.25])) >= len(index.query_rhythm([0.25, 0.25]))
+
+
+def test_query_intervals(index):
+    part = Scopul(file1, engine="mido").parts[0]
+    table = part.event_table
+    melody = [
+        (idx, max(table.pitch[row] for row in table.event_rows(idx)))
+        for idx in range(len(table))
+        if table.pitch[table.starts[idx]] != -1
+    ]
+    intervals = [melody[pos + 1][1] - melody[pos][1] for pos in range(5)]
+
+    assert (file1, 0, melody[0][0]) in index.query_intervals(intervals)
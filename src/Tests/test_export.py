@@ -0,0 +1,43 @@
+import io
+import os
+import re
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, InvalidFileFormatError
+
+file1 = "testfiles/test1.mid"
+scop = Scopul(file1, engine="mido")
+
+
+def test_to_musicxml():
+    xml = scop.to_musicxml(title="Test title")
+    assert isinstance(xml, bytes)
+    assert b"<movement-title>Test title</movement-title>" in xml
+
+    # Streamed to a file object
+    buffer = io.BytesIO()
+    assert scop.to_musicxml(buffer, title="Test title") is None
+    # music21 gives parts without an instrument a random id on every export
+    part_id = re.compile(rb'"P[0-9a-f]+"')
+    assert part_id.sub(b"", buffer.getvalue()) == part_id.sub(b"", xml)
+
+    # The title is only set while exporting
+    assert scop.music21.metadata is None or scop.music21.metadata.movementName != "Test title"
+
+
+def test_generate_musicxml(tmp_path):
+    path = tmp_path / "test1.xml"
+    scop.generate_musicxml(str(path), title="Test title")
+    assert b"<movement-title>Test title</movement-title>" in path.read_bytes()
+
+    with pytest.raises(FileExistsError):
+        scop.generate_musicxml(str(path))
+    with pytest.raises(InvalidFileFormatError):
+        scop.generate_musicxml(str(tmp_path / "test1.pdf"))
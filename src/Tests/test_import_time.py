@@ -0,0 +1,51 @@
+import os
+import sys
+import inspect
+import subprocess
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+# Modules that must only be imported when they are needed
+LAZY_MODULES = ("music21", "deprecated")
+
+# Median time allowed for "import Scopul", music21 alone takes several seconds to import
+IMPORT_BUDGET = 1.0
+
+
+def run(code):
+    """Runs code in a fresh interpreter (so nothing is already imported) and returns its output"""
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=parentdir,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def test_import_is_lazy():
+    loaded = run(f"import sys, Scopul; print([m for m in {LAZY_MODULES} if m in sys.modules])")
+    assert loaded == "[]"
+
+
+def test_mido_engine_is_lazy():
+    code = (
+        "import sys\n"
+        "from Scopul import Scopul\n"
+        "scop = Scopul('testfiles/test1.mid', engine='mido')\n"
+        "scop.parts[0].sequence, scop.parts[0].get_measure(1), scop.tempo_list, scop.time_sig_list\n"
+        "print('music21' in sys.modules)"
+    )
+    assert run(code) == "False"
+
+
+def test_import_time():
+    code = "import time; start = time.perf_counter(); import Scopul; print(time.perf_counter() - start)"
+    times = sorted(float(run(code)) for _ in range(5))
+
+    print(f"import Scopul: {times[2] * 1000:.1f} ms (median of 5)")
+    assert times[2] < IMPORT_BUDGET
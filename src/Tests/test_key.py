@@ -0,0 +1,66 @@
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, Part, Note
+from Scopul.key_profiles import KEYS, estimate_key, key_correlations, pitch_class_weights
+
+file1 = "testfiles/test1.mid"
+
+
+def test_key_is_memoized():
+    scop = Scopul(file1)
+    key = scop.key
+    cached = scop._memo["key"]
+    assert scop.key == key
+    assert scop._memo["key"] is cached
+
+    # Edits invalidate the key
+    scop.parts[0].insert(Note(name="C5"), 2, 0)
+    scop.key
+    assert scop._memo["key"] is not cached
+
+
+def test_fast_key():
+    scale = Part([Note(name=name) for name in ["C4", "D4", "E4", "F4", "G4", "A4", "B4", "C5"]])
+    key, confidence = estimate_key(pitch_class_weights([scale.event_table]))
+    assert key == "C major"
+    assert 0 < confidence <= 1
+
+    tonic, mode = Scopul(file1).get_key("fast").split()
+    assert mode in ("major", "minor")
+
+    with pytest.raises(ValueError):
+        Scopul(file1).get_key("slow")
+
+
+def test_key_correlations():
+    correlations = key_correlations([[1] + [0] * 11, [0] * 12])
+    assert correlations.shape == (2, len(KEYS))
+    assert not correlations[1].any()
+
+
+def test_key_timeline():
+    part = Scopul(file1).parts[0]
+    timeline = part.key_timeline(window_measures=4, hop=2)
+
+    measures = [measure for measure, _, _ in timeline]
+    assert measures == sorted(measures)
+    assert all(later - earlier == 2 for earlier, later in zip(measures, measures[1:]))
+    for _, key, confidence in timeline:
+        assert key is None or key in KEYS
+        assert -1 <= confidence <= 1
+
+    # A single window covering the whole part gives the key of the part
+    whole = part.key_timeline(window_measures=10**6)
+    assert len(whole) == 1
+    assert whole[0][1] == estimate_key(pitch_class_weights([part.event_table]))[0]
+
+    with pytest.raises(ValueError):
+        part.key_timeline(hop=0)
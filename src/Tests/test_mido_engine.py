@@ -0,0 +1,179 @@
+import collections
+import glob
+import io
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, Part, Note, Rest, Chord
+from Scopul.EventTable import EventTable, REST
+from mido import MidiFile
+
+file1 = "testfiles/test1.mid"
+file2 = "testfiles/test2.mid"
+corpus = sorted(glob.glob("testfiles/*.mid"))
+scop = Scopul(file1, engine="mido")
+
+
+def test_parts():
+    assert type(scop.parts) == list
+    assert type(scop.parts[0]) == Part
+    assert scop.parts[0].name == "Right Hand"
+
+    # The music21 score is not built by reading the parts
+    assert scop._music21 is None
+
+
+def test_meta():
+    music21_scop = Scopul(file2)
+    mido_scop = Scopul(file2, engine="mido")
+
+    assert mido_scop.tempo_list[0].midi_tempo == music21_scop.tempo_list[0].midi_tempo
+    assert mido_scop.tempo_list[0].measure == 1
+    assert scop.time_sig_list[0].ratio == "6/8"
+    assert scop.time_sig_list[0].measure == 1
+
+
+def test_sequence():
+    part = scop.parts[0]
+    sequence = part.sequence
+
+    assert all(isinstance(element, (Note, Rest, Chord)) for element in sequence)
+    assert sequence[0].measure == 1
+    assert part.get_note_count() + part.get_rest_count() + part.get_chord_count() == len(sequence)
+    assert all(element.measure == 2 for element in part.get_measure(2))
+
+
+def test_quantized():
+    table = scop.parts[0].event_table
+
+    # Offsets and lengths are sixteenths or eighth triplets, like music21's
+    for value in list(table.onset) + list(table.note_length):
+        assert min(abs(value * 4 - round(value * 4)), abs(value * 3 - round(value * 3))) < 1e-9
+
+    # Every note of a chord keeps its own length, the chord lasting as long as its longest note
+    rows = table.event_rows(0)
+    assert table.length[rows.start] == max(table.note_length[row] for row in rows)
+    assert min(table.note_length[row] for row in rows) == 0.5
+
+
+def test_to_music21_lengths():
+    table = scop.parts[0].event_table
+    rebuilt = EventTable.from_music21(table.to_music21("Right Hand"))
+
+    # Written lengths survive the music21 part, chord notes of other lengths included
+    def notes(table):
+        return sorted(
+            (table.onset[row], table.pitch[row], table.note_length[row])
+            for row in range(table.row_count)
+            if table.pitch[row] >= 0
+        )
+
+    assert notes(rebuilt) == notes(table)
+
+
+def test_music21_built_lazily():
+    scop = Scopul(file1, engine="mido")
+    assert len(scop.music21.parts) == len(scop.parts)
+
+
+def test_invalid_engine():
+    with pytest.raises(ValueError):
+        Scopul(file1, engine="pretty_midi")
+
+
+def test_save_midi(tmp_path):
+    scop = Scopul(file1, engine="mido")
+    buffer = io.BytesIO()
+    scop.save_midi(buffer, engine="mido")
+
+    # Streamed to a buffer, then read back without music21
+    midi = MidiFile(file=io.BytesIO(buffer.getvalue()))
+    assert midi.ticks_per_beat == MidiFile(file1).ticks_per_beat
+    assert len(midi.tracks) == len(scop.parts) + 1
+
+    path = tmp_path / "saved.mid"
+    scop.save_midi(str(path), engine="mido")
+    saved = Scopul(str(path), engine="mido")
+    for part, saved_part in zip(scop.parts, saved.parts):
+        assert saved_part.name == part.name
+        for column in ("kind", "onset", "length", "note_length", "pitch", "velocity", "measure"):
+            assert list(getattr(saved_part.event_table, column)) == list(getattr(part.event_table, column))
+
+    with pytest.raises(FileExistsError):
+        scop.save_midi(str(path), overwrite=False)
+
+    # Written from the event tables by default
+    default = io.BytesIO()
+    scop.save_midi(default)
+    assert default.getvalue() == buffer.getvalue()
+
+    scop.save_midi(str(path), engine="music21")
+    assert len(Scopul(str(path)).parts) == len(scop.parts)
+
+
+def test_save_midi_time_signatures():
+    # Only the time signatures of the score are written, none for a score without any
+    scop = Scopul(file1, engine="mido")
+    conductor = scop.to_midi().tracks[0]
+    assert [(msg.numerator, msg.denominator) for msg in conductor if msg.type == "time_signature"] == [(6, 8)]
+
+    table = scop.parts[0].event_table
+    bare = Scopul.from_event_tables(scop.path, [("Right Hand", table)], [], [], scop.tempo_map.ticks_per_beat)
+    assert not [msg for msg in bare.to_midi().tracks[0] if msg.type == "time_signature"]
+
+
+
+def sounding_events(part, until: float) -> collections.Counter:
+    """Counts the (onset, pitches) of the notes and chords of a part starting before until
+
+    Notes tied from a previous measure are left out, they start with the note they continue
+    """
+    table = part.event_table
+    events = collections.Counter()
+    for event in range(len(table)):
+        rows = table.event_rows(event)
+        tie = getattr(table.elements[event], "tie", None)
+        if table.kind[rows.start] == REST or table.onset[rows.start] >= until:
+            continue
+        if tie is not None and tie.type != "start":
+            continue
+        events[(table.onset[rows.start], tuple(sorted(table.pitch[row] for row in rows)))] += 1
+    return events
+
+
+@pytest.mark.parametrize("path", corpus)
+def test_music21_parity(path):
+    try:
+        music21_scop = Scopul(path)
+    except Exception:
+        pytest.skip(f"music21 cannot read {path}")
+    mido_scop = Scopul(path, engine="mido")
+    assert len(mido_scop.parts) == len(music21_scop.parts)
+
+    # Tracks without a track_name are named after their instrument
+    named = [
+        any(msg.type == "track_name" for msg in track)
+        for track in MidiFile(path).tracks
+        if any(msg.type == "note_on" for msg in track)
+    ]
+    for music21_part, mido_part, has_name in zip(music21_scop.parts, mido_scop.parts, named):
+        assert mido_part.name is not None
+        if has_name:
+            assert mido_part.name == music21_part.name
+
+        # music21 stretches a measure holding a note longer than the measure (or leaves one empty),
+        # moving the notes after it: the parts are compared up to the first such measure
+        until = float("inf")
+        for measure in music21_part._part.getElementsByClass("Measure"):
+            if measure.duration.quarterLength != measure.barDuration.quarterLength:
+                until = float(measure.offset)
+                break
+
+        assert sounding_events(mido_part, until) == sounding_events(music21_part, until)
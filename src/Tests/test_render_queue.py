@@ -0,0 +1,77 @@
+import os
+import sys
+import inspect
+import time
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import RenderQueue
+
+
+def sources(tmp_path, names):
+    paths = []
+    for name in names:
+        path = tmp_path / f"{name}.musicxml"
+        path.write_text(name)
+        paths.append(path)
+    return paths
+
+
+def test_render_queue(tmp_path, musescore):
+    queue = RenderQueue(renderers=2, batch_size=3)
+    names = [f"score{idx}" for idx in range(5)] + ["broken"]
+    for path in sources(tmp_path, names):
+        queue.add(path, path.with_suffix(".pdf"))
+    assert len(queue) == 6
+
+    results = queue.run()
+    assert len(queue) == 0
+    assert [result.ok for result in results] == [True] * 5 + [False]
+    assert results[-1].status == "failed"
+    assert all((tmp_path / f"{name}.pdf").read_text() == name for name in names[:5])
+
+
+def test_render_queue_timeout(tmp_path, musescore):
+    queue = RenderQueue(renderers=2, batch_size=2, timeout=1)
+    for path in sources(tmp_path, ["hang", "score"]):
+        queue.add(path, path.with_suffix(".pdf"))
+
+    hang, score = queue.run()
+    assert hang.status == "timeout"
+    assert score.ok
+
+
+def test_render_queue_timeout_per_job(tmp_path, musescore):
+    # A hung job stops its run after one timeout, not one per job of the batch
+    queue = RenderQueue(batch_size=4, timeout=1)
+    for path in sources(tmp_path, ["hang", "score0", "score1", "score2"]):
+        queue.add(path, path.with_suffix(".pdf"))
+
+    start = time.perf_counter()
+    results = queue.run()
+    assert time.perf_counter() - start < 3.5
+    assert [result.status for result in results] == ["timeout", "ok", "ok", "ok"]
+
+    # A batch may take longer than the timeout as long as every job is within it
+    queue = RenderQueue(batch_size=3, timeout=1)
+    for path in sources(tmp_path, ["slow0", "slow1", "slow2"]):
+        queue.add(path, path.with_suffix(".pdf"))
+
+    results = queue.run()
+    assert all(result.ok for result in results)
+    assert results[0].seconds > 1
+
+
+def test_render_queue_overwrite(tmp_path, musescore):
+    source, = sources(tmp_path, ["score"])
+    (tmp_path / "score.pdf").write_text("old")
+
+    queue = RenderQueue()
+    with pytest.raises(FileExistsError):
+        queue.add(source, tmp_path / "score.pdf")
+    queue.add(source, tmp_path / "score.pdf", overwrite=True)
+    assert queue.run()[0].ok
@@ -0,0 +1,95 @@
+import os
+import sys
+import inspect
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import RomanCache
+from Scopul.corpus import process_pool
+
+
+def test_hits_and_misses():
+    cache = RomanCache()
+    assert cache.figure([60, 64, 67]) == "I"
+    # Same voicing, an octave higher
+    assert cache.figure([72, 76, 79]) == "I"
+    assert cache.figure([67, 71, 74], key="C major") == "V"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 2
+
+    # Other voicings of the same pitch classes and bass can have other figures
+    assert cache.figure([60, 63, 69, 72, 75]) == "io63b3"
+    assert cache.figure([36, 48, 57, 63]) == "io6"
+
+
+def test_spelled_chords():
+    import music21
+
+    cache = RomanCache()
+    sharp = music21.chord.Chord(["E4", "G#4", "C5"])
+    flat = music21.chord.Chord(["E4", "A-4", "C5"])
+
+    # Same MIDI pitches, spelled differently: keyed apart, computed from the chords themselves
+    assert cache.figure_of_chord(sharp) == music21.roman.romanNumeralFromChord(sharp).figure
+    assert cache.figure_of_chord(flat) == music21.roman.romanNumeralFromChord(flat).figure
+    assert cache.stats()["misses"] == 2
+
+    assert cache.figure_of_chord(music21.chord.Chord(["C5", "G#4", "E4"])) == cache.figure_of_chord(sharp)
+    assert cache.stats()["hits"] == 2
+
+    # Figures depend on the octaves: a compound third above the bass is not written as one
+    close = music21.chord.Chord(["C4", "E-4", "A4", "C5", "E-5"])
+    open_ = music21.chord.Chord(["C2", "C3", "A3", "E-4"])
+    assert cache.figure_of_chord(close) == music21.roman.romanNumeralFromChord(close).figure
+    assert cache.figure_of_chord(open_) == music21.roman.romanNumeralFromChord(open_).figure
+
+
+def test_lru_eviction():
+    cache = RomanCache(max_size=2)
+    cache.figure([60, 64, 67])
+    cache.figure([62, 65, 69])
+    cache.figure([60, 64, 67])
+    cache.figure([64, 67, 71])
+
+    # The least recently used set was dropped
+    assert len(cache) == 2
+    misses = cache.misses
+    cache.figure([60, 64, 67])
+    assert cache.misses == misses
+    cache.figure([62, 65, 69])
+    assert cache.misses == misses + 1
+
+
+def test_warm_start(tmp_path):
+    cache = RomanCache()
+    cache.figure([60, 64, 67])
+    cache.figure([67, 71, 74], key="C major")
+    cache.save(tmp_path / "roman.json")
+
+    warm = RomanCache()
+    assert warm.load(tmp_path / "roman.json") == 2
+    assert warm.figure([67, 71, 74], key="C major") == "V"
+    assert warm.stats()["misses"] == 0
+
+
+def warmed_figure() -> str:
+    from Scopul.RomanCache import ROMAN_CACHE
+
+    return ROMAN_CACHE.figure([60, 64, 67], key="warm")
+
+
+def test_warm_start_pool(tmp_path):
+    # A figure no worker could have computed or inherited
+    cache = RomanCache()
+    cache._store(RomanCache.key([60, 64, 67], key="warm"), "warmed")
+    cache.save(tmp_path / "roman.json")
+
+    # The pools of load_many() and CorpusIndex.build() load the file as every worker starts
+    with process_pool(2, tmp_path / "roman.json") as executor:
+        assert executor.submit(warmed_figure).result() == "warmed"
@@ -11,6 +11,8 @@ sys.path.insert(0, parentdir)
 
 from Scopul import Scopul, Part, Tempo, TimeSignature, Rest, Note, Chord
 from Scopul import InvalidFileFormatError, InvalidMusicElementError
+from Scopul.EventTable import EventTable
+from Scopul.scopul_exception import MeasureNotFoundException
 
 file1 = "testfiles/test1.mid"
 file2 = "testfiles/test2.mid"
@@ -82,6 +84,33 @@ def test_get_rests():
     assert isinstance(rests, list)
 
 
+def test_get_rests_and_chords():
+    assert all(isinstance(rest, Rest) for rest in part.get_rests())
+    assert all(isinstance(chord, Chord) for chord in part.get_chords())
+    assert part.get_rest_count() == len(part.get_rests())
+    assert part.get_chord_count() == len(part.get_chords())
+
+
+def test_event_table_cache():
+    part = Scopul(file1).parts[0]
+    table = part.event_table
+
+    # Repeated queries reuse the same table and wrappers
+    assert part.event_table is table
+    assert part.sequence[0] is part.sequence[0]
+    assert len(table) == len(part.sequence)
+    assert len(part.get_notes()) + len(part.get_rests()) + len(part.get_chords()) == len(table)
+
+    # Editing the part patches the table instead of reading the whole part again
+    count = len(table)
+    part.insert(Note(name="E5", length=1), 2, 0)
+    assert part.event_table is table
+    assert len(table) == count + 1
+
+    part.delete(1)
+    assert part.event_table is not table
+
+
 def test_get_rhythm():
     # Test case 1 - simple rhythm with overlap=False
     part = Scopul("testfiles/test1.mid").parts[0]
@@ -112,6 +141,45 @@ def test_get_rhythm():
     assert new_result == expected
     assert len(result) == 42
 
+
+def test_search_rhythms():
+    rhythms = [[0.75, 0.25, 0.5, 0.75, 0.25, 0.5], [["c", 0.75], ["r", 0.25], ["c", 0.75], ["r", 0.25]]]
+    results = part.search_rhythms(rhythms)
+
+    # One pass gives the same results as searching every rhythm on its own
+    assert [len(result) for result in results] == [len(part.search_rhythm(rhythm)) for rhythm in rhythms]
+
+    # Overlapping occurrences include the non overlapping ones
+    overlapping = part.search_rhythm([0.25, 0.25], overlap=True)
+    assert len(overlapping) >= len(part.search_rhythm([0.25, 0.25]))
+
+
+def test_search_typed_rhythm():
+    part = Scopul(file1).parts[0]
+    sequence = part.sequence
+    lengths = [element.length for element in sequence]
+    types = ["c" if isinstance(element, Chord) else "r" if isinstance(element, Rest) else "n" for element in sequence]
+    rhythm = [0.5, 0.5]
+    typed = [["c", 0.5], ["n", 0.5]]
+
+    # A typed rhythm with many untyped occurrences
+    starts = [idx for idx in range(len(sequence) - 1) if lengths[idx : idx + 2] == rhythm]
+    typed_starts = [idx for idx in starts if types[idx : idx + 2] == ["c", "n"]]
+    assert len(starts) > 10 * len(typed_starts) > 0
+
+    # With overlap, the same as matching (type, length) symbols
+    found = part.search_rhythm(typed, overlap=True)
+    assert [sequence.index(match[0]) for match in found] == typed_starts
+
+    # Without overlap, occurrences are chosen on the rhythm first, then filtered by type
+    chosen = []
+    for idx in starts:
+        if not chosen or idx >= chosen[-1] + len(rhythm):
+            chosen.append(idx)
+    found = part.search_rhythm(typed)
+    assert [sequence.index(match[0]) for match in found] == [idx for idx in chosen if idx in typed_starts]
+
+
 def test_Note_object_creation():
     note = Note(name="C4", length=1.5)
 
@@ -150,7 +218,292 @@ def test_part_insertion():
     scop.parts[0].insert(N1, 7, 4)
     assert len(scop.parts[0].sequence) - previous == 1
 
+
+def test_part_insert_many():
+    part = Scopul(file1).parts[0]
+    previous = len(part.sequence)
+    part.insert_many([(Note(name="C5", length=1.0), 2, 0), (Rest(length=2.0), 4, 1), (Note(name="G4"), 2)])
+    assert len(part.sequence) - previous == 3
+
+    # The patched table matches a table read again from the part
+    table = part.event_table
+    fresh = EventTable.from_music21(part._part)
+    for column, _ in EventTable.COLUMNS:
+        assert list(getattr(table, column)) == list(getattr(fresh, column))
+    assert list(table.starts) == list(fresh.starts)
+
+    with pytest.raises(MeasureNotFoundException):
+        part.insert(Note(name="C5"), 10000)
+
+
+def test_part_insert_overflow():
+    part = Scopul(file1).parts[0]
+    bar = part._part.getElementsByClass("Measure").first().barDuration.quarterLength
+    offsets = [measure.offset for measure in part._part.getElementsByClass("Measure")]
+    onsets = [element.onset for element in part.get_measure(3)]
+
+    # Longer than the remaining space of measure 2: split at the barline and tied into measure 3
+    part.insert(Note(name="C6", length=bar), 2, bar - 1)
+    measures = list(part._part.getElementsByClass("Measure"))
+    assert [measure.offset for measure in measures] == offsets
+    assert [measure.number for measure in measures] == list(range(1, len(measures) + 1))
+    assert [measure.duration.quarterLength for measure in measures] == [bar] * len(measures)
+
+    def tied(measure):
+        return [
+            (element.quarterLength, element.tie.type)
+            for element in measure.notes
+            if element.tie is not None and element.nameWithOctave == "C6"
+        ]
+
+    assert tied(measures[1]) == [(1.0, "start")]
+    assert tied(measures[2]) == [(bar - 1, "stop")]
+    assert sorted(element.onset for element in part.get_measure(3)) == sorted(onsets + [bar * 2])
+
+    # The patched table matches a table read again from the part
+    table = part.event_table
+    fresh = EventTable.from_music21(part._part)
+    for column, _ in EventTable.COLUMNS:
+        assert list(getattr(table, column)) == list(getattr(fresh, column))
+
+    # Past the last measure, measures are added and filled with a rest
+    last = measures[-1].number
+    part.insert(Note(name="C6", length=bar * 2), last, 1)
+    measures = list(part._part.getElementsByClass("Measure"))
+    assert [measure.number for measure in measures][-3:] == [last, last + 1, last + 2]
+    assert [measure.duration.quarterLength for measure in measures] == [bar] * len(measures)
+    assert isinstance(part.get_measure(last + 2)[-1], Rest)
+
+    # A failing batch puts the measures back as they were
+    part = Scopul(file1).parts[0]
+    contents = [len(measure.notesAndRests) for measure in part._part.getElementsByClass("Measure")]
+    with pytest.raises(MeasureNotFoundException):
+        with part.edit() as tx:
+            tx.insert(Note(name="C6", length=bar), 2, bar - 1)
+            tx.insert(Note(name="C6"), 10000)
+    assert [len(measure.notesAndRests) for measure in part._part.getElementsByClass("Measure")] == contents
+
+    part = Scopul(file1).parts[0]
+    with pytest.raises(IndexError):
+        with part.edit() as tx:
+            tx.insert(Note(name="C6", length=bar * 20), part._part.getElementsByClass("Measure").last().number)
+            tx.delete(10**6)
+    assert [len(measure.notesAndRests) for measure in part._part.getElementsByClass("Measure")] == contents
+
+
+def test_part_insert_overflow_barlines():
+    part = Scopul(file2).parts[0]
+
+    # Overflows measure 3 of a 4/4 part by 3 quarters
+    part.insert(Note(name="C5", length=4.0), 3, 3)
+    measures = list(part._part.getElementsByClass("Measure"))
+    assert len(measures) == 11
+    assert [measure.duration.quarterLength for measure in measures] == [4.0] * len(measures)
+    assert [measure.number for measure in measures] == list(range(1, len(measures) + 1))
+
+    # The note is split at the barline and tied
+    def tied(measure):
+        return [
+            (element.offset, element.quarterLength, element.tie.type)
+            for element in measure.notes
+            if element.tie is not None and element.nameWithOctave == "C5"
+        ]
+
+    assert tied(measures[2]) == [(3.0, 1.0, "start")]
+    assert tied(measures[3]) == [(0.0, 3.0, "stop")]
+
+
+def test_insert_time_signature():
+    scop = Scopul(file1)
+    scop.edit().insert_time_signature("2/4", 2)
+    with scop.edit() as tx:
+        tx.insert_time_signature("2/4", 2)
+
+    # Barred again from measure 2 on, the measures of the parts agree with the tempo map
+    for part in scop.parts:
+        measures = list(part._part.getElementsByClass("Measure"))
+        assert [measure.duration.quarterLength for measure in measures] == [3.0] + [2.0] * (len(measures) - 1)
+        assert [measure.number for measure in measures] == list(range(1, len(measures) + 1))
+
+        table = part.event_table
+        for row in range(table.row_count):
+            assert scop.tempo_map.offset_to_measure_beat(table.onset[row])[0] == table.measure[row]
+    assert scop.tempo_map.offset_to_measure_beat(10.0)[0] == 5
+
+    # In the middle of a measure, the measure ends where the time signature starts
+    part = Scopul(file1).parts[0]
+    part.insert(TimeSignature("2/4"), 2, 1)
+    measures = list(part._part.getElementsByClass("Measure"))
+    assert [measure.duration.quarterLength for measure in measures[:4]] == [3.0, 1.0, 2.0, 2.0]
+    assert measures[2].getElementsByClass("TimeSignature").first().ratioString == "2/4"
+
+
+def test_part_meta_edit():
+    # Tempos read by mido are read again after a part edit adds one
+    scop = Scopul(file1, engine="mido")
+    scop.parts[0].insert(Tempo(60), 3, 0)
+    assert (60, 3) in [(tempo.bpm, tempo.measure) for tempo in scop.tempo_list]
+    assert 1000000 in scop.tempo_map.tempos
+
+    scop = Scopul(file1, engine="mido")
+    with scop.parts[1].edit() as tx:
+        tx.insert_time_signature("2/4", 2)
+    assert "2/4" in [time_sig.ratio for time_sig in scop.time_sig_list]
+
+
 def test_part_deletion():
     previous = len(scop.parts[0].sequence)
     scop.parts[0].delete(1)
-    assert len(scop.parts[0].sequence) - previous == -6
\ No newline at end of file
+    assert len(scop.parts[0].sequence) - previous == -6
+
+
+def test_part_delete_measure():
+    # Part.delete() removes a measure of the music21 part, edit().delete() an element of the sequence
+    part = Scopul(file1).parts[0]
+    previous = len(part.sequence)
+    measure = part._part[1]
+    part.delete(1)
+    assert measure not in part._part
+    assert len(part.sequence) == previous - len(measure.notesAndRests)
+
+    deleted = part.sequence[1]
+    with part.edit() as tx:
+        tx.delete(1)
+    assert deleted not in part.sequence
+    assert len(part.sequence) == previous - len(measure.notesAndRests) - 1
+
+
+def test_part_edit():
+    part = Scopul(file1).parts[0]
+    previous = len(part.sequence)
+    deleted = part.sequence[1]
+
+    with part.edit() as tx:
+        tx.insert(Note(name="C5", length=1.0), 3, 0)
+        tx.insert_tempo(90, 5)
+        tx.delete(1)
+    assert len(part.sequence) == previous
+    assert deleted not in part.sequence
+
+    # A failing batch leaves the part untouched
+    lengths = [element.length for element in part.sequence]
+    with pytest.raises(MeasureNotFoundException):
+        with part.edit() as tx:
+            tx.insert(Note(name="C5"), 3, 0)
+            tx.insert(Note(name="C5"), 10000)
+    with pytest.raises(IndexError):
+        with part.edit() as tx:
+            tx.delete(10**6)
+    assert [element.length for element in part.sequence] == lengths
+
+
+def test_score_edit():
+    scop = Scopul(file1)
+    with scop.edit() as tx:
+        tx.part(0).insert(Note(name="C5"), 2, 0)
+        tx.insert_time_signature("3/4", 9)
+    assert "3/4" in [time_sig.ratio for time_sig in scop.time_sig_list]
+
+    # A tempo queued in a part is read again too, on a score whose tempos were read by mido
+    scop = Scopul(file1, engine="mido")
+    assert 90 not in [tempo.bpm for tempo in scop.tempo_list]
+    with scop.edit() as tx:
+        tx.part(1).insert_tempo(90, 5)
+    assert 90 in [tempo.bpm for tempo in scop.tempo_list]
+
+
+def test_iter_measures():
+    part = Scopul(file1).parts[0]
+    measures = list(part.iter_measures())
+
+    assert [number for number, _ in measures] == sorted(number for number, _ in measures)
+    assert sum(len(elements) for _, elements in measures) == len(part.sequence)
+    for number, elements in measures[:5]:
+        assert part.get_measure(number) == elements
+    assert part.get_measure([1, 3]) == measures[0][1] + measures[1][1] + measures[2][1]
+
+
+def test_pitch_stats():
+    part = Scopul(file1).parts[0]
+    stats = part.pitch_stats()
+
+    pitches = []
+    for element in part.sequence:
+        if isinstance(element, Note):
+            pitches.append(element.music21.pitch.midi)
+        elif isinstance(element, Chord):
+            pitches.extend(note.music21.pitch.midi for note in element.notes)
+
+    assert stats.count == len(pitches)
+    assert stats.highest == max(pitches)
+    assert stats.lowest == min(pitches)
+    assert stats.ambitus == max(pitches) - min(pitches)
+    assert sum(stats.pitch_class_histogram) == len(pitches)
+    assert part.get_highest_note().music21.pitch.midi == max(pitches)
+    assert part.get_lowest_note().music21.pitch.midi == min(pitches)
+
+    low, high, mean = stats.measure(1)
+    assert low <= mean <= high
+
+    assert Scopul(file1).pitch_stats().count >= stats.count
+
+
+def test_stats():
+    part = Scopul(file1).parts[0]
+    stats = part.stats()
+
+    assert stats.note_count == len(part.get_notes())
+    assert stats.rest_count == len(part.get_rests())
+    assert stats.chord_count == len(part.get_chords())
+    assert stats.sounding_duration == pytest.approx(
+        sum(element.length for element in part.sequence if not isinstance(element, Rest))
+    )
+    assert sum(stats.density) == part.pitch_stats().count
+
+    # Memoized until the part is edited
+    assert part.stats() is stats
+    part.insert(Note(name="C5", length=1.0), 2, 0)
+    assert part.stats() is not stats
+    assert part.stats().note_count == stats.note_count + 1
+
+    scop = Scopul(file1)
+    assert scop.stats().note_count == sum(part.get_note_count() for part in scop.parts)
+    assert scop.stats() is scop.stats()
+
+
+def test_iter_events():
+    part = Scopul(file1).parts[0]
+    first = next(part.iter_events())
+    assert isinstance(first, Chord)
+    assert first.measure == 1
+
+    assert sum(1 for _ in part.iter_events(kinds=[Rest])) == part.get_rest_count()
+    assert all(isinstance(element, (Note, Chord)) for element in part.iter_events(kinds="nc"))
+    # Streaming does not keep the elements
+    assert all(wrapper is None for wrapper in part._wrappers)
+
+    in_range = list(part.iter_events(start_measure=1, end_measure=2))
+    assert len(in_range) == len(part.get_measure([1, 2]))
+
+    scop = Scopul(file1)
+    merged = list(scop.iter_events())
+    assert len(merged) == sum(len(part.sequence) for part in scop.parts)
+
+
+def test_compact_elements():
+    note = Note(pitch=61, length=0.5, onset=2.0)
+    assert note.name == "C#4"
+    assert note.onset == 2.0
+    assert not hasattr(note, "__dict__")
+    assert Note(name="B-4").pitch == 70
+
+    chord = Chord(pitches=[60, 64], length=2.0, measure=3)
+    assert [note.name for note in chord.notes] == ["C4", "E4"]
+    assert chord.length == 2.0
+    assert isinstance(chord.music21, music21.chord.Chord)
+
+    part = Scopul(file1).parts[0]
+    note = part.sequence[1]
+    assert note.onset == part.event_table.event_onset(1)
+    assert note.pitch == note.music21.pitch.midi
+    assert part.sequence[0].pitches == [nt.pitch.midi for nt in part.sequence[0].music21.notes]
@@ -0,0 +1,61 @@
+import os
+import sys
+import inspect
+import pytest
+
+# Importing from parent Scopul
+currentdir = os.path.dirname(os.path.abspath(inspect.getfile(inspect.currentframe())))
+parentdir = os.path.dirname(currentdir)
+sys.path.insert(0, parentdir)
+
+from Scopul import Scopul, TempoMap
+from mido import MidiFile
+
+file2 = "testfiles/test2.mid"
+
+# 120 bpm then 60 bpm from the second measure, 4/4 then 3/4 from the third measure
+tempo_map = TempoMap(
+    [(0.0, 500000, 1), (4.0, 1000000, 2)],
+    [(0.0, 4, 4, 1), (8.0, 3, 4, 3)],
+    480,
+)
+
+
+def test_seconds():
+    assert tempo_map.offset_to_seconds(4.0) == 2.0
+    assert tempo_map.offset_to_seconds(6.0) == 4.0
+    assert tempo_map.seconds_to_offset(3.0) == 5.0
+    assert tempo_map.ticks_to_seconds(960) == 1.0
+    assert tempo_map.seconds_to_ticks(4.0) == 2880
+
+    offsets = [0.0, 1.5, 4.0, 7.25, 12.0]
+    seconds = tempo_map.offset_to_seconds(offsets)
+    assert list(seconds) == [tempo_map.offset_to_seconds(offset) for offset in offsets]
+    assert list(tempo_map.seconds_to_offset(seconds)) == pytest.approx(offsets)
+
+
+def test_measure_beat():
+    assert tempo_map.offset_to_measure_beat(0.0) == (1, 1.0)
+    assert tempo_map.offset_to_measure_beat(5.0) == (2, 2.0)
+    assert tempo_map.offset_to_measure_beat(11.0) == (4, 1.0)
+    assert tempo_map.measure_beat_to_offset(4, 2.0) == 12.0
+
+    measures, beats = tempo_map.offset_to_measure_beat([0.0, 5.0, 11.0])
+    assert list(measures) == [1, 2, 4]
+    assert list(tempo_map.measure_beat_to_offset(measures, beats)) == [0.0, 5.0, 11.0]
+
+
+def test_score_tempo_map():
+    scop = Scopul(file2, engine="mido")
+    assert scop.tempo_map is scop.tempo_map
+    assert scop.tempo_map.offset_to_seconds(1.0) == pytest.approx(389610 / 1e6)
+
+    length = scop.get_audio_length()
+    assert 0 < length <= MidiFile(file2).length + 1e-6
+
+    starts, ends = scop.note_times(0)
+    assert len(starts) == scop.parts[0].event_table.row_count
+    assert (ends >= starts).all()
+
+    assert scop.seek(0.0) == [0] * len(scop.parts)
+    assert scop.seek(length + 1) == [len(part.sequence) for part in scop.parts]